@@ -101,6 +101,7 @@ CREATE TABLE IF NOT EXISTS bronze.bbref_team_opponent_shooting_stats
     scrape_date date,
     created_at timestamp default current_timestamp,
     modified_at timestamp default current_timestamp,
+    row_hash bigint,
     CONSTRAINT unique_constraint_for_upsert_opp_stats UNIQUE (team)
 );
 
@@ -135,6 +136,7 @@ CREATE TABLE IF NOT EXISTS bronze.bbref_player_shooting_stats
     scrape_ts timestamp without time zone,
     created_at timestamp default current_timestamp,
     modified_at timestamp default current_timestamp,
+    row_hash bigint,
     CONSTRAINT unique_constraint_for_upsert_shooting_stats UNIQUE (player)
 );
 
@@ -216,6 +218,7 @@ CREATE TABLE IF NOT EXISTS bronze.bbref_player_injuries
     scrape_date date,
     created_at timestamp default current_timestamp,
     modified_at timestamp default current_timestamp,
+    row_hash bigint,
     CONSTRAINT unique_constraint_for_upsert_injury_data UNIQUE (player, team, description)
 );
 
@@ -261,6 +264,7 @@ CREATE TABLE IF NOT EXISTS bronze.bbref_league_schedule
     proper_date date,
     created_at timestamp default current_timestamp,
     modified_at timestamp default current_timestamp,
+    row_hash bigint,
     CONSTRAINT unique_constraint_for_upsert_schedule UNIQUE (away_team, home_team, proper_date)
 );
 
@@ -415,6 +419,7 @@ CREATE TABLE if not exists bronze.bbref_player_adv_stats (
 	awards text NULL,
     created_at timestamp default current_timestamp,
     modified_at timestamp default current_timestamp,
+    row_hash bigint,
     CONSTRAINT unique_constraint_for_player_adv_stats UNIQUE (player, team)
 );
 
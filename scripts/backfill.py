@@ -1,25 +1,75 @@
 import logging
 import os
-from datetime import datetime
+from datetime import datetime, timedelta
 
 import click
+import pandas as pd
 from jyablonski_common_modules.logging import create_logger
 from jyablonski_common_modules.sql import create_sql_engine, write_to_sql_upsert
 
+from src.database import write_to_sql_upsert_copy
 from src.feature_flags import FeatureFlagManager
+from src.html_archive import configure_html_archive
 from src.scrapers import get_boxscores_data, get_pbp_data
 
 
 # example usage:
 # `uv run --env-file .env python -m scripts.backfill --run_date 2026-02-22`
+# a whole date range at once:
+# `uv run python -m scripts.backfill --run_date 2026-02-16 --end_date 2026-02-22`
+# re-parse the archived pages instead of scraping them again:
+# `uv run --env-file .env python -m scripts.backfill --run_date 2026-02-22 --replay`
+# w/ the pages as they were archived by the end of a given day:
+# `uv run python -m scripts.backfill --run_date 2026-02-22 --replay --as_of 2026-02-25`
 @click.command()
 @click.option("--run_date", required=True, help="Run date to backfill for")
-def run_backfill(run_date: str) -> None:
+@click.option(
+    "--end_date",
+    default=None,
+    help="Last date to backfill, inclusive. Defaults to just the run date",
+)
+@click.option(
+    "--archive",
+    envvar="HTML_ARCHIVE",
+    default=None,
+    help="Local directory or s3:// prefix of the html archive",
+)
+@click.option(
+    "--replay",
+    is_flag=True,
+    default=False,
+    help="Read pages from the html archive instead of the network",
+)
+@click.option(
+    "--as_of",
+    default=None,
+    help="Replay the pages archived on or before this date. Defaults to the "
+    "day after end_date, when its box scores would have been scraped",
+)
+def run_backfill(
+    run_date: str,
+    end_date: str | None,
+    archive: str | None,
+    replay: bool,
+    as_of: str | None,
+) -> None:
     """Backfill Function
 
     Args:
         run_date (str): Run date to pull Boxscores + PBP data for
 
+        end_date (str, optional): Last date to pull, every date from `run_date`
+            through it is scraped + upserted in 1 batch
+
+        archive (str, optional): Where downloaded pages are archived, see
+            `src.html_archive`
+
+        replay (bool): Re-parse the pages archived in `archive` w/o
+            downloading anything
+
+        as_of (str, optional): Only replay pages archived on or before this
+            date, see `HtmlArchive`
+
     Returns:
         None, but writes upserts data to Postgres
     """
@@ -27,13 +77,33 @@ def run_backfill(run_date: str) -> None:
     logging.getLogger("requests").setLevel(
         logging.WARNING
     )  # get rid of https debug stuff
-    click.echo(f"Running Backfill for {run_date}")
+    end_date = end_date or run_date
+    click.echo(f"Running Backfill for {run_date} to {end_date}")
 
-    # parse the run_date string into a datetime object
+    # parse the date strings into datetime objects
     try:
         parsed_date = datetime.strptime(run_date, "%Y-%m-%d")
+        parsed_end_date = datetime.strptime(end_date, "%Y-%m-%d")
+        parsed_as_of = (
+            datetime.strptime(as_of, "%Y-%m-%d")
+            if as_of
+            else parsed_end_date + timedelta(days=1)
+        )
     except ValueError:
-        raise click.BadParameter("run_date must be in format YYYY-MM-DD")
+        raise click.BadParameter(
+            "run_date, end_date + as_of must be in format YYYY-MM-DD"
+        )
+
+    if parsed_end_date < parsed_date:
+        raise click.BadParameter("end_date can't be before run_date")
+
+    if replay and archive is None:
+        raise click.BadParameter("--replay needs --archive or HTML_ARCHIVE to be set")
+    if as_of and not replay:
+        raise click.BadParameter("--as_of only applies w/ --replay")
+    configure_html_archive(
+        archive, replay=replay, as_of=parsed_as_of.date() if replay else None
+    )
 
     engine = create_sql_engine(
         user=os.environ.get("RDS_USER", default="default"),
@@ -46,8 +116,13 @@ def run_backfill(run_date: str) -> None:
     FeatureFlagManager.load(engine=engine)
     source_schema = "bronze"
 
-    boxscores = get_boxscores_data(
-        run_date=parsed_date,
+    # every date's boxscores go through pbp + the upserts together
+    boxscores = pd.concat(
+        [
+            get_boxscores_data(run_date=parsed_date + timedelta(days=day))
+            for day in range((parsed_end_date - parsed_date).days + 1)
+        ],
+        ignore_index=True,
     )
 
     pbp_data = get_pbp_data(df=boxscores)
@@ -62,7 +137,7 @@ def run_backfill(run_date: str) -> None:
             primary_keys=["player", "date"],
             update_timestamp_field="modified_at",
         )
-        write_to_sql_upsert(
+        write_to_sql_upsert_copy(
             conn=connection,
             table="bbref_player_pbp",
             schema=source_schema,
@@ -79,7 +154,7 @@ def run_backfill(run_date: str) -> None:
             update_timestamp_field="modified_at",
         )
 
-    print(f"Backfill for {run_date} complete")
+    print(f"Backfill for {run_date} to {end_date} complete")
     return
 
 
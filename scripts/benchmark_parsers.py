@@ -0,0 +1,346 @@
+from __future__ import annotations
+
+import json
+import pickle
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import click
+import pandas as pd
+
+from src.scrapers import (
+    _transform_pbp_data,
+    parse_boxscores,
+    parse_injuries,
+    parse_odds,
+    parse_opp_stats,
+    parse_pbp_game,
+    parse_player_adv_stats,
+    parse_player_contracts,
+    parse_player_stats,
+    parse_schedule_month,
+    parse_shooting_stats,
+    parse_team_adv_stats,
+    parse_transactions,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+FIXTURES_DIR = Path(__file__).parent.parent / "tests" / "fixtures"
+BASELINE_PATH = Path(__file__).parent / "parser_benchmark_baseline.json"
+
+# a case only counts as slower once it's over the threshold by this much too,
+# so the few ms cases don't fail on timer noise
+MIN_REGRESSION_MS = 5.0
+MIN_REGRESSION_KIB = 256.0
+
+
+def _read_html_fixture(name: str) -> bytes:
+    return (FIXTURES_DIR / name).read_bytes()
+
+
+def _load_pickled_tables(name: str) -> list[pd.DataFrame]:
+    with (FIXTURES_DIR / name).open("rb") as fp:
+        return pickle.load(fp)
+
+
+def _render_page(
+    tables: list[pd.DataFrame], table_ids: list[str | None] | None = None
+) -> str:
+    """Rebuild an html page from the tables `pd.read_html` once returned for it
+
+    Scrapers w/o a saved html page only have these pickled tables as
+    fixtures. Writing them back out as `<table>`s (multi level headers
+    become bbref style grouped header rows) lets their case run the real
+    `parse_*` function, html parsing included.
+    """
+    ids = table_ids or [None] * len(tables)
+    body = "\n".join(
+        table.to_html(index=False, na_rep="", table_id=table_id)
+        for table, table_id in zip(tables, ids, strict=True)
+    )
+    return f"<html><body>{body}</body></html>"
+
+
+def _render_odds_page(tables: list[pd.DataFrame], sportsbook_column: int) -> str:
+    """Rebuild the covers.com odds page w/ the DraftKings logo in its header."""
+    marker = "__sportsbook__"
+    renamed = []
+    for table in tables:
+        table = table.copy()
+        table.columns = [
+            marker if position == sportsbook_column else column
+            for position, column in enumerate(table.columns)
+        ]
+        renamed.append(table)
+    return _render_page(renamed).replace(marker, '<img alt="DraftKings"/>')
+
+
+def _parse_pbp_night(
+    page: str, home_team: str, away_teams: pd.DataFrame, game_date: datetime
+) -> pd.DataFrame:
+    """Parse 1 pbp page + run the batch level transform `get_pbp_data` uses."""
+    game = parse_pbp_game(page, home_team=home_team, game_date=game_date)
+    return _transform_pbp_data([game], away_teams=away_teams)
+
+
+def build_cases() -> dict[str, Callable[[], pd.DataFrame]]:
+    """Build 1 zero argument benchmark case per scraper from `tests/fixtures`
+
+    Every case runs the scraper's `parse_*` function end to end on an html
+    page, either a saved page or one rebuilt from the pickled `pd.read_html`
+    tables, see `_render_page`.
+
+    Returns:
+        Dict of case name to a function that runs the parser once
+    """
+    stats_html = _read_html_fixture("stats_html.html")
+    boxscores_html = _read_html_fixture("boxscores_html.html")
+    schedule_html = _read_html_fixture("schedule.html")
+    transactions_html = _read_html_fixture("transactions.html")
+    contracts_html = _read_html_fixture("player_contracts.html")
+    shooting_html = _read_html_fixture("shooting_stats.html")
+
+    opp_stats = _load_pickled_tables("opp_stats.pickle")
+    league_season_html = _render_page(
+        [opp_stats[5], opp_stats[10]], ["per_game-opponent", "advanced-team"]
+    )
+    pbp_html = _render_page(_load_pickled_tables("pbp_data.pickle"))
+    odds_html = _render_odds_page(
+        _load_pickled_tables("odds_data.pkl"), sportsbook_column=2
+    )
+    injuries_html = _render_page(_load_pickled_tables("injuries_dump.pickle"))
+    player_adv_stats_html = _render_page(
+        _load_pickled_tables("player_adv_stats.pickle")
+    )
+    away_teams = pd.DataFrame(
+        {
+            "AwayTeam": ["GSW"],
+            "HomeTeam": ["BOS"],
+            "Date": pd.to_datetime(["2022-06-16"]),
+        }
+    )
+
+    return {
+        "player_stats": lambda: parse_player_stats(stats_html),
+        "boxscores": lambda: parse_boxscores(boxscores_html, game_date="2025-06-22"),
+        "schedule": lambda: parse_schedule_month(schedule_html),
+        "transactions": lambda: parse_transactions(transactions_html),
+        "player_contracts": lambda: parse_player_contracts(contracts_html),
+        "pbp": lambda: _parse_pbp_night(
+            pbp_html,
+            home_team="BOS",
+            away_teams=away_teams,
+            game_date=datetime(2022, 6, 16),
+        ),
+        "odds": lambda: parse_odds(odds_html),
+        "injuries": lambda: parse_injuries(injuries_html),
+        "player_adv_stats": lambda: parse_player_adv_stats(player_adv_stats_html),
+        "opp_stats": lambda: parse_opp_stats(league_season_html),
+        "team_adv_stats": lambda: parse_team_adv_stats(league_season_html),
+        "shooting_stats": lambda: parse_shooting_stats(shooting_html),
+    }
+
+
+def measure_case(run: Callable[[], pd.DataFrame], repeat: int) -> dict[str, float]:
+    """Time 1 case + record its peak allocated memory
+
+    Args:
+        run (Callable[[], pd.DataFrame]): The case, see `build_cases`
+
+        repeat (int): Timed runs, the median of which is reported
+
+    Returns:
+        Dict w/ the median wall + CPU ms, peak KiB allocated and rows returned
+    """
+    # warm up imports + caches so they don't land on the 1st timed run
+    rows = len(run())
+
+    wall_times, cpu_times = [], []
+    for _ in range(repeat):
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        run()
+        wall_times.append(time.perf_counter() - wall_start)
+        cpu_times.append(time.process_time() - cpu_start)
+
+    # separate run bc tracemalloc slows down every allocation it tracks
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "wall_ms": round(statistics.median(wall_times) * 1000, 2),
+        "cpu_ms": round(statistics.median(cpu_times) * 1000, 2),
+        "peak_kib": round(peak / 1024, 1),
+        "rows": rows,
+    }
+
+
+def run_cases(repeat: int, only: list[str] | None = None) -> dict[str, Any]:
+    """Run every benchmark case (or just the `only` ones)
+
+    Returns:
+        The results, in the format stored in `BASELINE_PATH`
+    """
+    cases = build_cases()
+    unknown = set(only or []) - set(cases)
+    if unknown:
+        raise click.BadParameter(f"Unknown benchmark cases {sorted(unknown)}")
+
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "cases": {
+            name: measure_case(run, repeat=repeat)
+            for name, run in cases.items()
+            if not only or name in only
+        },
+    }
+
+
+def compare_to_baseline(
+    results: dict[str, Any],
+    baseline: dict[str, Any],
+    threshold: float,
+    memory_threshold: float,
+) -> list[str]:
+    """List every case that got slower or bigger than the baseline allows
+
+    Args:
+        results (dict): Output of `run_cases`
+
+        baseline (dict): A previous `run_cases` output
+
+        threshold (float): Allowed fractional increase in wall + CPU time,
+            ex. 0.5 for 50%
+
+        memory_threshold (float): Allowed fractional increase in peak memory
+
+    Returns:
+        1 message per regression, empty if there are none. Timings from a
+        different Python minor version can't be compared, so that is
+        reported as the only message instead.
+    """
+    recorded_on, running_on = baseline.get("python"), results.get("python")
+    if (
+        recorded_on
+        and running_on
+        and recorded_on.split(".")[:2] != running_on.split(".")[:2]
+    ):
+        return [
+            f"Baseline was recorded on Python {recorded_on} but this is "
+            f"{running_on}, rerun w/ --update-baseline on this interpreter"
+        ]
+
+    regressions = []
+    baseline_cases = baseline["cases"]
+    for name, current in results["cases"].items():
+        previous = baseline_cases.get(name)
+        if previous is None:
+            continue
+
+        limits = [
+            ("wall_ms", threshold, MIN_REGRESSION_MS),
+            ("cpu_ms", threshold, MIN_REGRESSION_MS),
+            ("peak_kib", memory_threshold, MIN_REGRESSION_KIB),
+        ]
+        for metric, allowed, floor in limits:
+            before, after = previous[metric], current[metric]
+            if after > before * (1 + allowed) and after - before > floor:
+                increase = (after / before - 1) * 100
+                regressions.append(
+                    f"{name} {metric} regressed from {before} to {after} "
+                    f"(+{increase:.0f}%, allowed +{allowed * 100:.0f}%)"
+                )
+    return regressions
+
+
+# example usage:
+# `uv run python -m scripts.benchmark_parsers --repeat 10`
+# `uv run python -m scripts.benchmark_parsers --update-baseline`
+@click.command()
+@click.option("--repeat", default=5, help="Timed runs per case")
+@click.option("--case", "only", multiple=True, help="Only run these cases")
+@click.option("--output", type=click.Path(path_type=Path), help="Write results here")
+@click.option(
+    "--baseline",
+    type=click.Path(path_type=Path),
+    default=BASELINE_PATH,
+    help="Baseline results to compare against",
+)
+@click.option("--threshold", default=0.5, help="Allowed slowdown, 0.5 = 50%")
+@click.option("--memory-threshold", default=0.2, help="Allowed peak memory growth")
+@click.option(
+    "--update-baseline", is_flag=True, help="Overwrite the baseline w/ these results"
+)
+def run_benchmark(
+    repeat: int,
+    only: tuple[str, ...],
+    output: Path | None,
+    baseline: Path,
+    threshold: float,
+    memory_threshold: float,
+    update_baseline: bool,
+) -> None:
+    """Benchmark every scraper's parse function on the offline fixtures
+
+    Args:
+        repeat (int): Timed runs per case
+
+        only (tuple[str, ...]): Only run these cases, all of them if empty
+
+        output (Path, optional): Where to write the results JSON
+
+        baseline (Path): Baseline JSON to compare the results against
+
+        threshold (float): Allowed fractional increase in wall + CPU time
+
+        memory_threshold (float): Allowed fractional increase in peak memory
+
+        update_baseline (bool): Write the results to `baseline` instead of
+            comparing against it
+
+    Returns:
+        None, but exits w/ status 1 if any case regressed past the thresholds
+    """
+    results = run_cases(repeat=repeat, only=list(only))
+    for name, case in results["cases"].items():
+        click.echo(
+            f"{name}: {case['wall_ms']} ms wall, {case['cpu_ms']} ms cpu, "
+            f"{case['peak_kib']} KiB peak, {case['rows']} rows"
+        )
+
+    if output is not None:
+        output.write_text(json.dumps(results, indent=2) + "\n")
+
+    if update_baseline:
+        baseline.write_text(json.dumps(results, indent=2) + "\n")
+        click.echo(f"Updated baseline {baseline}")
+        return
+
+    regressions = compare_to_baseline(
+        results,
+        json.loads(baseline.read_text()),
+        threshold=threshold,
+        memory_threshold=memory_threshold,
+    )
+    for regression in regressions:
+        click.echo(regression, err=True)
+    if regressions:
+        sys.exit(1)
+    click.echo(f"No regressions against {baseline}")
+
+
+if __name__ == "__main__":
+    run_benchmark()
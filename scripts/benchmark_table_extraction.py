@@ -0,0 +1,72 @@
+import timeit
+from pathlib import Path
+
+import click
+import pandas as pd
+from bs4 import BeautifulSoup
+
+from src.html_tables import extract_table, find_table_html
+
+FIXTURES_DIR = Path(__file__).parent.parent / "tests" / "fixtures"
+# fixture -> id of the table the scraper reads from it
+FIXTURES = {"stats_html.html": "per_game_stats", "boxscores_html.html": "stats"}
+
+
+def _extract_with_bs4(html: str) -> pd.DataFrame:
+    """The html.parser BeautifulSoup approach the scrapers used before lxml."""
+    soup = BeautifulSoup(html, "html.parser")
+    headers = [th.get_text() for th in soup.find_all("tr", limit=2)[0].find_all("th")]
+    rows = soup.find_all("tr")[1:]
+    player_stats = [[td.get_text() for td in row.find_all("td")] for row in rows]
+    return pd.DataFrame(player_stats, columns=pd.Index(headers[1:]))
+
+
+def _extract_with_lxml(html: str) -> pd.DataFrame:
+    return extract_table(html).to_frame()
+
+
+def _extract_sliced(html: str, table_id: str) -> pd.DataFrame:
+    return extract_table(find_table_html(html, table_id)).to_frame()
+
+
+# example usage:
+# `uv run python -m scripts.benchmark_table_extraction --repeat 20`
+@click.command()
+@click.option("--repeat", default=10, help="Times to parse each fixture")
+def run_benchmark(repeat: int) -> None:
+    """Benchmark `extract_table` against BeautifulSoup on the html fixtures
+
+    The lxml approach is timed both on the whole page + on just the table
+    `find_table_html` slices out of it.
+
+    Args:
+        repeat (int): Times to parse each fixture w/ each approach
+
+    Returns:
+        None, but prints the best time per parse + the speedup per fixture
+    """
+    for fixture, table_id in FIXTURES.items():
+        html = (FIXTURES_DIR / fixture).read_text(encoding="utf-8")
+        expected = _extract_with_bs4(html)
+        pd.testing.assert_frame_equal(expected, _extract_with_lxml(html))
+        pd.testing.assert_frame_equal(expected, _extract_sliced(html, table_id))
+
+        approaches = [
+            ("bs4", _extract_with_bs4),
+            ("lxml", _extract_with_lxml),
+            ("sliced", lambda page, table_id=table_id: _extract_sliced(page, table_id)),
+        ]
+        timings = {
+            name: min(timeit.repeat(lambda f=func: f(html), number=1, repeat=repeat))
+            for name, func in approaches
+        }
+        click.echo(
+            f"{fixture}: bs4 {timings['bs4'] * 1000:.1f} ms, "
+            f"lxml {timings['lxml'] * 1000:.1f} ms, "
+            f"sliced lxml {timings['sliced'] * 1000:.1f} ms, "
+            f"{timings['bs4'] / timings['sliced']:.1f}x faster"
+        )
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -1,12 +1,26 @@
 import logging
 import os
+from datetime import date
 
+import pandas as pd
 from jyablonski_common_modules.logging import create_logger
 from jyablonski_common_modules.sql import create_sql_engine, write_to_sql_upsert
 
-from src.aws import write_to_s3
-from src.database import filter_unchanged_rows, write_to_sql
+from src.aws import write_many_to_s3
+from src.database import (
+    filter_unchanged_rows,
+    filter_unchanged_rows_by_hash,
+    write_to_sql,
+    write_to_sql_upsert_copy,
+)
+from src.extract import ExtractTask, run_extract_stage
 from src.feature_flags import FeatureFlagManager
+from src.html_archive import configure_html_archive, get_run_datetime
+from src.http_cache import configure_validator_cache, is_unchanged
+from src.http_client import get_http_client
+from src.page_cache import page_cache
+from src.parse_pool import configure_parse_pool
+from src.player_names import configure_player_name_cache
 from src.scrapers import (
     get_boxscores_data,
     get_injuries_data,
@@ -50,29 +64,127 @@ if __name__ == "__main__":
         playoff_type=FeatureFlagManager.get("playoffs") or 0,
     )
 
+    # every downloaded page is kept in HTML_ARCHIVE (a local directory or an
+    # s3:// prefix), and w/ HTML_ARCHIVE_REPLAY=true the scrapers re-parse the
+    # archived pages instead of downloading them, see `src.html_archive`.
+    # HTML_ARCHIVE_REPLAY_DATE=YYYY-MM-DD replays the run of that day
+    replay = os.environ.get("HTML_ARCHIVE_REPLAY", "false").lower() == "true"
+    replay_date = os.environ.get("HTML_ARCHIVE_REPLAY_DATE")
+    configure_html_archive(
+        os.environ.get("HTML_ARCHIVE"),
+        replay=replay,
+        as_of=date.fromisoformat(replay_date) if replay_date else None,
+    )
+
+    # season level pages are requested w/ the ETag / Last-Modified from the
+    # last run when HTTP_CACHE_DIR is set, see `src.http_cache`
+    validator_cache = (
+        configure_validator_cache(os.environ.get("HTTP_CACHE_DIR"))
+        if not replay
+        else None
+    )
+
+    # raw -> canonical player names are remembered across runs when
+    # PLAYER_NAME_CACHE is set, see `src.player_names`
+    player_name_cache = configure_player_name_cache(os.environ.get("PLAYER_NAME_CACHE"))
+
     # STEP 1: Extract Raw Data
-    stats = get_player_stats_data()
-    # get_boxscores_data(run_date=datetime(2025, 6, 22))
-    boxscores = get_boxscores_data()
-    injury_data = get_injuries_data()
-    transactions = get_transactions_data()
-    player_adv_stats = get_player_adv_stats_data()
-    player_contracts = get_player_contracts_data()
-    team_adv_stats = get_team_adv_stats_data()
-    odds = get_odds_data()
-    reddit_data = get_reddit_data(sub="nba")
-    opp_stats = get_opp_stats_data()
-
-    schedule = get_schedule_data(month_list=schedule_months_to_pull)
-    shooting_stats = get_shooting_stats_data()
-    reddit_comment_data = get_reddit_comments(urls=reddit_data["reddit_url"])
-    pbp_data = get_pbp_data(df=boxscores)
+    # scrapers run concurrently; reddit comments + pbp wait on their parent
+    # scrapers and get pruned if the parent is disabled or returns nothing
+    extract_tasks = [
+        ExtractTask(name="stats", func=get_player_stats_data),
+        # kwargs={"run_date": datetime(2025, 6, 22)}
+        ExtractTask(name="boxscores", func=get_boxscores_data),
+        ExtractTask(name="injury_data", func=get_injuries_data),
+        ExtractTask(name="transactions", func=get_transactions_data),
+        ExtractTask(name="player_adv_stats", func=get_player_adv_stats_data),
+        ExtractTask(name="player_contracts", func=get_player_contracts_data),
+        ExtractTask(name="team_adv_stats", func=get_team_adv_stats_data),
+        ExtractTask(name="odds", func=get_odds_data),
+        ExtractTask(name="reddit_data", func=get_reddit_data, kwargs={"sub": "nba"}),
+        ExtractTask(name="opp_stats", func=get_opp_stats_data),
+        ExtractTask(
+            name="schedule",
+            func=get_schedule_data,
+            kwargs={"month_list": schedule_months_to_pull},
+        ),
+        ExtractTask(name="shooting_stats", func=get_shooting_stats_data),
+        ExtractTask(
+            name="reddit_comment_data",
+            func=get_reddit_comments,
+            depends_on=("reddit_data",),
+            upstream_kwargs=lambda results: {
+                "urls": results["reddit_data"]["reddit_url"]
+            },
+        ),
+        ExtractTask(
+            name="pbp_data",
+            func=get_pbp_data,
+            depends_on=("boxscores",),
+            upstream_kwargs=lambda results: {"df": results["boxscores"]},
+        ),
+    ]
+    # downloaded pages get parsed in a warm pool of worker processes when
+    # PARSE_MAX_WORKERS is set, instead of in the scraper threads
+    parse_pool = configure_parse_pool(int(os.environ.get("PARSE_MAX_WORKERS", 0)))
+
+    # reddit is read through its API, so there are no archived pages to replay
+    skipped_tasks: list[str] = []
+    if replay:
+        skipped_tasks = [
+            task.name for task in extract_tasks if task.name.startswith("reddit")
+        ]
+        extract_tasks = [
+            task for task in extract_tasks if task.name not in skipped_tasks
+        ]
+        logger.info(f"Replaying archived pages, skipping {skipped_tasks}")
 
+    # pages shared between scrapers (ex. NBA_{SEASON_YEAR}.html) only get
+    # downloaded once per run
+    with page_cache.run_scope():
+        extracted = run_extract_stage(
+            tasks=extract_tasks,
+            max_workers=int(os.environ.get("EXTRACT_MAX_WORKERS", 4)),
+        )
+
+    if parse_pool is not None:
+        parse_pool.close()
+    player_name_cache.save()
+    extracted.update({name: pd.DataFrame() for name in skipped_tasks})
+
+    # pages that came back 304 return last run's DataFrame, which has already
+    # been loaded, so those datasets are skipped in the SQL + S3 writes
+    unchanged_datasets = [name for name, df in extracted.items() if is_unchanged(df)]
+    if unchanged_datasets:
+        logger.info(f"Skipping Load for unchanged datasets {unchanged_datasets}")
+        extracted.update({name: pd.DataFrame() for name in unchanged_datasets})
+    stats = extracted["stats"]
+    boxscores = extracted["boxscores"]
+    injury_data = extracted["injury_data"]
+    transactions = extracted["transactions"]
+    player_adv_stats = extracted["player_adv_stats"]
+    player_contracts = extracted["player_contracts"]
+    team_adv_stats = extracted["team_adv_stats"]
+    odds = extracted["odds"]
+    reddit_data = extracted["reddit_data"]
+    opp_stats = extracted["opp_stats"]
+    schedule = extracted["schedule"]
+    shooting_stats = extracted["shooting_stats"]
+    reddit_comment_data = extracted["reddit_comment_data"]
+    pbp_data = extracted["pbp_data"]
+
+    for host, totals in get_http_client().transfer_summary().items():
+        logger.info(
+            f"Downloaded {totals['wire_bytes']} bytes ({totals['decoded_bytes']} "
+            f"decompressed) from {host} over {totals['requests']} requests"
+        )
     logger.info("Finished Web Scrape")
 
     logger.info("Starting SQL Upserts")
 
     # STEP 2: Write Data to SQL
+    # season level tables only get rows whose `row_hash` changed since the last
+    # run, so quiet days don't rewrite (+ bump `modified_at` on) every row
     with engine.begin() as connection:
         write_to_sql_upsert(
             conn=connection,
@@ -90,7 +202,7 @@ if __name__ == "__main__":
             primary_keys=["team", "date"],
             update_timestamp_field="modified_at",
         )
-        write_to_sql_upsert(
+        write_to_sql_upsert_copy(
             conn=connection,
             table="bbref_player_pbp",
             schema=source_schema,
@@ -106,19 +218,33 @@ if __name__ == "__main__":
             ],
             update_timestamp_field="modified_at",
         )
+        shooting_stats_to_upsert = filter_unchanged_rows_by_hash(
+            conn=connection,
+            schema=source_schema,
+            table="bbref_player_shooting_stats",
+            df=shooting_stats,
+            primary_keys=["player"],
+        )
         write_to_sql_upsert(
             conn=connection,
             table="bbref_player_shooting_stats",
             schema=source_schema,
-            df=shooting_stats,
+            df=shooting_stats_to_upsert,
             primary_keys=["player"],
             update_timestamp_field="modified_at",
         )
+        player_adv_stats_to_upsert = filter_unchanged_rows_by_hash(
+            conn=connection,
+            schema=source_schema,
+            table="bbref_player_adv_stats",
+            df=player_adv_stats,
+            primary_keys=["player", "team"],
+        )
         write_to_sql_upsert(
             conn=connection,
             table="bbref_player_adv_stats",
             schema=source_schema,
-            df=player_adv_stats,
+            df=player_adv_stats_to_upsert,
             primary_keys=["player", "team"],
             update_timestamp_field="modified_at",
         )
@@ -147,7 +273,7 @@ if __name__ == "__main__":
             primary_keys=["reddit_url"],
             update_timestamp_field="modified_at",
         )
-        write_to_sql_upsert(
+        write_to_sql_upsert_copy(
             conn=connection,
             table="reddit_comments",
             schema=source_schema,
@@ -163,20 +289,34 @@ if __name__ == "__main__":
             primary_keys=["date", "transaction"],
             update_timestamp_field="modified_at",
         )
+        injury_data_to_upsert = filter_unchanged_rows_by_hash(
+            conn=connection,
+            schema=source_schema,
+            table="bbref_player_injuries",
+            df=injury_data,
+            primary_keys=["player", "team", "description"],
+        )
         write_to_sql_upsert(
             conn=connection,
             table="bbref_player_injuries",
             schema=source_schema,
-            df=injury_data,
+            df=injury_data_to_upsert,
             primary_keys=["player", "team", "description"],
             update_timestamp_field="modified_at",
         )
 
+        opp_stats_to_upsert = filter_unchanged_rows_by_hash(
+            conn=connection,
+            schema=source_schema,
+            table="bbref_team_opponent_shooting_stats",
+            df=opp_stats,
+            primary_keys=["team"],
+        )
         write_to_sql_upsert(
             conn=connection,
             table="bbref_team_opponent_shooting_stats",
             schema=source_schema,
-            df=opp_stats,
+            df=opp_stats_to_upsert,
             primary_keys=["team"],
             update_timestamp_field="modified_at",
         )
@@ -196,11 +336,18 @@ if __name__ == "__main__":
             table_type="append",
         )
 
+        schedule_to_upsert = filter_unchanged_rows_by_hash(
+            conn=connection,
+            schema=source_schema,
+            table="bbref_league_schedule",
+            df=schedule,
+            primary_keys=["away_team", "home_team", "proper_date"],
+        )
         write_to_sql_upsert(
             conn=connection,
             table="bbref_league_schedule",
             schema=source_schema,
-            df=schedule,
+            df=schedule_to_upsert,
             primary_keys=["away_team", "home_team", "proper_date"],
             update_timestamp_field="modified_at",
         )
@@ -211,23 +358,35 @@ if __name__ == "__main__":
     # STEP 3: Write to S3
     logger.info("Starting Writes to S3")
 
-    write_to_s3(file_name="stats", df=stats)
-    write_to_s3(file_name="boxscores", df=boxscores)
-    write_to_s3(file_name="injury_data", df=injury_data)
-    write_to_s3(file_name="transactions", df=transactions)
-    write_to_s3(file_name="team_adv_stats", df=team_adv_stats)
-    write_to_s3(file_name="odds", df=odds)
-    write_to_s3(file_name="reddit_data", df=reddit_data)
-    write_to_s3(file_name="reddit_comment_data", df=reddit_comment_data)
-    write_to_s3(file_name="pbp_data", df=pbp_data)
-    write_to_s3(file_name="player_adv_stats", df=player_adv_stats)
-    write_to_s3(file_name="player_contracts", df=player_contracts)
-    write_to_s3(file_name="opp_stats", df=opp_stats)
-    write_to_s3(file_name="schedule", df=schedule)
-    write_to_s3(file_name="shooting_stats", df=shooting_stats)
+    write_many_to_s3(
+        datasets={
+            "stats": stats,
+            "boxscores": boxscores,
+            "injury_data": injury_data,
+            "transactions": transactions,
+            "team_adv_stats": team_adv_stats,
+            "odds": odds,
+            "reddit_data": reddit_data,
+            "reddit_comment_data": reddit_comment_data,
+            "pbp_data": pbp_data,
+            "player_adv_stats": player_adv_stats,
+            "player_contracts": player_contracts,
+            "opp_stats": opp_stats,
+            "schedule": schedule,
+            "shooting_stats": shooting_stats,
+        },
+        # a replay writes to the partition of the date it replays, not today's
+        date=get_run_datetime().date(),
+        max_workers=int(os.environ.get("S3_MAX_WORKERS", 4)),
+    )
 
     logger.info("Finished Writes to S3")
 
+    # only now that everything is loaded can the next run treat a 304 as
+    # already loaded + skip it
+    if validator_cache is not None:
+        validator_cache.commit()
+
     # STEP 4: Grab Logs from previous steps & send 1 slack message for any errors
     logs = query_logs()
     write_to_slack(errors=logs)
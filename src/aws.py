@@ -2,17 +2,61 @@ from __future__ import annotations
 
 import logging
 import os
-from datetime import date, datetime
-from typing import TYPE_CHECKING
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
 
 import awswrangler as wr
+import boto3
 
+from src.html_archive import get_run_datetime
 from src.utils import get_leading_zeroes
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from datetime import date
+
     import pandas as pd
 
 
+@dataclass(frozen=True)
+class S3WriteResult:
+    """Summary of a single dataset written by `write_many_to_s3`
+
+    Args:
+        file_name (str): The base name of the file (boxscores, opp_stats)
+
+        path (str): The full S3 path the file was (or would have been) written to
+
+        rows (int): Number of rows in the DataFrame
+
+        bytes (int): Size of the encoded parquet file, 0 if nothing was written
+
+        duration_seconds (float): Time spent encoding + uploading
+
+        skipped (bool): True if the DataFrame was empty so nothing was written
+
+        error (str, optional): The error message if the write failed
+    """
+
+    file_name: str
+    path: str
+    rows: int
+    bytes: int
+    duration_seconds: float
+    skipped: bool = False
+    error: str | None = None
+
+
+def _build_s3_path(file_name: str, date: date, bucket: str) -> str:
+    """Build the `year=/month=` partitioned S3 path for a file."""
+    year_partition = date.year
+    month_partition = get_leading_zeroes(value=date.month)
+    file_name_jn = f"{file_name}-{date}"
+    return f"s3://{bucket}/{file_name}/validated/year={year_partition}/month={month_partition}/{file_name_jn}.parquet"
+
+
 def write_to_s3(
     file_name: str,
     df: pd.DataFrame,
@@ -29,20 +73,18 @@ def write_to_s3(
         bucket (str): The Bucket to write to.  Defaults to `os.environ.get('S3_BUCKET')`
 
         date (datetime.date): Date to partition the data by.
-            Defaults to `datetime.now().date()`
+            Defaults to the run date, see `get_run_datetime`
 
     Returns:
         Writes the Pandas DataFrame to an S3 File.
 
     """
     if date is None:
-        date = datetime.now().date()
+        date = get_run_datetime().date()
     if bucket is None:
         bucket = os.environ.get("S3_BUCKET", "")
 
-    year_partition = date.year
-    month_partition = get_leading_zeroes(value=date.month)
-    file_name_jn = f"{file_name}-{date}"
+    path = _build_s3_path(file_name=file_name, date=date, bucket=bucket)
     try:
         if len(df) == 0:
             logging.info(f"Not storing {file_name} to s3 because it's empty.")
@@ -50,13 +92,135 @@ def write_to_s3(
         else:
             wr.s3.to_parquet(
                 df=df,
-                path=f"s3://{bucket}/{file_name}/validated/year={year_partition}/month={month_partition}/{file_name_jn}.parquet",
+                path=path,
                 index=False,
             )
-            logging.info(
-                f"Storing {len(df)} {file_name} rows to S3 (s3://{bucket}/{file_name}/validated/{year_partition}/{file_name_jn}.parquet)"
-            )
+            logging.info(f"Storing {len(df)} {file_name} rows to S3 ({path})")
             pass
     except Exception as error:
         logging.error(f"S3 Storage Function Failed {file_name}, {error}")
         pass
+
+
+def _record_uploaded_bytes(session: boto3.Session) -> list[int]:
+    """Tally the size of every object body a boto3 session sends to S3
+
+    Counting the PutObject / UploadPart bodies on the way out gives the size
+    of the written file w/o a HEAD request for it after the upload.
+
+    Args:
+        session (boto3.Session): The session the upload will be made with,
+            the hooks have to be registered before its S3 client is created
+
+    Returns:
+        List of body sizes in bytes, filled in as the upload runs
+    """
+    uploaded_bytes: list[int] = []
+
+    def record(params: dict[str, Any], **kwargs: Any) -> None:
+        uploaded_bytes.append(len(params["Body"]))
+
+    for operation in ("PutObject", "UploadPart"):
+        session.events.register(f"provide-client-params.s3.{operation}", record)
+
+    return uploaded_bytes
+
+
+def _upload_dataset(
+    file_name: str,
+    df: pd.DataFrame,
+    date: date,
+    bucket: str,
+) -> S3WriteResult:
+    """Write a DataFrame to S3 as parquet the same way `write_to_s3` does."""
+    start_time = time.perf_counter()
+    path = _build_s3_path(file_name=file_name, date=date, bucket=bucket)
+
+    if len(df) == 0:
+        logging.info(f"Not storing {file_name} to s3 because it's empty.")
+        return S3WriteResult(
+            file_name=file_name,
+            path=path,
+            rows=0,
+            bytes=0,
+            duration_seconds=round(time.perf_counter() - start_time, 2),
+            skipped=True,
+        )
+
+    try:
+        # boto3 sessions aren't thread safe, so every upload gets its own
+        session = boto3.Session()
+        uploaded_bytes = _record_uploaded_bytes(session=session)
+        wr.s3.to_parquet(df=df, path=path, index=False, boto3_session=session)
+        size = sum(uploaded_bytes)
+        logging.info(
+            f"Storing {len(df)} {file_name} rows ({size} bytes) to S3 ({path})"
+        )
+        return S3WriteResult(
+            file_name=file_name,
+            path=path,
+            rows=len(df),
+            bytes=size,
+            duration_seconds=round(time.perf_counter() - start_time, 2),
+        )
+    except Exception as error:
+        logging.error(f"S3 Storage Function Failed {file_name}, {error}")
+        return S3WriteResult(
+            file_name=file_name,
+            path=path,
+            rows=len(df),
+            bytes=0,
+            duration_seconds=round(time.perf_counter() - start_time, 2),
+            error=str(error),
+        )
+
+
+def write_many_to_s3(
+    datasets: Mapping[str, pd.DataFrame],
+    date: date | None = None,
+    bucket: str | None = None,
+    max_workers: int = 4,
+) -> dict[str, S3WriteResult]:
+    """Encode + upload several DataFrames to S3 in parallel as parquet.
+
+    Uses the same `year=/month=` layout as `write_to_s3`, and empty DataFrames
+    are skipped. A failed upload is logged + recorded in its result instead of
+    stopping the other uploads.
+
+    Args:
+        datasets (Mapping[str, pd.DataFrame]): File name (boxscores, opp_stats) to
+            the DataFrame to write under it
+
+        date (datetime.date): Date to partition the data by.
+            Defaults to the run date, see `get_run_datetime`
+
+        bucket (str): The Bucket to write to.  Defaults to `os.environ.get('S3_BUCKET')`
+
+        max_workers (int): Maximum number of uploads to run at once. Defaults to 4.
+
+    Returns:
+        Dict of file name to its `S3WriteResult`, in the same order as `datasets`
+    """
+    if date is None:
+        date = get_run_datetime().date()
+    if bucket is None:
+        bucket = os.environ.get("S3_BUCKET", "")
+
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="s3"
+    ) as executor:
+        futures = {
+            file_name: executor.submit(
+                _upload_dataset, file_name=file_name, df=df, date=date, bucket=bucket
+            )
+            for file_name, df in datasets.items()
+        }
+
+    results = {file_name: future.result() for file_name, future in futures.items()}
+    total_bytes = sum(result.bytes for result in results.values())
+    num_failed = sum(result.error is not None for result in results.values())
+    logging.info(
+        f"Wrote {len(results)} datasets to S3, {total_bytes} total bytes "
+        f"w/ {num_failed} failures"
+    )
+    return results
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING
+
+import requests
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# part of every fast-failed request's error, `query_logs` uses it to drop the
+# per-scraper "Failed" lines that are just fallout from an open circuit
+CIRCUIT_OPEN_MESSAGE = "skipped bc the circuit is open"
+
+# statuses that mean the host is blocking us or is down, a 404 is still a
+# healthy response
+FAILURE_STATUS_CODES = frozenset({403, 429, 500, 502, 503, 504})
+
+
+class CircuitOpenError(requests.RequestException):
+    """Raised instead of sending a request to a host whose circuit is open."""
+
+
+class CircuitBreaker:
+    """Tracks consecutive failures for 1 host + fast-fails it once it's down
+
+    After `failure_threshold` failures in a row the circuit opens, and every
+    request to the host raises `CircuitOpenError` until `cooldown_seconds`
+    have passed. The circuit is then half-open: exactly 1 request is let
+    through as a trial while every other one keeps fast-failing, a success
+    closes the circuit again and a failure re-opens it for another cool-down.
+    A trial that never reports back is given up on after another
+    `cooldown_seconds`. The root cause is logged once each time the circuit
+    opens.
+
+    Args:
+        host (str): The host name, used in the log messages
+
+        failure_threshold (int): Consecutive failures before opening. Defaults to 3.
+
+        cooldown_seconds (float): Seconds to fast-fail for. Defaults to 300.
+
+        clock (Callable[[], float]): Monotonic clock, swapped out in tests
+    """
+
+    def __init__(
+        self,
+        host: str,
+        failure_threshold: int = 3,
+        cooldown_seconds: float = 300,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Start w/ a closed circuit."""
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._consecutive_failures = 0
+        self._opened_at: float | None = None
+        self._trial_started_at: float | None = None
+        self.skipped_requests = 0
+
+    @property
+    def is_open(self) -> bool:
+        """Whether requests to the host are currently being fast-failed."""
+        with self._lock:
+            return self._is_open(self._clock())
+
+    def _is_open(self, now: float) -> bool:
+        return (
+            self._opened_at is not None
+            and now - self._opened_at < self.cooldown_seconds
+        )
+
+    def _can_start_trial(self, now: float) -> bool:
+        return (
+            self._trial_started_at is None
+            or now - self._trial_started_at >= self.cooldown_seconds
+        )
+
+    def before_request(self, url: str) -> bool:
+        """Raise `CircuitOpenError` if `url` shouldn't be requested right now
+
+        Returns:
+            True if the request is the half-open circuit's trial request
+        """
+        with self._lock:
+            now = self._clock()
+            if self._opened_at is None:
+                return False
+
+            if not self._is_open(now) and self._can_start_trial(now):
+                self._trial_started_at = now
+                logging.info(f"Circuit for {self.host} half-open, trying {url}")
+                return True
+
+            self.skipped_requests += 1
+            remaining = self.cooldown_seconds - (now - self._opened_at)
+
+        if remaining > 0:
+            detail = f"retrying the host in {remaining:.0f} seconds"
+        else:
+            detail = "waiting on the trial request"
+        raise CircuitOpenError(
+            f"{url} {CIRCUIT_OPEN_MESSAGE} for {self.host}, {detail}"
+        )
+
+    def record_success(self) -> None:
+        """Reset the failure count, closing the circuit if it was open."""
+        with self._lock:
+            was_open = self._opened_at is not None
+            self._consecutive_failures = 0
+            self._opened_at = None
+            self._trial_started_at = None
+
+        if was_open:
+            logging.info(f"Circuit for {self.host} closed, requests succeeding again")
+
+    def record_failure(self, reason: str) -> None:
+        """Count a failed request, opening the circuit once the threshold is hit."""
+        with self._lock:
+            now = self._clock()
+            self._consecutive_failures += 1
+            # a failed trial re-opens the circuit straight away
+            should_open = self._trial_started_at is not None or (
+                self._consecutive_failures >= self.failure_threshold
+                and not self._is_open(now)
+            )
+            if should_open:
+                self._opened_at = now
+                self._trial_started_at = None
+
+        if should_open:
+            logging.error(
+                f"Requests to {self.host} Failed {self._consecutive_failures} times "
+                f"in a row, skipping the host for {self.cooldown_seconds:.0f} "
+                f"seconds, {reason}"
+            )
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
 import logging
+from contextlib import closing
+from io import StringIO
 from typing import TYPE_CHECKING, Literal
 
-import pandas as pd
+import pandas as pd  # noqa: TC002 - tests patch src.database.pd
+from sqlalchemy import inspect
+
+from src.utils import add_row_hash
 
 if TYPE_CHECKING:
     from sqlalchemy.engine.base import Connection
@@ -55,6 +60,24 @@ def write_to_sql(
         return
 
 
+def _quote_identifier(name: str) -> str:
+    """Double quote a column name, some bbref columns have % or / in them."""
+    escaped = name.replace('"', '""')
+    return f'"{escaped}"'
+
+
+def _copy_dataframe(cursor, table: str, df: pd.DataFrame) -> None:
+    """Stream a DataFrame into an existing table w/ `COPY ... FROM STDIN`."""
+    columns = ", ".join(_quote_identifier(col) for col in df.columns)
+    buffer = StringIO()
+    df.to_csv(buffer, index=False, header=False, na_rep="\\N")
+    buffer.seek(0)
+    cursor.copy_expert(
+        f"COPY {table} ({columns}) FROM STDIN WITH (FORMAT csv, NULL '\\N')",
+        buffer,
+    )
+
+
 def filter_unchanged_rows(
     conn: Connection,
     schema: str,
@@ -63,22 +86,270 @@ def filter_unchanged_rows(
     primary_keys: list[str],
     compare_columns: list[str],
 ) -> pd.DataFrame:
-    """Return only rows that are new or have changed values in compare_columns."""
+    """Return only rows that are new or have changed values in compare_columns.
+
+    Only the incoming keys + compare values are sent to postgres (w/ `COPY` into
+    a temp table), and the new or changed rows are found w/ a server side join
+    on the primary keys. The cost scales w/ the size of `df` rather than the
+    size of the table's history.
+
+    Args:
+        conn (Connection): SQLAlchemy Connection; the temp table is dropped
+            when its transaction commits
+
+        schema (str): Schema of the table
+
+        table (str): The table to compare against
+
+        df (pd.DataFrame): The incoming rows
+
+        primary_keys (list[str]): Columns that identify a row
+
+        compare_columns (list[str]): Columns to check for changes. NULLs
+            compare equal to each other.
+
+    Returns:
+        The rows of `df` that are new or changed, w/ a fresh index
+    """
     if df.empty:
         return df
 
-    select_columns = primary_keys + compare_columns
-    existing = pd.read_sql(
-        f"SELECT {', '.join(select_columns)} FROM {schema}.{table}",
-        con=conn,
+    staging_table = f"staging_changes_{table}"
+    select_columns = ", ".join(
+        _quote_identifier(col) for col in primary_keys + compare_columns
+    )
+    key_matches = [
+        f"existing.{_quote_identifier(col)} = incoming.{_quote_identifier(col)}"
+        for col in primary_keys
+    ]
+    value_matches = [
+        f"existing.{_quote_identifier(col)} IS NOT DISTINCT FROM "
+        f"incoming.{_quote_identifier(col)}"
+        for col in compare_columns
+    ]
+
+    incoming = df[primary_keys + compare_columns].copy()
+    incoming.insert(0, "row_id", range(len(incoming)))
+
+    dbapi_conn = conn.connection
+    with closing(dbapi_conn.cursor()) as cursor:
+        cursor.execute(f"DROP TABLE IF EXISTS {staging_table}")
+        # WITH NO DATA gives the temp table the same column types as the target
+        cursor.execute(
+            f"CREATE TEMP TABLE {staging_table} ON COMMIT DROP AS "
+            f"SELECT NULL::bigint AS row_id, {select_columns} "
+            f"FROM {schema}.{table} WITH NO DATA"
+        )
+        _copy_dataframe(cursor=cursor, table=staging_table, df=incoming)
+        cursor.execute(
+            f"SELECT incoming.row_id FROM {staging_table} AS incoming "
+            "WHERE NOT EXISTS ("
+            f"SELECT 1 FROM {schema}.{table} AS existing "
+            f"WHERE {' AND '.join(key_matches + value_matches)})"
+        )
+        changed_row_ids = sorted(row_id for (row_id,) in cursor.fetchall())
+        cursor.execute(f"DROP TABLE {staging_table}")
+
+    logging.info(f"{len(changed_row_ids)} of {len(df)} {table} rows are new or changed")
+    return df.iloc[changed_row_ids].reset_index(drop=True)
+
+
+def _ensure_hash_column(
+    conn: Connection, schema: str, table: str, hash_column: str
+) -> None:
+    """Add the `bigint` hash column to tables created before row hashing, if missing
+
+    Checked w/ the inspector first so tables that already have the column
+    don't take the `ALTER TABLE` lock on every run.
+    """
+    inspector = inspect(conn)
+    if not inspector.has_table(table, schema=schema):
+        return
+
+    columns = {column["name"] for column in inspector.get_columns(table, schema)}
+    if hash_column in columns:
+        return
+
+    conn.exec_driver_sql(
+        f"ALTER TABLE {schema}.{table} "
+        f"ADD COLUMN IF NOT EXISTS {_quote_identifier(hash_column)} bigint"
     )
-    if existing.empty:
+    logging.info(f"Added a {hash_column} column to {schema}.{table}")
+
+
+def filter_unchanged_rows_by_hash(
+    conn: Connection,
+    schema: str,
+    table: str,
+    df: pd.DataFrame,
+    primary_keys: list[str],
+    hash_column: str = "row_hash",
+) -> pd.DataFrame:
+    """Attach a row content hash and return only rows whose hash changed.
+
+    Lets the load stage skip rewriting rows that haven't changed since the last
+    run, which keeps `modified_at` meaningful and cuts down on dead tuples. The
+    table gets a `bigint` column named `hash_column` added if it doesn't have
+    one yet (existing rows start out NULL, so they're all rewritten once), and
+    it gets filled in by the upsert since the hash is returned w/ the rows.
+
+    Args:
+        conn (Connection): SQLAlchemy Connection
+
+        schema (str): Schema of the table
+
+        table (str): The table to compare against
+
+        df (pd.DataFrame): The incoming rows
+
+        primary_keys (list[str]): Columns that identify a row
+
+        hash_column (str): Column the hash is stored in. Defaults to `row_hash`.
+
+    Returns:
+        The new or changed rows of `df`, w/ the hash column attached
+    """
+    if df.empty:
         return df
 
-    merged = df.merge(existing, on=primary_keys, how="left", suffixes=("", "_existing"))
-    is_new = merged[f"{compare_columns[0]}_existing"].isna()
-    is_changed = pd.Series(False, index=merged.index)
-    for col in compare_columns:
-        is_changed = is_changed | (merged[col] != merged[f"{col}_existing"])
+    _ensure_hash_column(conn=conn, schema=schema, table=table, hash_column=hash_column)
+    hashed = add_row_hash(df=df, primary_keys=primary_keys, hash_column=hash_column)
+    return filter_unchanged_rows(
+        conn=conn,
+        schema=schema,
+        table=table,
+        df=hashed,
+        primary_keys=primary_keys,
+        compare_columns=[hash_column],
+    )
+
+
+def _ensure_upsert_constraint(
+    cursor, schema: str, table: str, primary_keys: list[str]
+) -> None:
+    """Add the unique constraint `ON CONFLICT (primary_keys)` needs, if missing
+
+    Uses the same `unique_constraint_for_upsert_{table}` constraint as
+    common's `write_to_sql_upsert`, but leaves the table alone if it already
+    has a unique index on exactly those columns instead of rebuilding it on
+    every write.
+    """
+    cursor.execute(
+        """
+        SELECT EXISTS (
+            SELECT 1
+            FROM pg_index AS i
+            JOIN pg_class AS c ON c.oid = i.indrelid
+            JOIN pg_namespace AS n ON n.oid = c.relnamespace
+            WHERE n.nspname = %(schema)s
+                AND c.relname = %(table)s
+                AND i.indisunique
+                AND (
+                    SELECT array_agg(a.attname::text ORDER BY a.attname::text)
+                    FROM pg_attribute AS a
+                    WHERE a.attrelid = c.oid AND a.attnum = ANY(i.indkey)
+                ) = %(keys)s::text[]
+        )
+        """,
+        {"schema": schema, "table": table, "keys": sorted(primary_keys)},
+    )
+    if cursor.fetchone()[0]:
+        return
+
+    keys = ", ".join(_quote_identifier(col) for col in primary_keys)
+    cursor.execute(
+        f"ALTER TABLE {schema}.{table} "
+        f"ADD CONSTRAINT unique_constraint_for_upsert_{table} UNIQUE ({keys})"
+    )
+    logging.info(f"Added a unique constraint on ({keys}) to {schema}.{table}")
+
+
+def write_to_sql_upsert_copy(
+    conn: Connection,
+    table: str,
+    schema: str,
+    df: pd.DataFrame,
+    primary_keys: list[str],
+    update_timestamp_field: str | None = None,
+) -> None:
+    """Bulk upsert a DataFrame w/ `COPY` into a staging table + 1 merge statement
+
+    Drop-in replacement for `write_to_sql_upsert` on large tables like
+    `bbref_player_pbp` or `reddit_comments`. The DataFrame is streamed as csv
+    into a temp table shaped like the target, then merged in w/ a single
+    `INSERT ... ON CONFLICT (primary_keys) DO UPDATE`. Duplicate keys in the
+    DataFrame are collapsed to their last row so the merge can't hit the same
+    row twice. Like `write_to_sql_upsert`, a missing table is created from
+    the DataFrame and the unique constraint on `primary_keys` is added if the
+    table doesn't have one yet.
+
+    Args:
+        conn (Connection): SQLAlchemy Connection; the temp table is dropped
+            when its transaction commits
+
+        table (str): The table to upsert into
+
+        schema (str): Schema of the table
+
+        df (pd.DataFrame): The DataFrame to upsert
+
+        primary_keys (list[str]): Columns of the table's unique constraint
+
+        update_timestamp_field (str, optional): Column set to `now()` on rows
+            that get updated (ex. `modified_at`)
+
+    Returns:
+        None, but upserts the DataFrame into `schema.table`
+    """
+    if df.empty:
+        logging.info(f"{table} is empty, not upserting to SQL")
+        return
+
+    if not all(key in df.columns for key in primary_keys):
+        raise ValueError("Not all Primary Key Columns are in the DataFrame")
+
+    staging_table = f"staging_{table}"
+    columns = ", ".join(_quote_identifier(col) for col in df.columns)
+    keys = ", ".join(_quote_identifier(col) for col in primary_keys)
+    update_columns = [
+        f"{_quote_identifier(col)} = EXCLUDED.{_quote_identifier(col)}"
+        for col in df.columns
+        if col not in primary_keys and col != update_timestamp_field
+    ]
+    if update_timestamp_field is not None:
+        update_columns.append(f"{_quote_identifier(update_timestamp_field)} = now()")
 
-    return df.loc[(is_new | is_changed).values].reset_index(drop=True)
+    conflict_action = (
+        f"DO UPDATE SET {', '.join(update_columns)}" if update_columns else "DO NOTHING"
+    )
+
+    if not inspect(conn).has_table(table, schema=schema):
+        df.head(0).to_sql(name=table, con=conn, schema=schema, index=False)
+        logging.info(f"Created new table {schema}.{table}")
+
+    dbapi_conn = conn.connection
+    with closing(dbapi_conn.cursor()) as cursor:
+        _ensure_upsert_constraint(
+            cursor=cursor, schema=schema, table=table, primary_keys=primary_keys
+        )
+        cursor.execute(f"DROP TABLE IF EXISTS {staging_table}")
+        cursor.execute(
+            f"CREATE TEMP TABLE {staging_table} "
+            f"(LIKE {schema}.{table} INCLUDING DEFAULTS) ON COMMIT DROP"
+        )
+        # numbers rows in COPY order, so the last duplicate of a key wins
+        cursor.execute(f"ALTER TABLE {staging_table} ADD COLUMN _row_id bigserial")
+        _copy_dataframe(cursor=cursor, table=staging_table, df=df)
+        cursor.execute(
+            f"INSERT INTO {schema}.{table} ({columns}) "
+            f"SELECT DISTINCT ON ({keys}) {columns} FROM {staging_table} "
+            f"ORDER BY {keys}, _row_id DESC "
+            f"ON CONFLICT ({keys}) {conflict_action}"
+        )
+        upserted_rows = cursor.rowcount
+        cursor.execute(f"DROP TABLE {staging_table}")
+
+    logging.info(
+        f"Upserted {upserted_rows} of {len(df)} {table} rows to {schema}.{table} "
+        "w/ COPY"
+    )
@@ -49,6 +49,9 @@ def check_feature_flag_decorator(*, flag_name: str) -> Callable[[F], F]:
     - If the feature flag is disabled, the function returns an empty DataFrame.
     - If the feature flag is not found, a ValueError is raised.
 
+    The flag name is also stored on the wrapper as `feature_flag` so
+    callers like `src.extract.run_extract_stage` can look it up.
+
     The `*` in the function signature allows for keyword-only arguments, so
     calling it like `(flag_name="boxscores")` is required.
 
@@ -82,6 +85,9 @@ def check_feature_flag_decorator(*, flag_name: str) -> Callable[[F], F]:
                 return pd.DataFrame()
             return func(*args, **kwargs)
 
+        # exposed so the extract stage can prune disabled scrapers + their
+        # downstream tasks without having to call them first
+        wrapper.feature_flag = flag_name  # ty: ignore[unresolved-attribute]
         return cast("F", wrapper)
 
     return decorator
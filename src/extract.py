@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import logging
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import pandas as pd
+
+from src.feature_flags import FeatureFlagManager
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping, Sequence
+    from concurrent.futures import Future
+
+
+@dataclass(frozen=True)
+class ExtractTask:
+    """A single scraper call in the extract stage DAG
+
+    Args:
+        name (str): The key the resulting DataFrame is returned under
+
+        func (Callable[..., pd.DataFrame]): The scraper to run, usually one of
+            the `get_*_data` functions in `src.scrapers`
+
+        kwargs (Mapping[str, Any]): Static keyword arguments passed to `func`
+
+        depends_on (tuple[str, ...]): Names of the tasks that must finish
+            before this one can start
+
+        upstream_kwargs (Callable, optional): Builds extra keyword arguments
+            for `func` from the results of the upstream tasks
+    """
+
+    name: str
+    func: Callable[..., pd.DataFrame]
+    kwargs: Mapping[str, Any] = field(default_factory=dict)
+    depends_on: tuple[str, ...] = ()
+    upstream_kwargs: Callable[[Mapping[str, pd.DataFrame]], dict[str, Any]] | None = (
+        None
+    )
+
+
+def _validate_tasks(tasks: Sequence[ExtractTask]) -> None:
+    """Raise a ValueError for duplicate names, unknown dependencies or cycles."""
+    names = [task.name for task in tasks]
+    duplicates = {name for name in names if names.count(name) > 1}
+    if duplicates:
+        raise ValueError(f"Duplicate extract task names: {sorted(duplicates)}")
+
+    known = set(names)
+    for task in tasks:
+        missing = set(task.depends_on) - known
+        if missing:
+            raise ValueError(
+                f"Extract task '{task.name}' depends on unknown tasks {sorted(missing)}"
+            )
+
+    # Kahn's algorithm, anything left over is part of a cycle
+    remaining = {task.name: set(task.depends_on) for task in tasks}
+    while remaining:
+        ready = [name for name, deps in remaining.items() if not deps]
+        if not ready:
+            raise ValueError(
+                f"Extract tasks contain a dependency cycle: {sorted(remaining)}"
+            )
+        for name in ready:
+            del remaining[name]
+        for deps in remaining.values():
+            deps.difference_update(ready)
+
+
+def _is_disabled(task: ExtractTask) -> bool:
+    """Check the feature flag attached by `check_feature_flag_decorator`.
+
+    Missing flags are left for the decorator to raise on when the task runs.
+    """
+    flag = getattr(task.func, "feature_flag", None)
+    if flag is None:
+        return False
+
+    value = FeatureFlagManager.get(flag=flag)
+    return value is not None and not value
+
+
+def _run_task(task: ExtractTask, upstream: Mapping[str, pd.DataFrame]) -> pd.DataFrame:
+    """Run a single extract task, returning an empty DataFrame on failure."""
+    try:
+        kwargs = dict(task.kwargs)
+        if task.upstream_kwargs is not None:
+            kwargs.update(task.upstream_kwargs(upstream))
+        return task.func(**kwargs)
+    except Exception as error:
+        logging.error(f"Extract Task {task.name} Failed, {error}")
+        return pd.DataFrame()
+
+
+def run_extract_stage(
+    tasks: Sequence[ExtractTask],
+    max_workers: int = 4,
+) -> dict[str, pd.DataFrame]:
+    """Run the extract stage as a DAG on a bounded thread pool
+
+    Tasks start as soon as all of their dependencies have finished. A task
+    is pruned (and returns an empty DataFrame without being called) when its
+    feature flag is disabled, or when any of its upstream tasks were pruned
+    or returned no data.
+
+    Args:
+        tasks (Sequence[ExtractTask]): The tasks to run
+
+        max_workers (int): Maximum number of tasks to run at once. Defaults to 4.
+
+    Returns:
+        Dict of task name to the DataFrame it returned, in the same order as
+            `tasks`
+
+    Raises:
+        ValueError: If the tasks have duplicate names, unknown dependencies
+            or a dependency cycle
+    """
+    _validate_tasks(tasks)
+
+    results: dict[str, pd.DataFrame] = {}
+    pending = {task.name: task for task in tasks}
+    running: dict[Future[pd.DataFrame], str] = {}
+
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="extract"
+    ) as executor:
+        while pending or running:
+            # keep sweeping until nothing else can be scheduled, since pruning
+            # a task can immediately unblock (and prune) its children
+            scheduled = True
+            while scheduled:
+                scheduled = False
+                for name, task in list(pending.items()):
+                    if not all(dep in results for dep in task.depends_on):
+                        continue
+
+                    del pending[name]
+                    scheduled = True
+                    empty_parents = [
+                        dep for dep in task.depends_on if results[dep].empty
+                    ]
+                    if _is_disabled(task):
+                        logging.info(f"Extract Task {name} is disabled, skipping")
+                        results[name] = pd.DataFrame()
+                    elif empty_parents:
+                        logging.info(
+                            f"Extract Task {name} pruned, no upstream data from "
+                            f"{empty_parents}"
+                        )
+                        results[name] = pd.DataFrame()
+                    else:
+                        future = executor.submit(_run_task, task, dict(results))
+                        running[future] = name
+
+            if not running:
+                continue
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                results[running.pop(future)] = future.result()
+
+    logging.info(f"Extract Stage finished {len(results)} tasks")
+    return {task.name: results[task.name] for task in tasks}
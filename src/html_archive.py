@@ -0,0 +1,269 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import logging
+import threading
+from dataclasses import asdict, dataclass
+from datetime import date, datetime
+from io import BytesIO
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import awswrangler as wr
+import boto3
+
+PAGE_SUFFIX = ".html.gz"
+MANIFEST_SUFFIX = ".json"
+
+
+class PageNotArchivedError(LookupError):
+    """Raised in replay mode for a URL the archive has never stored."""
+
+
+@dataclass(frozen=True)
+class ArchivedPage:
+    """Where + when a downloaded page was stored in the `HtmlArchive`
+
+    Args:
+        url (str): The URL that was downloaded
+
+        sha256 (str): Hash of the page body, which is also its file name
+
+        fetched_at (str): ISO timestamp of the download
+
+        path (str): Full path (or s3:// URI) of the compressed body
+
+        bytes (int): Size of the page body
+
+        compressed_bytes (int): Size of the stored, gzipped body
+    """
+
+    url: str
+    sha256: str
+    fetched_at: str
+    path: str
+    bytes: int
+    compressed_bytes: int
+
+
+class HtmlArchive:
+    """Compressed, content addressed store of every page the scrapers download
+
+    Pages are gzipped + named after the sha256 of their body, under a
+    `source={host}/date={YYYY-MM-DD}/` partition for the day they were
+    fetched, so a page that didn't change during the day is only stored once.
+    Next to it a small `{url hash}.json` manifest records which body the URL
+    returned.
+
+    In replay mode nothing gets downloaded, `load` hands back the latest body
+    archived for a URL instead. That lets transform fixes be re-run over past
+    pages (ex. old `dailyleaders.fcgi` or odds pages) that can't be scraped
+    again. W/ `as_of` set only the `date=` partitions on or before that day
+    are read, so a past run can be replayed as it was + not w/ newer pages.
+
+    Args:
+        root (str | Path): A local directory, or an `s3://bucket/prefix`
+
+        replay (bool): Read pages from the archive instead of the network.
+            Defaults to False.
+
+        as_of (date, optional): Replay the pages archived on or before this
+            date. Defaults to None, which replays the latest capture.
+    """
+
+    def __init__(
+        self, root: str | Path, replay: bool = False, as_of: date | None = None
+    ) -> None:
+        """Create the archive, making `root` if it's a local directory."""
+        self.root = str(root).rstrip("/")
+        self.replay = replay
+        self.as_of = as_of
+        self.is_s3 = self.root.startswith("s3://")
+        if not self.is_s3:
+            Path(self.root).mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        # source -> url hash -> manifest path of its latest capture
+        self._latest: dict[str, dict[str, str]] = {}
+
+    @staticmethod
+    def _source(url: str) -> str:
+        return urlsplit(url).hostname or "unknown"
+
+    @staticmethod
+    def _url_key(url: str) -> str:
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()[:32]
+
+    def _partition(self, url: str, fetched_at: datetime) -> str:
+        return f"{self.root}/source={self._source(url)}/date={fetched_at.date()}"
+
+    def _write(self, path: str, data: bytes) -> None:
+        if self.is_s3:
+            # boto3 sessions aren't thread safe, so every call gets its own
+            wr.s3.upload(
+                local_file=BytesIO(data), path=path, boto3_session=boto3.Session()
+            )
+            return
+
+        local_path = Path(path)
+        local_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = local_path.with_name(f"{local_path.name}.tmp")
+        tmp_path.write_bytes(data)
+        tmp_path.replace(local_path)
+
+    def _read(self, path: str) -> bytes:
+        if self.is_s3:
+            buffer = BytesIO()
+            wr.s3.download(path=path, local_file=buffer, boto3_session=boto3.Session())
+            return buffer.getvalue()
+        return Path(path).read_bytes()
+
+    def _exists(self, path: str) -> bool:
+        if self.is_s3:
+            return wr.s3.does_object_exist(path, boto3_session=boto3.Session())
+        return Path(path).exists()
+
+    def _list_manifests(self, source: str) -> list[str]:
+        prefix = f"{self.root}/source={source}/"
+        if self.is_s3:
+            return wr.s3.list_objects(
+                prefix, suffix=MANIFEST_SUFFIX, boto3_session=boto3.Session()
+            )
+        return [str(path) for path in Path(prefix).glob(f"date=*/*{MANIFEST_SUFFIX}")]
+
+    def save(
+        self, url: str, html: str, fetched_at: datetime | None = None
+    ) -> ArchivedPage:
+        """Store a downloaded page
+
+        Args:
+            url (str): The URL that was downloaded
+
+            html (str): The decoded page body
+
+            fetched_at (datetime, optional): When it was downloaded, picks the
+                date partition. Defaults to now.
+
+        Returns:
+            ArchivedPage w/ where the body was stored
+        """
+        if fetched_at is None:
+            fetched_at = datetime.now()
+
+        body = html.encode("utf-8")
+        sha256 = hashlib.sha256(body).hexdigest()
+        partition = self._partition(url, fetched_at)
+        page_path = f"{partition}/{sha256}{PAGE_SUFFIX}"
+
+        # mtime=0 so the same body always compresses to the same bytes
+        compressed = gzip.compress(body, mtime=0)
+        if not self._exists(page_path):
+            self._write(page_path, compressed)
+
+        page = ArchivedPage(
+            url=url,
+            sha256=sha256,
+            fetched_at=fetched_at.isoformat(),
+            path=page_path,
+            bytes=len(body),
+            compressed_bytes=len(compressed),
+        )
+        manifest_path = f"{partition}/{self._url_key(url)}{MANIFEST_SUFFIX}"
+        self._write(manifest_path, json.dumps(asdict(page)).encode("utf-8"))
+        logging.debug(f"Archived {url} to {page_path}")
+        return page
+
+    @staticmethod
+    def _partition_date(path: str) -> date:
+        return date.fromisoformat(Path(path).parent.name.removeprefix("date="))
+
+    def _latest_manifest(self, url: str) -> str | None:
+        source = self._source(url)
+        with self._lock:
+            latest = self._latest.get(source)
+            if latest is None:
+                # listed once per source, the date partitions sort by name
+                latest = {}
+                for path in sorted(self._list_manifests(source)):
+                    if (
+                        self.as_of is not None
+                        and self._partition_date(path) > self.as_of
+                    ):
+                        continue
+                    latest[Path(path).name.removesuffix(MANIFEST_SUFFIX)] = path
+                self._latest[source] = latest
+        return latest.get(self._url_key(url))
+
+    def load(self, url: str) -> str:
+        """Return the most recently archived body for `url`, as of `as_of`
+
+        Raises:
+            PageNotArchivedError: If the URL wasn't archived (on or before
+                `as_of`)
+        """
+        manifest_path = self._latest_manifest(url)
+        if manifest_path is None:
+            as_of = f" on or before {self.as_of}" if self.as_of is not None else ""
+            raise PageNotArchivedError(
+                f"{url} isn't in the html archive {self.root}{as_of}"
+            )
+
+        if self.as_of is not None and self._partition_date(manifest_path) < self.as_of:
+            logging.warning(
+                f"Replaying {url} captured on {self._partition_date(manifest_path)}, "
+                f"the latest capture on or before {self.as_of}"
+            )
+        page = ArchivedPage(**json.loads(self._read(manifest_path)))
+        logging.info(f"Replaying {url} from the archive, fetched at {page.fetched_at}")
+        return gzip.decompress(self._read(page.path)).decode("utf-8")
+
+
+_html_archive: HtmlArchive | None = None
+
+
+def configure_html_archive(
+    root: str | Path | None, replay: bool = False, as_of: date | None = None
+) -> HtmlArchive | None:
+    """Turn the html archive on w/ pages stored in `root`, or off w/ None
+
+    Args:
+        root (str | Path | None): Local directory or `s3://bucket/prefix`
+
+        replay (bool): Read pages from the archive instead of the network.
+            Defaults to False.
+
+        as_of (date, optional): Replay the pages archived on or before this
+            date, which the scrapers also stamp their rows w/. Defaults to
+            None, which replays the latest capture.
+
+    Returns:
+        The active HtmlArchive, or None if archiving is off
+    """
+    global _html_archive
+    if replay and not root:
+        raise ValueError("Replay mode needs an html archive to read from")
+    if as_of is not None and not replay:
+        raise ValueError("An as of date only applies in replay mode")
+
+    _html_archive = HtmlArchive(root, replay=replay, as_of=as_of) if root else None
+    return _html_archive
+
+
+def get_html_archive() -> HtmlArchive | None:
+    """Return the active HtmlArchive, or None if archiving is off."""
+    return _html_archive
+
+
+def get_run_datetime() -> datetime:
+    """Return the time the scrapers date their rows + requests w/
+
+    That's now, unless the html archive is replaying pages as of a past date,
+    in which case it's the current time of day on that date.
+    """
+    now = datetime.now()
+    archive = get_html_archive()
+    if archive is None or not archive.replay or archive.as_of is None:
+        return now
+    return datetime.combine(archive.as_of, now.time())
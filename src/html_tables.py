@@ -0,0 +1,273 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from io import StringIO
+from typing import TYPE_CHECKING
+
+import pandas as pd
+from lxml import etree
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+@dataclass(frozen=True)
+class ExtractedTable:
+    """Header + column arrays pulled out of an html table
+
+    Args:
+        headers (list[str]): Text of the header cells, in page order
+
+        columns (list[list[str | None]]): 1 list of cell text per header,
+            rows that are shorter than the header are padded w/ None
+    """
+
+    headers: list[str]
+    columns: list[list[str | None]]
+
+    def __len__(self) -> int:
+        """Number of body rows."""
+        return len(self.columns[0]) if self.columns else 0
+
+    def to_frame(self, headers: list[str] | None = None) -> pd.DataFrame:
+        """Build a DataFrame w/ 1 object column per header
+
+        Args:
+            headers (list[str], optional): Column names to use instead of
+                `self.headers`, ex. after renaming some of them. Duplicate
+                names are allowed.
+
+        Returns:
+            DataFrame w/ the same layout `pd.DataFrame(rows, columns=headers)`
+                would give
+        """
+        headers = self.headers if headers is None else headers
+        df = pd.DataFrame(dict(enumerate(self.columns)), columns=range(len(headers)))
+        df.columns = pd.Index(headers)
+        return df
+
+
+def _parse_html(html: str) -> etree._Element | None:
+    parser = etree.HTMLParser(encoding="utf-8")
+    return etree.fromstring(html.encode("utf-8"), parser)
+
+
+_TABLE_TAG = re.compile(r"<table\b|</table\s*>", re.IGNORECASE)
+_TABLE_START = re.compile(r"<table\b", re.IGNORECASE)
+
+
+def _is_commented_out(html: str, pos: int) -> bool:
+    return html.rfind("<!--", 0, pos) > html.rfind("-->", 0, pos)
+
+
+def slice_table_html(html: str, table_id: str | None = None) -> str | None:
+    """Cut 1 `<table>...</table>` span out of the raw page text w/o parsing it
+
+    bbref season pages are mostly navigation, ads + commented out tables, so
+    slicing the target table out first means the html parser only has to
+    tokenise a small part of the page. Searching the raw text also finds
+    tables inside `<!-- -->` blocks for free.
+
+    Args:
+        html (str): The page html
+
+        table_id (str, optional): The table's `id` attribute. If None, the
+            first table that isn't commented out is used, which is the one
+            `pd.read_html(url)[0]` would return.
+
+    Returns:
+        The table's html, or None if it couldn't be found
+    """
+    if table_id is None:
+        starts = (m.start() for m in _TABLE_START.finditer(html))
+        start = next((pos for pos in starts if not _is_commented_out(html, pos)), -1)
+    else:
+        pattern = rf"<table\b[^>]*\sid=[\"']?{re.escape(table_id)}[\"'\s/>]"
+        match = re.search(pattern, html, re.IGNORECASE)
+        start = match.start() if match else -1
+
+    if start < 0:
+        return None
+
+    depth = 0
+    for tag in _TABLE_TAG.finditer(html, start):
+        depth += -1 if tag.group().startswith("</") else 1
+        if depth == 0:
+            return html[start : tag.end()]
+    return None
+
+
+def project_table_columns(table_html: str, columns: Sequence[int]) -> str:
+    """Drop every cell except the ones at the given column positions
+
+    Header rows w/ `colspan` cells (bbref's "over_header" groupings) are
+    dropped as well, so `pd.read_html` gives a flat header w/ 1 entry per
+    kept column.
+
+    Args:
+        table_html (str): The html of a single table, see `slice_table_html`
+
+        columns (Sequence[int]): 0-based positions of the cells to keep,
+            matching the leaf columns `pd.read_html` would return
+
+    Returns:
+        The projected table's html
+    """
+    keep = set(columns)
+    root = _parse_html(table_html)
+    table = root.find(".//table") if root is not None else None
+    if table is None:
+        raise ValueError("No table found to project columns from")
+
+    for row in list(table.iter("tr")):
+        cells = [cell for cell in row if cell.tag in ("th", "td")]
+        if any(cell.get("colspan", "1") != "1" for cell in cells):
+            row.getparent().remove(row)
+            continue
+
+        for position, cell in enumerate(cells):
+            if position not in keep:
+                row.remove(cell)
+
+    return etree.tostring(table, encoding="unicode", method="html")
+
+
+def _find_table_in_tree(html: str, table_id: str) -> str | None:
+    """Slower fallback for ids `slice_table_html` can't spot, ex. odd quoting."""
+    root = _parse_html(html)
+    if root is None:
+        return None
+
+    tables = root.xpath("//table[@id=$table_id]", table_id=table_id)
+    if tables:
+        return etree.tostring(tables[0], encoding="unicode", method="html")
+
+    for comment in root.iter(etree.Comment):
+        if comment.text and table_id in comment.text:
+            found = _find_table_in_tree(comment.text, table_id)
+            if found is not None:
+                return found
+    return None
+
+
+def find_table_html(
+    html: str,
+    table_id: str | None = None,
+    columns: Sequence[int] | None = None,
+) -> str:
+    """Return the html of just the `<table>` w/ a given `id`
+
+    basketball-reference ships a lot of its tables inside html comments (they
+    get un-commented by javascript), so those are searched too. The table is
+    sliced out of the raw text first, and the page only gets parsed as a
+    whole if that fails.
+
+    Args:
+        html (str): The page html
+
+        table_id (str, optional): The table's `id` attribute, ex.
+            "per_game-opponent". If None, the first table that isn't
+            commented out is used.
+
+        columns (Sequence[int], optional): Only keep these column positions,
+            see `project_table_columns`
+
+    Returns:
+        The table's outer html, ready for `pd.read_html`
+
+    Raises:
+        ValueError: If the table isn't on the page
+    """
+    table_html = slice_table_html(html, table_id)
+    if table_html is None and table_id is not None:
+        table_html = _find_table_in_tree(html, table_id)
+
+    if table_html is None:
+        raise ValueError(f"Table {table_id or '(first)'} not found on page")
+
+    if columns is not None:
+        table_html = project_table_columns(table_html, columns)
+    return table_html
+
+
+def read_table(
+    html: str,
+    table_id: str | None = None,
+    columns: Sequence[int] | None = None,
+) -> pd.DataFrame:
+    """Run `pd.read_html` on just 1 table of a page
+
+    Args:
+        html (str): The page html
+
+        table_id (str, optional): The table's `id` attribute, see
+            `find_table_html`. If None, the first table on the page is read.
+
+        columns (Sequence[int], optional): Only parse these column positions,
+            see `project_table_columns`
+
+    Returns:
+        The parsed table
+    """
+    table_html = find_table_html(html, table_id, columns=columns)
+    return pd.read_html(StringIO(table_html))[0]
+
+
+def decode_page(page: str | bytes) -> str:
+    """Return a page body as text, decoding it as utf-8 if it's still bytes."""
+    if isinstance(page, bytes):
+        return page.decode("utf-8", errors="replace")
+    return page
+
+
+def _cell_text(cell: etree._Element) -> str:
+    return "".join(cell.itertext())
+
+
+def extract_table(html: str, skip_header_cells: int = 1) -> ExtractedTable:
+    """Extract the stat table from a basketball-reference style page in 1 pass
+
+    Uses lxml's C parser rather than building a BeautifulSoup tree, then walks
+    every `<tr>` on the page once. The first row's `<th>` cells are the
+    header, and every later row's `<td>` cells are a body row, which matches
+    how the scrapers used to read pages w/ `soup.find_all("tr")`.
+
+    Args:
+        html (str): The page html
+
+        skip_header_cells (int): Leading header cells to drop, ex. the "Rk"
+            column whose body cells are `<th>` rather than `<td>`. Defaults to 1.
+
+    Returns:
+        ExtractedTable w/ the header + 1 column array per header cell
+
+    Raises:
+        IndexError: If the page has no `<tr>` at all, ex. a daily leaders page
+            for a date w/o any games
+
+        ValueError: If a body row has more cells than the header
+    """
+    root = _parse_html(html)
+    rows = root.iter("tr") if root is not None else iter(())
+
+    header_row = next(rows, None)
+    if header_row is None:
+        raise IndexError("No table rows found on page")
+
+    headers = [_cell_text(th) for th in header_row.iter("th")][skip_header_cells:]
+    columns: list[list[str | None]] = [[] for _ in headers]
+
+    for row in rows:
+        cells = [_cell_text(td) for td in row.iter("td")]
+        if len(cells) > len(headers):
+            raise ValueError(
+                f"{len(headers)} columns passed, passed data had {len(cells)} columns"
+            )
+
+        for column, value in zip(columns, cells, strict=False):
+            column.append(value)
+        for column in columns[len(cells) :]:
+            column.append(None)
+
+    return ExtractedTable(headers=headers, columns=columns)
@@ -0,0 +1,293 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+from dataclasses import dataclass
+from functools import wraps
+from pathlib import Path
+from typing import TYPE_CHECKING, ParamSpec
+
+import pandas as pd
+
+from src.http_client import get_http_client
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+P = ParamSpec("P")
+
+# set on frames reused from a previous run so the load stage can skip them
+UNCHANGED_ATTR = "unchanged_since_last_run"
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A page body plus the validators the server sent w/ it
+
+    Args:
+        url (str): The URL that was requested
+
+        html (str): The decoded page html, read from disk on a 304
+
+        not_modified (bool): True if the server answered 304 Not Modified
+
+        etag (str, optional): The `ETag` header of the stored response
+
+        last_modified (str, optional): The `Last-Modified` header of the
+            stored response
+    """
+
+    url: str
+    html: str
+    not_modified: bool
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+class ValidatorCache:
+    """On-disk cache of page bodies + their ETag / Last-Modified validators
+
+    Every URL gets 3 files in `cache_dir`, named after a hash of the URL:
+    `.json` w/ the validators, `.html` w/ the body and `.pkl` w/ the
+    DataFrame the scraper parsed out of that body. Responses are memoized
+    in memory for the lifetime of the object, so the `skip_parse_if_unchanged`
+    check and the scraper's own download share a single request.
+
+    New bodies + parsed frames are only held in memory until `commit()` is
+    called once the run's data has been loaded, so a run that fails before
+    then can't leave behind a 304 + stored frame for data that never made it
+    into the database.
+    """
+
+    def __init__(self, cache_dir: str | Path) -> None:
+        """Create the cache, making `cache_dir` if it doesn't exist yet."""
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._responses: dict[str, CachedResponse] = {}
+        # url -> (body, etag, last_modified) of 200 responses not yet on disk
+        self._pending_bodies: dict[str, tuple[bytes, str | None, str | None]] = {}
+        self._pending_frames: dict[str, pd.DataFrame] = {}
+
+    def _path(self, url: str, suffix: str) -> Path:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()[:32]
+        return self.cache_dir / f"{key}{suffix}"
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes) -> None:
+        tmp_path = path.with_name(f"{path.name}.tmp")
+        tmp_path.write_bytes(data)
+        tmp_path.replace(path)
+
+    def _load_validators(self, url: str) -> dict[str, str | None]:
+        meta_path = self._path(url, ".json")
+        if not meta_path.exists() or not self._path(url, ".html").exists():
+            return {}
+
+        try:
+            return json.loads(meta_path.read_text())
+        except (OSError, ValueError) as error:
+            logging.warning(f"Ignoring unreadable validators for {url}, {error}")
+            return {}
+
+    def clear(self) -> None:
+        """Forget the responses memoized in memory, the files on disk are kept."""
+        with self._lock:
+            self._responses.clear()
+
+    def fetch(self, url: str, timeout: int = 15) -> CachedResponse:
+        """Download a page, sending a conditional request if it's been seen before
+
+        Args:
+            url (str): The URL to download
+
+            timeout (int): Seconds to wait on the request. Defaults to 15.
+
+        Returns:
+            CachedResponse w/ the current page body
+        """
+        with self._lock:
+            cached = self._responses.get(url)
+        if cached is not None:
+            return cached
+
+        validators = self._load_validators(url)
+        headers = {}
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+
+        client = get_http_client()
+        resp = client.get(url, headers=headers, timeout=timeout, stream=True)
+        if resp.status_code == 304 and validators:
+            resp.close()
+            logging.info(f"{url} not modified since {validators.get('last_modified')}")
+            response = CachedResponse(
+                url=url,
+                html=self._path(url, ".html").read_text(encoding="utf-8"),
+                not_modified=True,
+                etag=validators.get("etag"),
+                last_modified=validators.get("last_modified"),
+            )
+        else:
+            if not resp.ok:
+                resp.close()
+                resp.raise_for_status()
+            body = client.read_body(resp)
+            etag = resp.headers.get("ETag")
+            last_modified = resp.headers.get("Last-Modified")
+            response = CachedResponse(
+                url=url,
+                html=body.decode("utf-8", errors="replace"),
+                not_modified=False,
+                etag=etag,
+                last_modified=last_modified,
+            )
+            with self._lock:
+                self._pending_bodies[url] = (body, etag, last_modified)
+                # the parsed frame belongs to the old body, so it can't be reused
+                self._pending_frames.pop(url, None)
+
+        with self._lock:
+            self._responses[url] = response
+        return response
+
+    def load_frame(self, url: str) -> pd.DataFrame | None:
+        """Return the DataFrame previously parsed from `url`, if there is one."""
+        frame_path = self._path(url, ".pkl")
+        if not frame_path.exists():
+            return None
+
+        try:
+            frame = pd.read_pickle(frame_path)
+        except Exception as error:
+            logging.warning(f"Ignoring unreadable parsed frame for {url}, {error}")
+            return None
+
+        if not isinstance(frame, pd.DataFrame):
+            logging.warning(f"Ignoring parsed frame for {url}, not a DataFrame")
+            return None
+        return frame
+
+    def save_frame(self, url: str, df: pd.DataFrame) -> None:
+        """Hold the DataFrame parsed from the current body of `url` for `commit`."""
+        with self._lock:
+            self._pending_frames[url] = df
+
+    def commit(self) -> None:
+        """Write the bodies, validators + frames picked up this run to disk
+
+        Call this only after the run's data has been loaded, see the class
+        docstring.
+        """
+        with self._lock:
+            pending_bodies, self._pending_bodies = self._pending_bodies, {}
+            pending_frames, self._pending_frames = self._pending_frames, {}
+
+        for url, (body, etag, last_modified) in pending_bodies.items():
+            self._path(url, ".pkl").unlink(missing_ok=True)
+            if etag or last_modified:
+                self._write_atomic(self._path(url, ".html"), body)
+                self._write_atomic(
+                    self._path(url, ".json"),
+                    json.dumps(
+                        {"url": url, "etag": etag, "last_modified": last_modified}
+                    ).encode("utf-8"),
+                )
+            else:
+                self._path(url, ".json").unlink(missing_ok=True)
+                self._path(url, ".html").unlink(missing_ok=True)
+
+        for url, df in pending_frames.items():
+            tmp_path = self._path(url, ".pkl.tmp")
+            df.to_pickle(tmp_path)
+            tmp_path.replace(self._path(url, ".pkl"))
+
+        if pending_bodies or pending_frames:
+            logging.info(
+                f"Saved {len(pending_bodies)} pages + {len(pending_frames)} "
+                f"parsed frames to {self.cache_dir}"
+            )
+
+
+_validator_cache: ValidatorCache | None = None
+
+
+def configure_validator_cache(cache_dir: str | Path | None) -> ValidatorCache | None:
+    """Turn conditional fetching on w/ a cache in `cache_dir`, or off w/ None
+
+    Args:
+        cache_dir (str | Path | None): Directory to keep validators, bodies
+            and parsed frames in
+
+    Returns:
+        The active ValidatorCache, or None if conditional fetching is off
+    """
+    global _validator_cache
+    _validator_cache = ValidatorCache(cache_dir) if cache_dir else None
+    return _validator_cache
+
+
+def get_validator_cache() -> ValidatorCache | None:
+    """Return the active ValidatorCache, or None if conditional fetching is off."""
+    return _validator_cache
+
+
+def is_unchanged(df: pd.DataFrame) -> bool:
+    """Whether `df` was reused from a previous run bc its page wasn't modified."""
+    return bool(df.attrs.get(UNCHANGED_ATTR, False))
+
+
+def skip_parse_if_unchanged(
+    url: Callable[[], str],
+) -> Callable[[Callable[P, pd.DataFrame]], Callable[P, pd.DataFrame]]:
+    """Decorator for scrapers of season level pages that rarely change
+
+    When a validator cache is configured, the page is requested w/ its stored
+    ETag / Last-Modified first. On a 304 the scraper isn't called at all and
+    the DataFrame it parsed last time is returned w/ `is_unchanged()` set.
+    Otherwise the scraper runs as normal (reading the body that was just
+    downloaded) and its result is stored for next time, once
+    `ValidatorCache.commit()` is called after the load.
+
+    Args:
+        url (Callable[[], str]): Builds the page URL at call time, so things
+            like `SEASON_YEAR` are looked up when the scraper runs
+
+    Returns:
+        Callable[..., pd.DataFrame]: The wrapped scraper
+    """
+
+    def decorator(func: Callable[P, pd.DataFrame]) -> Callable[P, pd.DataFrame]:
+        @wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> pd.DataFrame:
+            cache = get_validator_cache()
+            if cache is None:
+                return func(*args, **kwargs)
+
+            page_url = url()
+            try:
+                response = cache.fetch(page_url)
+            except Exception as error:
+                # leave it to the scraper to retry + handle the failure
+                logging.warning(f"Conditional Fetch Failed for {page_url}, {error}")
+                return func(*args, **kwargs)
+
+            if response.not_modified:
+                previous = cache.load_frame(page_url)
+                if previous is not None:
+                    logging.info(f"Reusing parsed data for unchanged {page_url}")
+                    previous.attrs[UNCHANGED_ATTR] = True
+                    return previous
+
+            df = func(*args, **kwargs)
+            if not df.empty:
+                cache.save_frame(page_url, df)
+            return df
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,328 @@
+from __future__ import annotations
+
+import logging
+import random
+import sys
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+
+from src.circuit_breaker import FAILURE_STATUS_CODES, CircuitBreaker
+from src.rate_limit import DEFAULT_HOST_RATE_LIMITS, TokenBucket, parse_retry_after
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from src.rate_limit import HostRateLimit
+
+# basketball-reference's cloudflare rules block the `python-requests/x.y`
+# user agent but let urllib's default through, so every request keeps using it
+DEFAULT_USER_AGENT = f"Python-urllib/{sys.version_info.major}.{sys.version_info.minor}"
+DEFAULT_TIMEOUT = 15
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+# POSTs (ex. slack webhooks) aren't retried so a message never gets sent twice
+RETRY_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+# gzip + deflate + br, since `brotli` is a dependency, plus zstd when the
+# `zstandard` package is installed. urllib3 only advertises what it can decode
+DEFAULT_ACCEPT_ENCODING = ACCEPT_ENCODING
+BODY_CHUNK_SIZE = 64 * 1024
+# bounds the memory used by `HttpClient.transfers` on long backfills
+MAX_RECORDED_TRANSFERS = 10_000
+
+
+@dataclass(frozen=True)
+class TransferStats:
+    """Bytes moved for a single response body
+
+    Args:
+        url (str): The URL that was requested
+
+        content_encoding (str, optional): The `Content-Encoding` the server
+            used, None if the body was sent uncompressed
+
+        wire_bytes (int): Bytes received over the network, still compressed
+
+        decoded_bytes (int): Bytes after decompression
+    """
+
+    url: str
+    content_encoding: str | None
+    wire_bytes: int
+    decoded_bytes: int
+
+
+class HttpClient:
+    """Shared HTTP client w/ keep-alive connection pools, retries + timeouts
+
+    Wraps a single `requests.Session`, which keeps a pool of open connections
+    per host, so concurrent scrapers hitting the same site reuse connections
+    instead of doing a fresh TLS handshake for every page. Idempotent requests
+    that fail w/ a connection error, a timeout or one of `RETRY_STATUS_CODES`
+    are retried w/ exponential backoff + full jitter, or after however long
+    the server's `Retry-After` header asks for.
+
+    Hosts listed in `host_rate_limits` get a token bucket shared by every
+    thread, so concurrent scrapers can't go over the host's request limit
+    between them. A `Retry-After` from one of those hosts pauses the whole
+    bucket, not just the request that got it.
+
+    Every host also gets a `CircuitBreaker`, so once a host has failed
+    `failure_threshold` times in a row (ex. it's started answering 403 / 429)
+    the rest of the run's requests to it fail fast w/ `CircuitOpenError`
+    instead of each waiting out its own retries + timeouts.
+
+    Bodies are requested compressed (see `DEFAULT_ACCEPT_ENCODING`) and read
+    w/ `read_body`, which decompresses them as the chunks arrive and records
+    the compressed + uncompressed size of each one in `transfers`.
+
+    Args:
+        timeout (float): Default seconds to wait on a request. Defaults to 15.
+
+        max_retries (int): Retries after the first attempt. Defaults to 3.
+
+        backoff_seconds (float): Base of the exponential backoff. Defaults to 0.5.
+
+        max_backoff_seconds (float): Cap on a single backoff. Defaults to 30.
+
+        pool_maxsize (int): Connections kept open per host. Defaults to 10.
+
+        user_agent (str): User-Agent sent on every request unless overridden.
+            Defaults to `DEFAULT_USER_AGENT`.
+
+        host_rate_limits (Mapping[str, HostRateLimit], optional): Rate limit
+            per host name, hosts not listed are unlimited. Defaults to
+            `DEFAULT_HOST_RATE_LIMITS`.
+
+        failure_threshold (int): Consecutive failures before a host's circuit
+            opens. Defaults to 3.
+
+        cooldown_seconds (float): Seconds an open circuit fast-fails for.
+            Defaults to 300.
+    """
+
+    def __init__(
+        self,
+        timeout: float = DEFAULT_TIMEOUT,
+        max_retries: int = 3,
+        backoff_seconds: float = 0.5,
+        max_backoff_seconds: float = 30,
+        pool_maxsize: int = 10,
+        user_agent: str = DEFAULT_USER_AGENT,
+        host_rate_limits: Mapping[str, HostRateLimit] | None = None,
+        failure_threshold: int = 3,
+        cooldown_seconds: float = 300,
+    ) -> None:
+        """Create the session + mount a pooled adapter for http and https."""
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = user_agent
+        self.session.headers["Accept-Encoding"] = DEFAULT_ACCEPT_ENCODING
+        self.transfers: deque[TransferStats] = deque(maxlen=MAX_RECORDED_TRANSFERS)
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=pool_maxsize)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        if host_rate_limits is None:
+            host_rate_limits = DEFAULT_HOST_RATE_LIMITS
+        self.rate_limiters = {
+            host: TokenBucket(rate_limit)
+            for host, rate_limit in host_rate_limits.items()
+        }
+        self._circuit_breakers: dict[str, CircuitBreaker] = {}
+        self._circuit_breakers_lock = threading.Lock()
+
+    def circuit_breaker(self, host: str) -> CircuitBreaker:
+        """Return the circuit breaker for `host`, creating it on first use."""
+        with self._circuit_breakers_lock:
+            breaker = self._circuit_breakers.get(host)
+            if breaker is None:
+                breaker = CircuitBreaker(
+                    host=host,
+                    failure_threshold=self.failure_threshold,
+                    cooldown_seconds=self.cooldown_seconds,
+                )
+                self._circuit_breakers[host] = breaker
+            return breaker
+
+    def _backoff(self, attempt: int) -> float:
+        """Seconds to sleep before retry number `attempt`, w/ full jitter."""
+        ceiling = min(self.max_backoff_seconds, self.backoff_seconds * 2**attempt)
+        return random.uniform(0, ceiling)
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Send a request, retrying transient failures on idempotent methods
+
+        Args:
+            method (str): The HTTP method, ex. "GET"
+
+            url (str): The URL to request
+
+            **kwargs: Passed through to `requests.Session.request`, `timeout`
+                defaults to the client's timeout
+
+        Returns:
+            The final `requests.Response`, which may still be an error status
+
+        Raises:
+            CircuitOpenError: If the host's circuit is open
+
+            requests.RequestException: If the last attempt failed to connect
+                or timed out
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        retries = self.max_retries if method.upper() in RETRY_METHODS else 0
+        host = urlsplit(url).hostname or ""
+        rate_limiter = self.rate_limiters.get(host)
+        breaker = self.circuit_breaker(host)
+
+        for attempt in range(retries + 1):
+            is_trial = breaker.before_request(url)
+            if rate_limiter is not None:
+                waited = rate_limiter.acquire()
+                if waited > 1:
+                    logging.debug(f"Rate limited {url} for {waited:.2f} seconds")
+                    # the circuit may have opened while this request was queued
+                    if not is_trial:
+                        breaker.before_request(url)
+
+            retry_after = None
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as error:
+                breaker.record_failure(f"{method} {url}, {error}")
+                if attempt == retries:
+                    raise
+                reason = str(error)
+            else:
+                if response.status_code in FAILURE_STATUS_CODES:
+                    breaker.record_failure(
+                        f"{method} {url} returned status code {response.status_code}"
+                    )
+                else:
+                    breaker.record_success()
+
+                if response.status_code not in RETRY_STATUS_CODES or attempt == retries:
+                    return response
+                reason = f"status code {response.status_code}"
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                response.close()
+
+            if retry_after is not None and rate_limiter is not None:
+                # the bucket makes this + every other thread wait it out
+                rate_limiter.pause(retry_after)
+                sleep_seconds = 0.0
+            elif retry_after is not None:
+                sleep_seconds = retry_after
+            else:
+                sleep_seconds = self._backoff(attempt)
+            logging.warning(
+                f"{method} {url} failed w/ {reason}, retrying in "
+                f"{sleep_seconds:.2f} seconds ({attempt + 1}/{retries})"
+            )
+            time.sleep(sleep_seconds)
+
+        raise AssertionError("unreachable")
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        """Send a GET request, see `request`."""
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        """Send a POST request, see `request`."""
+        return self.request("POST", url, **kwargs)
+
+    def read_body(self, response: requests.Response) -> bytes:
+        """Read a streamed response body, decompressing it chunk by chunk
+
+        The compressed + uncompressed sizes are added to `transfers`.
+
+        Args:
+            response (requests.Response): A response requested w/ `stream=True`
+
+        Returns:
+            The uncompressed body
+        """
+        with response:
+            body = b"".join(response.iter_content(chunk_size=BODY_CHUNK_SIZE))
+            # bytes pulled off the socket, before urllib3 decompressed them
+            wire_bytes = response.raw.tell()
+
+        stats = TransferStats(
+            url=response.url,
+            content_encoding=response.headers.get("Content-Encoding"),
+            wire_bytes=wire_bytes,
+            decoded_bytes=len(body),
+        )
+        self.transfers.append(stats)
+        logging.debug(
+            f"Downloaded {stats.url}, {stats.wire_bytes} bytes over the wire "
+            f"({stats.content_encoding or 'uncompressed'}), "
+            f"{stats.decoded_bytes} bytes decoded"
+        )
+        return body
+
+    def transfer_summary(self) -> dict[str, dict[str, int]]:
+        """Total requests, wire bytes + decoded bytes per host in `transfers`."""
+        summary: dict[str, dict[str, int]] = {}
+        for stats in list(self.transfers):
+            host = urlsplit(stats.url).hostname or ""
+            totals = summary.setdefault(
+                host, {"requests": 0, "wire_bytes": 0, "decoded_bytes": 0}
+            )
+            totals["requests"] += 1
+            totals["wire_bytes"] += stats.wire_bytes
+            totals["decoded_bytes"] += stats.decoded_bytes
+        return summary
+
+    def get_text(self, url: str, **kwargs: Any) -> str:
+        """GET a page and return its body decoded as utf-8
+
+        Raises:
+            requests.HTTPError: If the final response has an error status
+        """
+        response = self.get(url, stream=True, **kwargs)
+        if not response.ok:
+            response.close()
+            response.raise_for_status()
+
+        return self.read_body(response).decode("utf-8", errors="replace")
+
+    def close(self) -> None:
+        """Close every pooled connection."""
+        self.session.close()
+
+
+_http_client: HttpClient | None = None
+_http_client_lock = threading.Lock()
+
+
+def configure_http_client(**kwargs: Any) -> HttpClient:
+    """Replace the shared client w/ one built from `kwargs`, see `HttpClient`."""
+    global _http_client
+    with _http_client_lock:
+        if _http_client is not None:
+            _http_client.close()
+        _http_client = HttpClient(**kwargs)
+        return _http_client
+
+
+def get_http_client() -> HttpClient:
+    """Return the shared client, creating it w/ the defaults on first use."""
+    global _http_client
+    with _http_client_lock:
+        if _http_client is None:
+            _http_client = HttpClient()
+        return _http_client
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import logging
+import threading
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any
+
+from src.html_archive import get_html_archive
+from src.http_cache import get_validator_cache
+from src.http_client import get_http_client
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator, Hashable
+
+
+class PageCache:
+    """Run-scoped cache for downloaded pages, keyed by URL
+
+    Only active inside `run_scope()`, so tests and one-off scraper calls
+    always hit the loader directly. While active, concurrent requests for the
+    same key are collapsed into a single load (single-flight) and every caller
+    gets the same result. Failed loads are handed to anyone already waiting on
+    them but are not cached, so a later call will try again.
+    """
+
+    def __init__(self) -> None:
+        """Start w/ an empty, disabled cache."""
+        self._lock = threading.Lock()
+        self._entries: dict[Hashable, Future[Any]] = {}
+        self._enabled = False
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache is currently storing results."""
+        return self._enabled
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        with self._lock:
+            self._entries.clear()
+
+    @contextmanager
+    def run_scope(self) -> Generator[PageCache]:
+        """Enable the cache for the duration of a run, then clear it."""
+        self.clear()
+        self._enabled = True
+        try:
+            yield self
+        finally:
+            self._enabled = False
+            self.clear()
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """Return the cached value for `key`, calling `loader` at most once.
+
+        Args:
+            key (Hashable): Cache key, ex. `("html", url)` in `fetch_html`
+
+            loader (Callable): Zero-argument function that produces the value
+
+        Returns:
+            The value produced by `loader`, either now or by an earlier caller
+        """
+        if not self._enabled:
+            return loader()
+
+        with self._lock:
+            future = self._entries.get(key)
+            is_owner = future is None
+            if future is None:
+                future = Future()
+                self._entries[key] = future
+
+        if not is_owner:
+            logging.debug(f"Page Cache hit for {key}")
+            return future.result()
+
+        try:
+            result = loader()
+        except BaseException as error:
+            with self._lock:
+                self._entries.pop(key, None)
+            future.set_exception(error)
+            raise
+
+        future.set_result(result)
+        return result
+
+
+page_cache = PageCache()
+
+
+def fetch_html(url: str, timeout: int = 15) -> str:
+    """Download a page w/ the shared HTTP client, shared via `page_cache`
+
+    If a validator cache is configured the request is made conditional, see
+    `src.http_cache`. If an html archive is configured every downloaded page
+    is stored in it, or in replay mode read back from it w/o any request, see
+    `src.html_archive`.
+
+    Args:
+        url (str): The URL to download
+
+        timeout (int): Seconds to wait on the request. Defaults to 15.
+
+    Returns:
+        The decoded page html
+    """
+
+    def _download() -> str:
+        validator_cache = get_validator_cache()
+        if validator_cache is not None:
+            return validator_cache.fetch(url, timeout=timeout).html
+
+        return get_http_client().get_text(url, timeout=timeout)
+
+    def _load() -> str:
+        archive = get_html_archive()
+        if archive is not None and archive.replay:
+            return archive.load(url)
+
+        html = _download()
+        if archive is not None:
+            try:
+                archive.save(url, html)
+            except Exception as error:
+                logging.warning(f"Html Archive Failed for {url}, {error}")
+        return html
+
+    return page_cache.get_or_load(("html", url), _load)
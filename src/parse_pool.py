@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import importlib
+import logging
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+import pyarrow as pa
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    import pandas as pd
+
+# imported once when a worker starts instead of on its first parse
+WARM_MODULES = ("src.scrapers",)
+
+
+def _warm_worker() -> None:
+    """Import the parsers up front so every worker is ready before its 1st page."""
+    for module in WARM_MODULES:
+        importlib.import_module(module)
+
+
+def _noop() -> None:
+    """Submitted once per worker by `ParsePool.start` to spin them all up."""
+
+
+def _frame_to_arrow(df: pd.DataFrame) -> bytes:
+    """Serialize a DataFrame as an Arrow IPC stream of typed column buffers."""
+    table = pa.Table.from_pandas(df)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def _frame_from_arrow(payload: bytes) -> pd.DataFrame:
+    """Rebuild the DataFrame a worker serialized w/ `_frame_to_arrow`."""
+    with pa.ipc.open_stream(payload) as reader:
+        return reader.read_all().to_pandas()
+
+
+def _parse_in_worker(
+    parser: Callable[..., pd.DataFrame],
+    page: str | bytes,
+    kwargs: dict[str, Any],
+) -> bytes | pd.DataFrame:
+    """Run `parser` in a worker process + hand its result back as Arrow
+
+    Frames Arrow can't hold (ex. duplicate column names, or an object column
+    mixing ints + strings) are sent back pickled instead.
+    """
+    df = parser(page, **kwargs)
+    try:
+        return _frame_to_arrow(df)
+    except pa.ArrowException, ValueError, TypeError:
+        return df
+
+
+class ParsePool:
+    """Warm pool of worker processes for the CPU bound `parse_*` functions
+
+    The HTML parsers (BeautifulSoup, html5lib, lxml + pandas) hold the GIL,
+    so scraper threads only overlap their downloads. Handing each page to a
+    worker process lets the parses run in parallel too. Results come back as
+    Arrow IPC buffers rather than pickled object dtype DataFrames, which are
+    smaller to send + quicker to rebuild. The workers are started once and
+    shared by every scraper for the rest of the run.
+
+    Args:
+        max_workers (int): Number of worker processes
+    """
+
+    def __init__(self, max_workers: int) -> None:
+        """Create the pool, the workers are only started by `start`."""
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        self._executor: ProcessPoolExecutor | None = None
+
+    def start(self) -> ProcessPoolExecutor:
+        """Start every worker + import the parsers in them, if not done yet."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers, initializer=_warm_worker
+                )
+                # the executor only forks a worker when a task is waiting for it
+                for _ in range(self.max_workers):
+                    self._executor.submit(_noop)
+                logging.info(f"Started Parse Pool w/ {self.max_workers} workers")
+            return self._executor
+
+    def run(
+        self, parser: Callable[..., pd.DataFrame], page: str | bytes, **kwargs: Any
+    ) -> pd.DataFrame:
+        """Run `parser(page, **kwargs)` in a worker process
+
+        Args:
+            parser (Callable[..., pd.DataFrame]): A module level `parse_*`
+                function, so it can be pickled
+
+            page (str | bytes): The downloaded page
+
+            **kwargs: Extra arguments for `parser`
+
+        Returns:
+            The parsed DataFrame
+        """
+        future = self.start().submit(_parse_in_worker, parser, page, kwargs)
+        result = future.result()
+        if isinstance(result, bytes):
+            return _frame_from_arrow(result)
+        return result
+
+    def close(self) -> None:
+        """Stop the workers, a later `run` starts a fresh set."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+_parse_pool: ParsePool | None = None
+_parse_pool_lock = threading.Lock()
+
+
+def configure_parse_pool(max_workers: int | None) -> ParsePool | None:
+    """Turn the process pool on w/ `max_workers` workers, or off w/ None / 0
+
+    Args:
+        max_workers (int | None): Number of worker processes
+
+    Returns:
+        The active ParsePool, or None if pages are parsed in the calling thread
+    """
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is not None:
+            _parse_pool.close()
+        _parse_pool = ParsePool(max_workers) if max_workers else None
+        return _parse_pool
+
+
+def get_parse_pool() -> ParsePool | None:
+    """Return the active ParsePool, or None if the process pool is off."""
+    return _parse_pool
+
+
+def run_parser(
+    parser: Callable[..., pd.DataFrame], page: str | bytes, **kwargs: Any
+) -> pd.DataFrame:
+    """Parse a downloaded page, in the process pool if one is configured
+
+    Args:
+        parser (Callable[..., pd.DataFrame]): A module level `parse_*` function
+
+        page (str | bytes): The downloaded page
+
+        **kwargs: Extra arguments for `parser`
+
+    Returns:
+        The parsed DataFrame
+    """
+    parse_pool = get_parse_pool()
+    if parse_pool is None:
+        return parser(page, **kwargs)
+    return parse_pool.run(parser, page, **kwargs)
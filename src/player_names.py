@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from pathlib import Path
+
+import pandas as pd
+
+# " III" has to come before " II", or else Robert Williams III -> Robert WilliamsI
+NAME_SUFFIXES = r" (?:Jr\.|Sr\.|III|II|IV)"
+
+
+def _to_ascii(names: pd.Series) -> pd.Series:
+    """Strip accents, ex. Nikola Jokić -> Nikola Jokic."""
+    return (
+        names.str.normalize("NFKD")
+        .str.encode("ascii", errors="ignore")
+        .str.decode("utf-8")
+    )
+
+
+class PlayerNameCache:
+    """Memo of raw player names -> their ascii (+ suffix free) canonical names
+
+    The same few hundred names show up on every page + every day, so each
+    distinct raw name is only normalized once. A batch of names is reduced to
+    its unique values, the ones not seen before are normalized together w/
+    vectorized string methods, and the whole batch is then mapped through the
+    memo.
+
+    Args:
+        path (str | Path, optional): JSON file the memo is loaded from + saved
+            to, so it carries over between runs. Defaults to None, which keeps
+            it in memory only.
+    """
+
+    def __init__(self, path: str | Path | None = None) -> None:
+        """Create the cache, loading `path` if it already exists."""
+        self.path = Path(path) if path is not None else None
+        self._lock = threading.Lock()
+        # strip_suffixes -> raw name -> canonical name
+        self._names: dict[bool, dict[str, str]] = {True: {}, False: {}}
+        self._is_dirty = False
+        if self.path is not None and self.path.exists():
+            self.load()
+
+    def __len__(self) -> int:
+        """Number of memoized raw names."""
+        return sum(len(names) for names in self._names.values())
+
+    def normalize(self, names: pd.Series, strip_suffixes: bool = True) -> pd.Series:
+        """Return the canonical version of every name in `names`
+
+        Args:
+            names (pd.Series): Raw player names, missing values are kept as is
+
+            strip_suffixes (bool): Also drop Jr. / Sr. / II / III / IV.
+                Defaults to True.
+
+        Returns:
+            Series of canonical names w/ the same index as `names`
+        """
+        with self._lock:
+            memo = self._names[strip_suffixes]
+            unique_names = names.dropna().unique()
+            missing = pd.Series(
+                [name for name in unique_names if name not in memo], dtype="object"
+            )
+            if len(missing) > 0:
+                canonical = _to_ascii(missing)
+                if strip_suffixes:
+                    canonical = canonical.str.replace(NAME_SUFFIXES, "", regex=True)
+                memo.update(zip(missing, canonical, strict=True))
+                self._is_dirty = True
+
+            return names.map(memo).where(names.notna(), names)
+
+    def load(self) -> None:
+        """Add the names saved in `path` to the memo."""
+        if self.path is None:
+            return
+
+        try:
+            saved = json.loads(self.path.read_text())
+        except (OSError, ValueError) as error:
+            logging.warning(f"Ignoring unreadable player name cache, {error}")
+            return
+
+        with self._lock:
+            self._names[True].update(saved.get("stripped", {}))
+            self._names[False].update(saved.get("ascii", {}))
+        logging.info(f"Loaded {len(self)} player names from {self.path}")
+
+    def save(self) -> None:
+        """Write the memo to `path`, if there is one + it picked up new names."""
+        if self.path is None or not self._is_dirty:
+            return
+
+        with self._lock:
+            data = json.dumps(
+                {"stripped": self._names[True], "ascii": self._names[False]},
+                ensure_ascii=False,
+                sort_keys=True,
+            )
+            self._is_dirty = False
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f"{self.path.name}.tmp")
+        tmp_path.write_text(data, encoding="utf-8")
+        tmp_path.replace(self.path)
+        logging.info(f"Saved {len(self)} player names to {self.path}")
+
+
+_player_name_cache = PlayerNameCache()
+
+
+def configure_player_name_cache(path: str | Path | None) -> PlayerNameCache:
+    """Persist the player name memo to `path`, or keep it in memory w/ None
+
+    Args:
+        path (str | Path | None): JSON file to load the memo from + save it to
+
+    Returns:
+        The active PlayerNameCache
+    """
+    global _player_name_cache
+    _player_name_cache = PlayerNameCache(path)
+    return _player_name_cache
+
+
+def get_player_name_cache() -> PlayerNameCache:
+    """Return the active PlayerNameCache."""
+    return _player_name_cache
+
+
+def normalize_player_names(names: pd.Series, strip_suffixes: bool = True) -> pd.Series:
+    """Strip accents (+ by default name suffixes) from a column of player names
+
+    Args:
+        names (pd.Series): Raw player names
+
+        strip_suffixes (bool): Also drop Jr. / Sr. / II / III / IV.
+            Defaults to True.
+
+    Returns:
+        Series of canonical names, see `PlayerNameCache.normalize`
+    """
+    return get_player_name_cache().normalize(names, strip_suffixes=strip_suffixes)
@@ -1,26 +1,33 @@
 from __future__ import annotations
 
-import hashlib
 import logging
 import os
 import re
-import urllib.request
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from io import StringIO
 from typing import TYPE_CHECKING
-from urllib.error import HTTPError, URLError
 
 import numpy as np
 import pandas as pd
 import praw
+import requests
 from bs4 import BeautifulSoup, Tag
 
 from src.decorators import check_feature_flag_decorator, record_function_time_decorator
+from src.html_archive import get_run_datetime
+from src.html_tables import decode_page, extract_table, find_table_html, read_table
+from src.http_cache import skip_parse_if_unchanged
+from src.page_cache import fetch_html
+from src.parse_pool import run_parser
+from src.player_names import normalize_player_names
 from src.utils import (
     SEASON_YEAR,
     add_sentiment_analysis,
+    build_md5_key,
     check_schedule,
-    clean_player_names,
     filter_spread,
     get_leading_zeroes,
 )
@@ -28,11 +35,52 @@ from src.utils import (
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
+PLAYER_CONTRACTS_URL = "https://www.basketball-reference.com/contracts/players.html"
+INJURIES_URL = "https://www.basketball-reference.com/friv/injuries.fcgi"
+ODDS_URL = "https://www.covers.com/sport/basketball/nba/odds"
+
+
+def _league_season_url() -> str:
+    """Build the URL of the `NBA_{SEASON_YEAR}.html` league season page."""
+    return f"https://www.basketball-reference.com/leagues/NBA_{SEASON_YEAR}.html"
+
+
+def _season_page_url(page: str) -> str:
+    """Build the URL of a `NBA_{SEASON_YEAR}_{page}.html` season level page."""
+    return f"https://www.basketball-reference.com/leagues/NBA_{SEASON_YEAR}_{page}.html"
+
+
+def parse_player_stats(
+    html: str | bytes, scraped_at: datetime | None = None
+) -> pd.DataFrame:
+    """Parse aggregate season stats out of the per game stats page
+
+    Args:
+        html (str | bytes): The `NBA_{SEASON_YEAR}_per_game.html` page
+
+        scraped_at (datetime, optional): When the page was scraped, stamped on
+            the rows. Defaults to now.
+
+    Returns:
+        DataFrame of Player Aggregate Season stats
+    """
+    # stats = stats.rename(columns={"fg%": "fg_pct", "3p%": "3p_pct",
+    # "2p%": "2p_pct", "efg%": "efg_pct", "ft%": "ft_pct"})
+    table_html = find_table_html(decode_page(html), "per_game_stats")
+    stats = extract_table(table_html).to_frame()
+    stats["PTS"] = pd.to_numeric(stats["PTS"])
+    stats = stats.query("Player == Player").reset_index()
+    stats["Player"] = normalize_player_names(stats["Player"], strip_suffixes=False)
+    stats.columns = stats.columns.str.lower()
+    stats["scrape_date"] = (scraped_at or datetime.now()).date()
+    return stats.drop(columns=["index", "awards"], axis=1)
+
 
 @check_feature_flag_decorator(flag_name="stats")
 @record_function_time_decorator
+@skip_parse_if_unchanged(url=lambda: _season_page_url("per_game"))
 def get_player_stats_data() -> pd.DataFrame:
-    """Web Scrape function w/ BS4 that grabs aggregate season stats
+    """Web Scrape function w/ lxml that grabs aggregate season stats
 
     Args:
         None
@@ -40,35 +88,12 @@ def get_player_stats_data() -> pd.DataFrame:
     Returns:
         DataFrame of Player Aggregate Season stats
     """
-    # stats = stats.rename(columns={"fg%": "fg_pct", "3p%": "3p_pct",
-    # "2p%": "2p_pct", "efg%": "efg_pct", "ft%": "ft_pct"})
     try:
-        url = f"https://www.basketball-reference.com/leagues/NBA_{SEASON_YEAR}_per_game.html"
-
-        # Use urllib like pandas does to avoid blocks
-        req = urllib.request.Request(url)
-        with urllib.request.urlopen(req, timeout=15) as resp:
-            html = resp.read().decode("utf-8", errors="replace")
-
-        soup = BeautifulSoup(html, "html.parser")
-        headers = [th.getText() for th in soup.findAll("tr", limit=2)[0].findAll("th")]
-        headers = headers[1:]
-        rows = soup.findAll("tr")[1:]
-        player_stats = [
-            [td.getText() for td in rows[i].findAll("td")] for i in range(len(rows))
-        ]
-        stats = pd.DataFrame(player_stats, columns=pd.Index(headers))
-        stats["PTS"] = pd.to_numeric(stats["PTS"])
-        stats = stats.query("Player == Player").reset_index()
-        stats["Player"] = (
-            stats["Player"]
-            .str.normalize("NFKD")
-            .str.encode("ascii", errors="ignore")
-            .str.decode("utf-8")
+        stats = run_parser(
+            parse_player_stats,
+            fetch_html(_season_page_url("per_game")),
+            scraped_at=get_run_datetime(),
         )
-        stats.columns = stats.columns.str.lower()
-        stats["scrape_date"] = datetime.now().date()
-        stats = stats.drop(columns=["index", "awards"], axis=1)
         logging.info(
             "General Stats Transformation Function Successful, "
             f"retrieving {len(stats)} updated rows"
@@ -79,6 +104,91 @@ def get_player_stats_data() -> pd.DataFrame:
         return pd.DataFrame()
 
 
+def parse_boxscores(
+    html: str | bytes, game_date: str, scraped_at: datetime | None = None
+) -> pd.DataFrame:
+    """Parse player box scores out of a daily leaders page
+
+    Args:
+        html (str | bytes): The `dailyleaders.fcgi` page for `game_date`
+
+        game_date (str): The date the games were played, ex. "2025-06-22"
+
+        scraped_at (datetime, optional): When the page was scraped, stamped on
+            the rows. Defaults to now.
+
+    Returns:
+        DataFrame of Player box score stats
+
+    Raises:
+        IndexError: If the page has no table bc no games were played
+    """
+    table = extract_table(decode_page(html))
+    headers = list(table.headers)
+
+    # Create header mapping for cleaner renaming
+    header_renames = {
+        1: "Team",
+        2: "Location",
+        3: "Opponent",
+        4: "Outcome",
+        6: "FGM",
+        8: "FGPercent",
+        9: "threePFGMade",
+        10: "threePAttempted",
+        11: "threePointPercent",
+        14: "FTPercent",
+        15: "OREB",
+        16: "DREB",
+        24: "PlusMinus",
+    }
+    for idx, name in header_renames.items():
+        headers[idx] = name
+
+    df = table.to_frame(headers)
+
+    # Convert numeric columns
+    numeric_cols = [
+        "FGM",
+        "FGA",
+        "FGPercent",
+        "threePFGMade",
+        "threePAttempted",
+        "threePointPercent",
+        "OREB",
+        "DREB",
+        "TRB",
+        "AST",
+        "STL",
+        "BLK",
+        "TOV",
+        "PF",
+        "PTS",
+        "PlusMinus",
+        "GmSc",
+    ]
+    df[numeric_cols] = df[numeric_cols].apply(pd.to_numeric)
+
+    # Set date
+    df["date"] = pd.to_datetime(game_date)
+
+    # Location mapping
+    df["Location"] = df["Location"].apply(lambda x: "A" if x == "@" else "H")
+
+    # Team name replacements
+    team_replacements = {"PHO": "PHX", "CHO": "CHA", "BRK": "BKN"}
+    for col in ["Team", "Opponent"]:
+        df[col] = df[col].replace(team_replacements)
+
+    # Filter and clean player names
+    df = df.query("Player == Player").reset_index(drop=True)
+    df["Player"] = normalize_player_names(df["Player"], strip_suffixes=False)
+
+    df["scrape_date"] = (scraped_at or datetime.now()).date()
+    df.columns = df.columns.str.lower()
+    return df
+
+
 @check_feature_flag_decorator(flag_name="boxscores")
 @record_function_time_decorator
 def get_boxscores_data(
@@ -100,7 +210,7 @@ def get_boxscores_data(
     """
     # Default to yesterday if no date provided
     if run_date is None:
-        run_date = datetime.now() - timedelta(1)
+        run_date = get_run_datetime() - timedelta(1)
 
     # Format date components
     day_str = get_leading_zeroes(value=run_date.day)
@@ -111,89 +221,13 @@ def get_boxscores_data(
     url = f"https://www.basketball-reference.com/friv/dailyleaders.fcgi?month={month_str}&day={day_str}&year={year}&type=all"
 
     try:
-        # html = requests.get(url).content
-        # use urllib instead of requests to avoid cloudflare block
-        req = urllib.request.Request(url)
-        with urllib.request.urlopen(req, timeout=15) as resp:
-            html = resp.read().decode("utf-8", errors="replace")
-
-        soup = BeautifulSoup(html, "html.parser")
-
-        # Get headers and rename them (use find_all and get_text)
-        headers = [
-            th.get_text() for th in soup.find_all("tr", limit=2)[0].find_all("th")
-        ]
-        headers = headers[1:]
-
-        # Create header mapping for cleaner renaming
-        header_renames = {
-            1: "Team",
-            2: "Location",
-            3: "Opponent",
-            4: "Outcome",
-            6: "FGM",
-            8: "FGPercent",
-            9: "threePFGMade",
-            10: "threePAttempted",
-            11: "threePointPercent",
-            14: "FTPercent",
-            15: "OREB",
-            16: "DREB",
-            24: "PlusMinus",
-        }
-        for idx, name in header_renames.items():
-            headers[idx] = name
-
-        rows = soup.find_all("tr")[1:]
-        player_stats = [[td.get_text() for td in row.find_all("td")] for row in rows]
-
-        df = pd.DataFrame(player_stats, columns=pd.Index(headers))
-
-        # Convert numeric columns
-        numeric_cols = [
-            "FGM",
-            "FGA",
-            "FGPercent",
-            "threePFGMade",
-            "threePAttempted",
-            "threePointPercent",
-            "OREB",
-            "DREB",
-            "TRB",
-            "AST",
-            "STL",
-            "BLK",
-            "TOV",
-            "PF",
-            "PTS",
-            "PlusMinus",
-            "GmSc",
-        ]
-        df[numeric_cols] = df[numeric_cols].apply(pd.to_numeric)
-
-        # Set date
-        df["date"] = pd.to_datetime(date)
-
-        # Location mapping
-        df["Location"] = df["Location"].apply(lambda x: "A" if x == "@" else "H")
-
-        # Team name replacements
-        team_replacements = {"PHO": "PHX", "CHO": "CHA", "BRK": "BKN"}
-        for col in ["Team", "Opponent"]:
-            df[col] = df[col].replace(team_replacements)
-
-        # Filter and clean player names
-        df = df.query("Player == Player").reset_index(drop=True)
-        df["Player"] = (
-            df["Player"]
-            .str.normalize("NFKD")
-            .str.encode("ascii", errors="ignore")
-            .str.decode("utf-8")
+        # raises an IndexError if there's no table bc no games were played
+        df = run_parser(
+            parse_boxscores,
+            fetch_html(url),
+            game_date=date,
+            scraped_at=get_run_datetime(),
         )
-
-        df["scrape_date"] = datetime.now().date()
-        df.columns = df.columns.str.lower()
-
         logging.info(
             "Box Score Transformation Function Successful, "
             f"retrieving {len(df)} rows for {date}"
@@ -219,6 +253,37 @@ def get_boxscores_data(
         return pd.DataFrame()
 
 
+def parse_opp_stats(
+    html: str | bytes, scraped_at: datetime | None = None
+) -> pd.DataFrame:
+    """Parse the team opponent stats table out of the league season page
+
+    Args:
+        html (str | bytes): The `NBA_{SEASON_YEAR}.html` page
+
+        scraped_at (datetime, optional): When the page was scraped, stamped on
+            the rows. Defaults to now.
+
+    Returns:
+        Pandas DataFrame of all current team opponent stats
+    """
+    df = read_table(decode_page(html), table_id="per_game-opponent")
+    df = df[["Team", "FG%", "3P%", "3P", "PTS"]]
+    df = df.rename(
+        columns={
+            df.columns[0]: "team",
+            df.columns[1]: "fg_percent_opp",
+            df.columns[2]: "threep_percent_opp",
+            df.columns[3]: "threep_made_opp",
+            df.columns[4]: "ppg_opp",
+        }
+    )
+    df = df.query('team != "League Average"')
+    df = df.reset_index(drop=True)
+    df["scrape_date"] = (scraped_at or datetime.now()).date()
+    return df
+
+
 @check_feature_flag_decorator(flag_name="opp_stats")
 @record_function_time_decorator
 def get_opp_stats_data() -> pd.DataFrame:
@@ -230,26 +295,15 @@ def get_opp_stats_data() -> pd.DataFrame:
     Returns:
         Pandas DataFrame of all current team opponent stats
     """
-    year = (datetime.now() - timedelta(1)).year
-    month = (datetime.now() - timedelta(1)).month
-    day = (datetime.now() - timedelta(1)).day
+    yesterday = get_run_datetime() - timedelta(1)
+    year, month, day = yesterday.year, yesterday.month, yesterday.day
 
     try:
-        url = f"https://www.basketball-reference.com/leagues/NBA_{SEASON_YEAR}.html"
-        df = pd.read_html(url)[5]
-        df = df[["Team", "FG%", "3P%", "3P", "PTS"]]
-        df = df.rename(
-            columns={
-                df.columns[0]: "team",
-                df.columns[1]: "fg_percent_opp",
-                df.columns[2]: "threep_percent_opp",
-                df.columns[3]: "threep_made_opp",
-                df.columns[4]: "ppg_opp",
-            }
+        df = run_parser(
+            parse_opp_stats,
+            fetch_html(_league_season_url()),
+            scraped_at=get_run_datetime(),
         )
-        df = df.query('team != "League Average"')
-        df = df.reset_index(drop=True)
-        df["scrape_date"] = datetime.now().date()
         logging.info(
             "Opp Stats Transformation Function Successful, "
             f"retrieving {len(df)} rows for {year}-{month}-{day}"
@@ -260,6 +314,28 @@ def get_opp_stats_data() -> pd.DataFrame:
         return pd.DataFrame()
 
 
+def parse_injuries(
+    html: str | bytes, scraped_at: datetime | None = None
+) -> pd.DataFrame:
+    """Parse every current injury out of the injuries page
+
+    Args:
+        html (str | bytes): The `injuries.fcgi` page
+
+        scraped_at (datetime, optional): When the page was scraped, stamped on
+            the rows. Defaults to now.
+
+    Returns:
+        Pandas DataFrame of all current player injuries & their associated team
+    """
+    df = pd.read_html(StringIO(decode_page(html)))[0]
+    df = df.rename(columns={"Update": "Date"})
+    df.columns = df.columns.str.lower()
+    df["scrape_date"] = (scraped_at or datetime.now()).date()
+    df["player"] = normalize_player_names(df["player"])
+    return df.drop_duplicates()
+
+
 @check_feature_flag_decorator(flag_name="injuries")
 @record_function_time_decorator
 def get_injuries_data() -> pd.DataFrame:
@@ -272,19 +348,9 @@ def get_injuries_data() -> pd.DataFrame:
         Pandas DataFrame of all current player injuries & their associated team
     """
     try:
-        url = "https://www.basketball-reference.com/friv/injuries.fcgi"
-        df = pd.read_html(url)[0]
-        df = df.rename(columns={"Update": "Date"})
-        df.columns = df.columns.str.lower()
-        df["scrape_date"] = datetime.now().date()
-        df["player"] = (
-            df["player"]
-            .str.normalize("NFKD")  # this is removing all accented characters
-            .str.encode("ascii", errors="ignore")
-            .str.decode("utf-8")
+        df = run_parser(
+            parse_injuries, fetch_html(INJURIES_URL), scraped_at=get_run_datetime()
         )
-        df["player"] = df["player"].apply(clean_player_names)
-        df = df.drop_duplicates()
         logging.info(
             f"Injury Transformation Function Successful, retrieving {len(df)} rows"
         )
@@ -294,8 +360,25 @@ def get_injuries_data() -> pd.DataFrame:
         return pd.DataFrame()
 
 
+def parse_player_adv_stats(html: str | bytes) -> pd.DataFrame:
+    """Parse every player's advanced stats out of the advanced stats page
+
+    Args:
+        html (str | bytes): The `NBA_{SEASON_YEAR}_advanced.html` page
+
+    Returns:
+        Pandas DataFrame of all player adv stats
+    """
+    df = read_table(decode_page(html), table_id=None)
+    df = df.rename(columns={"Update": "Date"})
+    df.columns = df.columns.str.lower()
+    df["player"] = normalize_player_names(df["player"])
+    return df.drop_duplicates()
+
+
 @check_feature_flag_decorator(flag_name="player_adv_stats")
 @record_function_time_decorator
+@skip_parse_if_unchanged(url=lambda: _season_page_url("advanced"))
 def get_player_adv_stats_data() -> pd.DataFrame:
     """Web Scrape function w/ pandas read_html that grabs all player adv stats
 
@@ -306,18 +389,9 @@ def get_player_adv_stats_data() -> pd.DataFrame:
         Pandas DataFrame of all player adv stats
     """
     try:
-        url = f"https://www.basketball-reference.com/leagues/NBA_{SEASON_YEAR}_advanced.html"
-        df = pd.read_html(url)[0]
-        df = df.rename(columns={"Update": "Date"})
-        df.columns = df.columns.str.lower()
-        df["player"] = (
-            df["player"]
-            .str.normalize("NFKD")  # this is removing all accented characters
-            .str.encode("ascii", errors="ignore")
-            .str.decode("utf-8")
+        df = run_parser(
+            parse_player_adv_stats, fetch_html(_season_page_url("advanced"))
         )
-        df["player"] = df["player"].apply(clean_player_names)
-        df = df.drop_duplicates()
         logging.info(
             f"Player Advanced Stats Function Successful, retrieving {len(df)} rows"
         )
@@ -327,6 +401,65 @@ def get_player_adv_stats_data() -> pd.DataFrame:
         return pd.DataFrame()
 
 
+def parse_transactions(
+    html: str | bytes, scraped_at: datetime | None = None
+) -> pd.DataFrame:
+    """Parse every trade, signing, waiver etc. out of the transactions page
+
+    Args:
+        html (str | bytes): The `NBA_{SEASON_YEAR}_transactions.html` page
+
+        scraped_at (datetime, optional): When the page was scraped, stamped on
+            the rows. Defaults to now.
+
+    Returns:
+        Pandas DataFrame of all season transactions, trades, player waives etc.
+
+    Raises:
+        ValueError: If the page has no transactions list
+    """
+    soup = BeautifulSoup(decode_page(html), "html.parser")
+
+    # Find the ul with class="page_index"
+    page_index = soup.find("ul", {"class": "page_index"})
+
+    if not isinstance(page_index, Tag):
+        raise ValueError("Could not find transactions list")
+
+    trs = page_index.find_all("li")
+
+    rows = []
+    mylist = []
+    for tr in trs:
+        date = tr.find("span")
+        # needed bc span can be null (multi <p> elements per span)
+        if date is not None:
+            date = date.text
+        data = tr.findAll("p")
+        for p in data:
+            mylist.append(p.text)
+        data3 = [date] + [mylist]
+        rows.append(data3)
+        mylist = []
+
+    transactions = pd.DataFrame(rows)
+    transactions.columns = ["Date", "Transaction"]
+    transactions = transactions.query(
+        'Date == Date & Date != ""'
+    ).reset_index()  # filters out nulls and empty values
+    transactions = transactions.explode("Transaction")
+    transactions["Date"] = transactions["Date"].str.replace(
+        "\\?",
+        "October 1, 2024",
+        regex=True,  # bad data 10-14-21
+    )
+    transactions["Date"] = pd.to_datetime(transactions["Date"])
+    transactions.columns = transactions.columns.str.lower()
+    transactions = transactions[["date", "transaction"]]
+    transactions["scrape_date"] = (scraped_at or datetime.now()).date()
+    return transactions.drop_duplicates()
+
+
 @check_feature_flag_decorator(flag_name="transactions")
 @record_function_time_decorator
 def get_transactions_data() -> pd.DataFrame:
@@ -339,59 +472,17 @@ def get_transactions_data() -> pd.DataFrame:
         Pandas DataFrame of all season transactions, trades, player waives etc.
     """
     try:
-        url = f"https://www.basketball-reference.com/leagues/NBA_{SEASON_YEAR}_transactions.html"
-
-        # Use urllib like pandas does
-        req = urllib.request.Request(url)
-        with urllib.request.urlopen(req, timeout=15) as resp:
-            html = resp.read().decode("utf-8", errors="replace")
-
-        soup = BeautifulSoup(html, "html.parser")
-
-        # Find the ul with class="page_index"
-        page_index = soup.find("ul", {"class": "page_index"})
-
-        if not isinstance(page_index, Tag):
-            raise ValueError("Could not find transactions list")
-
-        trs = page_index.find_all("li")
-
-        rows = []
-        mylist = []
-        for tr in trs:
-            date = tr.find("span")
-            # needed bc span can be null (multi <p> elements per span)
-            if date is not None:
-                date = date.text
-            data = tr.findAll("p")
-            for p in data:
-                mylist.append(p.text)
-            data3 = [date] + [mylist]
-            rows.append(data3)
-            mylist = []
-
-        transactions = pd.DataFrame(rows)
-        transactions.columns = ["Date", "Transaction"]
-        transactions = transactions.query(
-            'Date == Date & Date != ""'
-        ).reset_index()  # filters out nulls and empty values
-        transactions = transactions.explode("Transaction")
-        transactions["Date"] = transactions["Date"].str.replace(
-            "\\?",
-            "October 1, 2024",
-            regex=True,  # bad data 10-14-21
+        transactions = run_parser(
+            parse_transactions,
+            fetch_html(_season_page_url("transactions")),
+            scraped_at=get_run_datetime(),
         )
-        transactions["Date"] = pd.to_datetime(transactions["Date"])
-        transactions.columns = transactions.columns.str.lower()
-        transactions = transactions[["date", "transaction"]]
-        transactions["scrape_date"] = datetime.now().date()
-        transactions = transactions.drop_duplicates()
         logging.info(
             "Transactions Transformation Function Successful, "
             f"retrieving {len(transactions)} rows"
         )
         return transactions
-    except (URLError, HTTPError, ValueError) as error:
+    except (requests.RequestException, ValueError) as error:
         logging.error(f"Transaction Web Scrape Function Failed, {error}")
         return pd.DataFrame()
     except Exception as error:
@@ -399,6 +490,63 @@ def get_transactions_data() -> pd.DataFrame:
         return pd.DataFrame()
 
 
+def parse_team_adv_stats(
+    html: str | bytes, scraped_at: datetime | None = None
+) -> pd.DataFrame:
+    """Parse the team advanced stats table out of the league season page
+
+    Args:
+        html (str | bytes): The `NBA_{SEASON_YEAR}.html` page
+
+        scraped_at (datetime, optional): When the page was scraped, stamped on
+            the rows. Defaults to now.
+
+    Returns:
+        DataFrame of all current Team Advanced Stats
+    """
+    df = read_table(decode_page(html), table_id="advanced-team")
+    df.drop(columns=df.columns[0], axis=1, inplace=True)
+    df.columns = [
+        "Team",
+        "Age",
+        "W",
+        "L",
+        "PW",
+        "PL",
+        "MOV",
+        "SOS",
+        "SRS",
+        "ORTG",
+        "DRTG",
+        "NRTG",
+        "Pace",
+        "FTr",
+        "3PAr",
+        "TS%",
+        "bby1",  # the bby columns are because of hierarchical html formatting
+        "eFG%",
+        "TOV%",
+        "ORB%",
+        "FT/FGA",
+        "bby2",
+        "eFG%_opp",
+        "TOV%_opp",
+        "DRB%_opp",
+        "FT/FGA_opp",
+        "bby3",
+        "Arena",
+        "Attendance",
+        "Att/Game",
+    ]
+    df.drop(["bby1", "bby2", "bby3"], axis=1, inplace=True)
+    df = df.query('Team != "League Average"').reset_index()
+    # Playoff teams get a * next to them ??  fkn stupid, filter it out.
+    df["Team"] = df["Team"].str.replace("\\*", "", regex=True)
+    df["scrape_date"] = (scraped_at or datetime.now()).date()
+    df.columns = df.columns.str.lower()
+    return df
+
+
 @check_feature_flag_decorator(flag_name="adv_stats")
 @record_function_time_decorator
 def get_team_adv_stats_data() -> pd.DataFrame:
@@ -411,48 +559,11 @@ def get_team_adv_stats_data() -> pd.DataFrame:
         DataFrame of all current Team Advanced Stats
     """
     try:
-        url = f"https://www.basketball-reference.com/leagues/NBA_{SEASON_YEAR}.html"
-        df = pd.read_html(url)
-        df = pd.DataFrame(df[10])
-        df.drop(columns=df.columns[0], axis=1, inplace=True)
-        df.columns = [
-            "Team",
-            "Age",
-            "W",
-            "L",
-            "PW",
-            "PL",
-            "MOV",
-            "SOS",
-            "SRS",
-            "ORTG",
-            "DRTG",
-            "NRTG",
-            "Pace",
-            "FTr",
-            "3PAr",
-            "TS%",
-            "bby1",  # the bby columns are because of hierarchical html formatting
-            "eFG%",
-            "TOV%",
-            "ORB%",
-            "FT/FGA",
-            "bby2",
-            "eFG%_opp",
-            "TOV%_opp",
-            "DRB%_opp",
-            "FT/FGA_opp",
-            "bby3",
-            "Arena",
-            "Attendance",
-            "Att/Game",
-        ]
-        df.drop(["bby1", "bby2", "bby3"], axis=1, inplace=True)
-        df = df.query('Team != "League Average"').reset_index()
-        # Playoff teams get a * next to them ??  fkn stupid, filter it out.
-        df["Team"] = df["Team"].str.replace("\\*", "", regex=True)
-        df["scrape_date"] = datetime.now().date()
-        df.columns = df.columns.str.lower()
+        df = run_parser(
+            parse_team_adv_stats,
+            fetch_html(_league_season_url()),
+            scraped_at=get_run_datetime(),
+        )
         logging.info(
             "Team Advanced Stats Transformation Function Successful, "
             "retrieving updated data for 30 Teams"
@@ -463,8 +574,71 @@ def get_team_adv_stats_data() -> pd.DataFrame:
         return pd.DataFrame()
 
 
+# column position on the shooting page -> the name it's stored under
+SHOOTING_STATS_COLUMNS = {
+    1: "player",
+    6: "mp",
+    8: "avg_shot_distance",
+    10: "pct_fga_2p",
+    11: "pct_fga_0_3",
+    12: "pct_fga_3_10",
+    13: "pct_fga_10_16",
+    14: "pct_fga_16_3p",
+    15: "pct_fga_3p",
+    17: "fg_pct_0_3",
+    18: "fg_pct_3_10",
+    19: "fg_pct_10_16",
+    20: "fg_pct_16_3p",
+    22: "pct_2pfg_ast",
+    23: "pct_3pfg_ast",
+    24: "dunk_pct_tot_fg",
+    25: "dunks",
+    26: "corner_3_ast_pct",
+    27: "corner_3pm_pct",
+    28: "heaves_att",
+    29: "heaves_makes",
+}
+
+
+def parse_shooting_stats(
+    html: str | bytes, scraped_at: datetime | None = None
+) -> pd.DataFrame:
+    """Parse every player's raw shooting stats out of the shooting stats page
+
+    Args:
+        html (str | bytes): The `NBA_{SEASON_YEAR}_shooting.html` page
+
+        scraped_at (datetime, optional): When the page was scraped, stamped on
+            the rows. Defaults to now.
+
+    Returns:
+        DataFrame of raw shooting stats
+    """
+    # only the kept columns get parsed, which also drops the grouped
+    # "over_header" row so the header comes back flat
+    df = read_table(
+        decode_page(html), table_id=None, columns=list(SHOOTING_STATS_COLUMNS)
+    )
+    df.columns = list(SHOOTING_STATS_COLUMNS.values())
+    df = df.query('player != "Player"').copy()
+    df["mp"] = pd.to_numeric(df["mp"])
+    df = (
+        df.sort_values(["mp"], ascending=False)
+        .groupby("player")
+        .first()
+        .reset_index()
+        .drop("mp", axis=1)
+    )
+    df["player"] = normalize_player_names(df["player"])
+    scraped_at = scraped_at or datetime.now()
+    df["scrape_date"] = scraped_at.date()
+    df["scrape_ts"] = scraped_at
+    return df
+
+
 @check_feature_flag_decorator(flag_name="shooting_stats")
 @record_function_time_decorator
+@skip_parse_if_unchanged(url=lambda: _season_page_url("shooting"))
 def get_shooting_stats_data() -> pd.DataFrame:
     """Web Scrape function w/ pandas read_html that grabs all raw shooting stats
 
@@ -475,76 +649,11 @@ def get_shooting_stats_data() -> pd.DataFrame:
         DataFrame of raw shooting stats
     """
     try:
-        url = f"https://www.basketball-reference.com/leagues/NBA_{SEASON_YEAR}_shooting.html"
-        df = pd.read_html(url)[0]
-        df.columns = df.columns.to_flat_index()
-        df = df.rename(
-            columns={
-                df.columns[1]: "player",
-                df.columns[6]: "mp",
-                df.columns[8]: "avg_shot_distance",
-                df.columns[10]: "pct_fga_2p",
-                df.columns[11]: "pct_fga_0_3",
-                df.columns[12]: "pct_fga_3_10",
-                df.columns[13]: "pct_fga_10_16",
-                df.columns[14]: "pct_fga_16_3p",
-                df.columns[15]: "pct_fga_3p",
-                df.columns[17]: "fg_pct_0_3",
-                df.columns[18]: "fg_pct_3_10",
-                df.columns[19]: "fg_pct_10_16",
-                df.columns[20]: "fg_pct_16_3p",
-                df.columns[22]: "pct_2pfg_ast",
-                df.columns[23]: "pct_3pfg_ast",
-                df.columns[24]: "dunk_pct_tot_fg",
-                df.columns[25]: "dunks",
-                df.columns[26]: "corner_3_ast_pct",
-                df.columns[27]: "corner_3pm_pct",
-                df.columns[28]: "heaves_att",
-                df.columns[29]: "heaves_makes",
-            }
-        )[
-            [
-                "player",
-                "mp",
-                "avg_shot_distance",
-                "pct_fga_2p",
-                "pct_fga_0_3",
-                "pct_fga_3_10",
-                "pct_fga_10_16",
-                "pct_fga_16_3p",
-                "pct_fga_3p",
-                "fg_pct_0_3",
-                "fg_pct_3_10",
-                "fg_pct_10_16",
-                "fg_pct_16_3p",
-                "pct_2pfg_ast",
-                "pct_3pfg_ast",
-                "dunk_pct_tot_fg",
-                "dunks",
-                "corner_3_ast_pct",
-                "corner_3pm_pct",
-                "heaves_att",
-                "heaves_makes",
-            ]
-        ]
-        df = df.query('player != "Player"').copy()
-        df["mp"] = pd.to_numeric(df["mp"])
-        df = (
-            df.sort_values(["mp"], ascending=False)
-            .groupby("player")
-            .first()
-            .reset_index()
-            .drop("mp", axis=1)
+        df = run_parser(
+            parse_shooting_stats,
+            fetch_html(_season_page_url("shooting")),
+            scraped_at=get_run_datetime(),
         )
-        df["player"] = (
-            df["player"]
-            .str.normalize("NFKD")  # this is removing all accented characters
-            .str.encode("ascii", errors="ignore")
-            .str.decode("utf-8")
-        )
-        df["player"] = df["player"].apply(clean_player_names)
-        df["scrape_date"] = datetime.now().date()
-        df["scrape_ts"] = datetime.now()
         logging.info(
             "Shooting Stats Transformation Function Successful, "
             f"retrieving {len(df)} rows"
@@ -590,6 +699,106 @@ def _select_sportsbook_column(table: pd.DataFrame, col_index: int) -> pd.Series:
     return column.astype(str)
 
 
+def parse_odds(html: str | bytes, scraped_at: datetime | None = None) -> pd.DataFrame:
+    """Parse the DraftKings lines for today's games out of the covers.com odds page
+
+    Args:
+        html (str | bytes): The covers.com NBA odds page
+
+        scraped_at (datetime, optional): When the page was scraped, stamped on
+            the rows. Defaults to now.
+
+    Returns:
+        DataFrame of Gambling Odds for Today's Games, empty if there are none
+    """
+    html = decode_page(html)
+    draftkings_col = _find_covers_sportsbook_column_index(html)
+    df = pd.read_html(StringIO(html))
+
+    odds = df[0].iloc[:, [0]].copy()
+    odds.columns = ["datetime1"]
+    odds["moneyline"] = _select_sportsbook_column(df[0], draftkings_col)
+    odds["spread"] = _select_sportsbook_column(df[1], draftkings_col)
+    odds["total"] = _select_sportsbook_column(df[2], draftkings_col).str.extract(
+        r"o\s+([\d.]+)", flags=re.I
+    )[0]
+
+    # Normalize all whitespace first (handles \xa0 and other issues)
+    odds["datetime1"] = (
+        odds["datetime1"].astype(str).str.replace(r"\s+", " ", regex=True)
+    )
+    odds["spread"] = odds["spread"].str.replace(r"\s+", " ", regex=True)
+    odds["moneyline"] = odds["moneyline"].str.replace(r"\s+", " ", regex=True)
+
+    # Filter for today's games only
+    odds = odds[
+        (odds["datetime1"].notna())
+        & (odds["datetime1"] != "FINAL")
+        & (odds["datetime1"] != "nan")
+        & (odds["datetime1"].str.contains("Today", na=False))
+    ].copy()
+
+    if len(odds) == 0:
+        return pd.DataFrame()
+
+    # Clean datetime - remove "Today, "
+    odds["datetime1"] = odds["datetime1"].str.replace(r"Today,\s*", "", regex=True)
+
+    # Handle PK (pick 'em) games
+    odds["spread"] = odds["spread"].str.replace("PK", "-1.0", regex=False)
+
+    # Apply your filter_spread function
+    odds["spread"] = odds["spread"].apply(filter_spread)
+    odds["spread"] = odds["spread"].apply(lambda x: " ".join(x.split()))
+
+    odds_final = odds[["datetime1", "spread", "moneyline", "total"]].copy()
+
+    # Extract teams from datetime1
+    # \b: Word boundary anchor
+    # [A-Z]{2,3}: Match 2-3 uppercase letters (team abbreviations)
+    pattern = r"\b([A-Z]{2,3})\b"
+    odds_final["team"] = (
+        odds_final["datetime1"]
+        .str.extractall(pattern)
+        .unstack()
+        .apply(lambda x: " ".join(x.dropna()), axis=1)
+    )
+
+    # Extract time BEFORE exploding to avoid contamination
+    odds_final["time"] = odds_final["datetime1"].str.split().str[0]
+
+    # Convert to lists for exploding
+    odds_final["team"] = odds_final["team"].str.split()
+    odds_final["spread"] = odds_final["spread"].str.split()
+    odds_final["moneyline"] = odds_final["moneyline"].str.split()
+
+    # Explode all columns at once
+    odds_final = odds_final.explode(["team", "spread", "moneyline"]).reset_index(
+        drop=True
+    )
+
+    # Clean up strings
+    odds_final["spread"] = odds_final["spread"].str.strip()
+    odds_final["moneyline"] = odds_final["moneyline"].str.strip()
+    # the page only labels the games w/ "Today", so they're dated by the scrape
+    game_date = (scraped_at or datetime.now()).date()
+    odds_final["date"] = game_date
+
+    # Create proper datetime using pre-extracted time
+    odds_final["datetime1"] = pd.to_datetime(
+        game_date.strftime("%Y-%m-%d") + " " + odds_final["time"],
+        format="%Y-%m-%d %H:%M",
+    )
+
+    # Final transformations
+    odds_final["team"] = odds_final["team"].str.replace("BK", "BKN")
+    odds_final["moneyline"] = odds_final["moneyline"].str.replace(r"\+", "", regex=True)
+    odds_final["moneyline"] = odds_final["moneyline"].astype("int")
+
+    # Select final columns (drop time as it's now in datetime1)
+    return odds_final[["team", "spread", "total", "moneyline", "date", "datetime1"]]
+
+
 @check_feature_flag_decorator(flag_name="odds")
 @record_function_time_decorator
 def get_odds_data() -> pd.DataFrame:
@@ -602,108 +811,104 @@ def get_odds_data() -> pd.DataFrame:
         DataFrame of Gambling Odds for Today's Games
     """
     try:
-        url = "https://www.covers.com/sport/basketball/nba/odds"
-        with urllib.request.urlopen(url) as response:
-            html = response.read().decode("utf-8")
-
-        draftkings_col = _find_covers_sportsbook_column_index(html)
-        df = pd.read_html(StringIO(html))
-
-        odds = df[0].iloc[:, [0]].copy()
-        odds.columns = ["datetime1"]
-        odds["moneyline"] = _select_sportsbook_column(df[0], draftkings_col)
-        odds["spread"] = _select_sportsbook_column(df[1], draftkings_col)
-        odds["total"] = _select_sportsbook_column(df[2], draftkings_col).str.extract(
-            r"o\s+([\d.]+)", flags=re.I
-        )[0]
-
-        # Normalize all whitespace first (handles \xa0 and other issues)
-        odds["datetime1"] = (
-            odds["datetime1"].astype(str).str.replace(r"\s+", " ", regex=True)
+        odds_final = run_parser(
+            parse_odds, fetch_html(ODDS_URL), scraped_at=get_run_datetime()
         )
-        odds["spread"] = odds["spread"].str.replace(r"\s+", " ", regex=True)
-        odds["moneyline"] = odds["moneyline"].str.replace(r"\s+", " ", regex=True)
-
-        # Filter for today's games only
-        odds = odds[
-            (odds["datetime1"].notna())
-            & (odds["datetime1"] != "FINAL")
-            & (odds["datetime1"] != "nan")
-            & (odds["datetime1"].str.contains("Today", na=False))
-        ].copy()
-
-        if len(odds) == 0:
+        if odds_final.empty:
             logging.info("No Odds Records available for today's games")
-            return pd.DataFrame()
+            return odds_final
 
-        # Clean datetime - remove "Today, "
-        odds["datetime1"] = odds["datetime1"].str.replace(r"Today,\s*", "", regex=True)
+        logging.info(
+            f"Odds Scrape Successful, returning {len(odds_final)} records "
+            f"from {len(odds_final) // 2} games Today"
+        )
+        return odds_final
 
-        # Handle PK (pick 'em) games
-        odds["spread"] = odds["spread"].str.replace("PK", "-1.0", regex=False)
+    except Exception as e:
+        logging.error(f"Odds Function Web Scrape Failed, {e}")
+        return pd.DataFrame()
 
-        # Apply your filter_spread function
-        odds["spread"] = odds["spread"].apply(filter_spread)
-        odds["spread"] = odds["spread"].apply(lambda x: " ".join(x.split()))
 
-        odds_final = odds[["datetime1", "spread", "moneyline", "total"]].copy()
+# reddit's oauth limit is per account, so leave a little headroom for the
+# other threads before their next call
+REDDIT_RATE_LIMIT_BUFFER = 10
 
-        # Extract teams from datetime1
-        # \b: Word boundary anchor
-        # [A-Z]{2,3}: Match 2-3 uppercase letters (team abbreviations)
-        pattern = r"\b([A-Z]{2,3})\b"
-        odds_final["team"] = (
-            odds_final["datetime1"]
-            .str.extractall(pattern)
-            .unstack()
-            .apply(lambda x: " ".join(x.dropna()), axis=1)
-        )
+_reddit_local = threading.local()
 
-        # Extract time BEFORE exploding to avoid contamination
-        odds_final["time"] = odds_final["datetime1"].str.split().str[0]
 
-        # Convert to lists for exploding
-        odds_final["team"] = odds_final["team"].str.split()
-        odds_final["spread"] = odds_final["spread"].str.split()
-        odds_final["moneyline"] = odds_final["moneyline"].str.split()
+def _create_reddit_client() -> praw.Reddit:
+    """Create a PRAW client from the reddit env vars."""
+    return praw.Reddit(
+        client_id=os.environ.get("reddit_accesskey"),
+        client_secret=os.environ.get("reddit_secretkey"),
+        user_agent="praw-app",
+        username=os.environ.get("reddit_user"),
+        password=os.environ.get("reddit_pw"),
+    )
 
-        # Explode all columns at once
-        odds_final = odds_final.explode(["team", "spread", "moneyline"]).reset_index(
-            drop=True
-        )
 
-        # Clean up strings
-        odds_final["spread"] = odds_final["spread"].str.strip()
-        odds_final["moneyline"] = odds_final["moneyline"].str.strip()
-        odds_final["date"] = datetime.now().date()
+def _get_thread_reddit_client() -> praw.Reddit:
+    """Return this thread's PRAW client, creating it on first use.
 
-        # Create proper datetime using pre-extracted time
-        odds_final["datetime1"] = pd.to_datetime(
-            datetime.now().date().strftime("%Y-%m-%d") + " " + odds_final["time"],
-            format="%Y-%m-%d %H:%M",
-        )
+    PRAW isn't thread safe, so every worker thread gets its own session.
+    """
+    reddit = getattr(_reddit_local, "reddit", None)
+    if reddit is None:
+        reddit = _create_reddit_client()
+        _reddit_local.reddit = reddit
+    return reddit
 
-        # Final transformations
-        odds_final["team"] = odds_final["team"].str.replace("BK", "BKN")
-        odds_final["moneyline"] = odds_final["moneyline"].str.replace(
-            r"\+", "", regex=True
-        )
-        odds_final["moneyline"] = odds_final["moneyline"].astype("int")
 
-        # Select final columns (drop time as it's now in datetime1)
-        odds_final = odds_final[
-            ["team", "spread", "total", "moneyline", "date", "datetime1"]
-        ]
+def _wait_for_reddit_rate_limit(reddit: praw.Reddit) -> None:
+    """Sleep until the rate limit window resets if we're close to the limit.
 
+    PRAW tracks the `X-Ratelimit-Remaining` + `X-Ratelimit-Reset` headers from
+    the last response in `reddit.auth.limits`.
+    """
+    limits = reddit.auth.limits
+    remaining = limits.get("remaining")
+    reset_timestamp = limits.get("reset_timestamp")
+    if not isinstance(remaining, int | float) or not isinstance(
+        reset_timestamp, int | float
+    ):
+        return
+
+    if remaining < REDDIT_RATE_LIMIT_BUFFER:
+        sleep_seconds = max(reset_timestamp - time.time(), 0)
         logging.info(
-            f"Odds Scrape Successful, returning {len(odds_final)} records "
-            f"from {len(odds_final) // 2} games Today"
+            f"Reddit rate limit has {remaining} requests remaining, "
+            f"sleeping {round(sleep_seconds, 2)} seconds"
         )
-        return odds_final
+        time.sleep(sleep_seconds)
 
-    except Exception as e:
-        logging.error(f"Odds Function Web Scrape Failed, {e}")
-        return pd.DataFrame()
+
+def _extract_submission_comments(url: str) -> dict[str, list]:
+    """Pull every comment from a single reddit post as columns
+
+    Args:
+        url (str): The reddit post url
+
+    Returns:
+        Dict of column name to list of values, one entry per comment
+    """
+    reddit = _get_thread_reddit_client()
+    _wait_for_reddit_rate_limit(reddit)
+
+    submission = reddit.submission(url=url)
+    # this removes all the "more comment" stubs
+    # to grab ALL comments use limit=None, but it will take 100x longer
+    submission.comments.replace_more(limit=0)
+    comments = submission.comments.list()
+
+    return {
+        "author": [comment.author for comment in comments],
+        "comment": [comment.body for comment in comments],
+        "score": [comment.score for comment in comments],
+        "url": [url] * len(comments),
+        "flair1": [comment.author_flair_css_class for comment in comments],
+        "flair2": [comment.author_flair_text for comment in comments],
+        "edited": [comment.edited for comment in comments],
+    }
 
 
 @check_feature_flag_decorator(flag_name="reddit_posts")
@@ -721,13 +926,7 @@ def get_reddit_data(sub: str = "nba") -> pd.DataFrame:
     Returns:
         Pandas DataFrame of all current top posts on r/nba
     """
-    reddit = praw.Reddit(
-        client_id=os.environ.get("reddit_accesskey"),
-        client_secret=os.environ.get("reddit_secretkey"),
-        user_agent="praw-app",
-        username=os.environ.get("reddit_user"),
-        password=os.environ.get("reddit_pw"),
-    )
+    reddit = _create_reddit_client()
     try:
         subreddit = reddit.subreddit(sub)
         posts = []
@@ -775,56 +974,56 @@ def get_reddit_data(sub: str = "nba") -> pd.DataFrame:
 
 @check_feature_flag_decorator(flag_name="reddit_comments")
 @record_function_time_decorator
-def get_reddit_comments(urls: pd.Series | Sequence[str]) -> pd.DataFrame:
+def get_reddit_comments(
+    urls: pd.Series | Sequence[str],
+    max_workers: int = 4,
+) -> pd.DataFrame:
     """Web Scrape function w/ PRAW
 
-    Iteratively extracts comments from provided reddit post urls.
+    Extracts comments from the provided reddit post urls concurrently, w/ one
+    PRAW session per worker thread. A url that fails is logged and skipped
+    rather than throwing away the comments from every other url.
 
     Args:
         urls (Series): The (reddit) urls to extract comments from
 
+        max_workers (int): Maximum number of posts to extract at once.
+            Defaults to 4.
+
     Returns:
         Pandas DataFrame of all comments from the provided reddit urls
     """
-    reddit = praw.Reddit(
-        client_id=os.environ.get("reddit_accesskey"),
-        client_secret=os.environ.get("reddit_secretkey"),
-        user_agent="praw-app",
-        username=os.environ.get("reddit_user"),
-        password=os.environ.get("reddit_pw"),
-    )
-    author_list = []
-    comment_list = []
-    score_list = []
-    flair_list1 = []
-    flair_list2 = []
-    edited_list = []
-    url_list = []
+    columns = {
+        "author": [],
+        "comment": [],
+        "score": [],
+        "url": [],
+        "flair1": [],
+        "flair2": [],
+        "edited": [],
+    }
 
     try:
-        for i in urls:
-            submission = reddit.submission(url=i)
-            submission.comments.replace_more(limit=0)
-            # this removes all the "more comment" stubs
-            # to grab ALL comments use limit=None, but it will take 100x longer
-            for comment in submission.comments.list():
-                author_list.append(comment.author)
-                comment_list.append(comment.body)
-                score_list.append(comment.score)
-                flair_list1.append(comment.author_flair_css_class)
-                flair_list2.append(comment.author_flair_text)
-                edited_list.append(comment.edited)
-                url_list.append(i)
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="reddit"
+        ) as executor:
+            futures = {
+                executor.submit(_extract_submission_comments, url): url for url in urls
+            }
+
+        for future, url in futures.items():
+            try:
+                batch = future.result()
+            except Exception as e:
+                logging.error(f"Reddit Comment Extraction Failed for url {url}, {e}")
+                continue
+
+            for column, values in batch.items():
+                columns[column].extend(values)
 
         df = pd.DataFrame(
             {
-                "author": author_list,
-                "comment": comment_list,
-                "score": score_list,
-                "url": url_list,
-                "flair1": flair_list1,
-                "flair2": flair_list2,
-                "edited": edited_list,
+                **columns,
                 "scrape_date": datetime.now().date(),
                 "scrape_ts": datetime.now(),
             }
@@ -833,17 +1032,16 @@ def get_reddit_comments(urls: pd.Series | Sequence[str]) -> pd.DataFrame:
         df = df.query('author != "None"')  # remove deleted comments rip
         df["author"] = df["author"].astype(str)
         df = df.sort_values("score").groupby(["author", "comment", "url"]).tail(1)
-        df = add_sentiment_analysis(df, "comment")
+        # big comment frames get scored in worker processes when
+        # SENTIMENT_MAX_WORKERS is set
+        df = add_sentiment_analysis(
+            df, "comment", n_jobs=int(os.environ.get("SENTIMENT_MAX_WORKERS", 1))
+        )
 
         df["edited"] = np.where(
             df["edited"] is False, 0, 1
         )  # if edited, then 1, else 0
-        df["md5_pk"] = df.apply(
-            lambda x: hashlib.md5(
-                (str(x["author"]) + str(x["comment"]) + str(x["url"])).encode("utf8")
-            ).hexdigest(),
-            axis=1,
-        )
+        df["md5_pk"] = build_md5_key(df, ["author", "comment", "url"])
         # this hash function lines up with the md5 function in postgres
         # this is needed for the upsert to work on it.
         logging.info(
@@ -852,203 +1050,265 @@ def get_reddit_comments(urls: pd.Series | Sequence[str]) -> pd.DataFrame:
         )
         return df
     except Exception as e:
-        logging.error(f"Reddit Comment Extraction Failed for url {i}, {e}")
+        logging.error(f"Reddit Comment Extraction Failed, {e}")
         return pd.DataFrame()
 
 
+# "Start of 2nd quarter", "Start of 3rd overtime" ... + the opening tip
+PBP_PERIOD_MARKER = (
+    r"^(?:Start of (?P<ordinal>\d+(?:st|nd|rd|th)) (?P<period>quarter|overtime)"
+    r"|(?P<tip>Jump ball):)"
+)
+# repeated header rows between periods, ex. "Time", "2nd Q", "5th OT"
+PBP_HEADER_ROW = r"Time|\d+(?:st|nd|rd|th) (?:Q|OT)"
+
+
+def _read_pbp_table(
+    df: pd.DataFrame, home_team: str, game_date: datetime
+) -> pd.DataFrame:
+    """Flatten + rename the raw pbp table of 1 game + tag it w/ its game key."""
+    df.columns = df.columns.map("".join)
+    df = df.rename(
+        columns={
+            df.columns[0]: "Time",
+            df.columns[1]: "descriptionPlayVisitor",
+            df.columns[2]: "AwayScore",
+            df.columns[3]: "Score",
+            df.columns[4]: "HomeScore",
+            df.columns[5]: "descriptionPlayHome",
+        }
+    )
+    df["HomeTeam"] = home_team
+    df["Date"] = game_date
+    return df
+
+
+def _transform_pbp_data(
+    games: list[pd.DataFrame],
+    away_teams: pd.DataFrame,
+    scraped_at: datetime | None = None,
+) -> pd.DataFrame:
+    """Transform the raw play-by-play tables of every game at once
+
+    The period of every play comes from 1 regex pass over the period markers
+    (the opening tip at 12:00 + every "Start of Nth quarter / overtime" row),
+    so any number of overtimes is handled. Quarters + scores are forward
+    filled within each (Date, HomeTeam) game only.
+
+    Args:
+        games (list[DataFrame]): 1 table per game, see `parse_pbp_game`
+
+        away_teams (DataFrame): AwayTeam, HomeTeam + Date of every game from
+            the boxscores
+
+        scraped_at (datetime, optional): When the page was scraped, stamped on
+            the rows. Defaults to now.
+
+    Returns:
+        The transformed pbp data for every game, scoring plays only
+    """
+    df = pd.concat(games, ignore_index=True)
+
+    markers = df["HomeScore"].str.extract(PBP_PERIOD_MARKER)
+    period_labels = markers["period"].map({"quarter": "Quarter", "overtime": "OT"})
+    quarter = markers["ordinal"] + " " + period_labels
+    is_tip = markers["tip"].notna() & df["Time"].str.contains("12:00.0", na=False)
+    df.insert(6, "Quarter", quarter.mask(is_tip, "1st Quarter"))
+
+    df["HomeTeam"] = df["HomeTeam"].replace({"PHO": "PHX", "CHO": "CHA", "BRK": "BKN"})
+    df = df[~df["Time"].str.fullmatch(PBP_HEADER_ROW, na=False)].merge(
+        away_teams, on=["HomeTeam", "Date"]
+    )
+
+    scores = df["Score"].str.extract(r"^(?P<scoreAway>\d+)-(?P<scoreHome>\d+)$")
+    df = df.join(scores.astype("float64"))
+
+    # plays before a game's 1st marker / basket stay empty, not the last game's
+    games_by_key = df.groupby(["Date", "HomeTeam"], sort=False)
+    df["Quarter"] = games_by_key["Quarter"].ffill()
+    df[["scoreAway", "scoreHome"]] = (
+        games_by_key[["scoreAway", "scoreHome"]].ffill().fillna(0)
+    )
+    df["marginScore"] = df["scoreHome"] - df["scoreAway"]
+    df["Date"] = df.pop("Date")
+    df["scrape_date"] = (scraped_at or datetime.now()).date()
+    df = df.rename(columns={"Time": "timeQuarter", "Quarter": "numberPeriod"})
+
+    df.columns = df.columns.str.lower()
+    # filtering only scoring plays here, keep other all other rows in future
+    # for lineups stuff etc.
+    return df[df["awayscore"].notna() | df["homescore"].notna()]
+
+
+def parse_pbp_game(
+    html: str | bytes, home_team: str, game_date: datetime
+) -> pd.DataFrame:
+    """Parse the raw play-by-play table for a single game out of its pbp page
+
+    The table is only flattened here, `_transform_pbp_data` transforms every
+    game of the night together.
+
+    Args:
+        html (str | bytes): The `boxscores/pbp/{date}0{home_team}.html` page
+
+        home_team (str): The bbref team alias of the home team (ex. PHO, BRK)
+
+        game_date (datetime): The date the game was played
+
+    Returns:
+        The game's pbp table w/ HomeTeam + Date columns
+    """
+    df = pd.read_html(StringIO(decode_page(html)))[0]
+    return _read_pbp_table(df=df, home_team=home_team, game_date=game_date)
+
+
+def _get_pbp_game(url: str, home_team: str, game_date: datetime) -> pd.DataFrame:
+    """Fetch + parse the raw play-by-play table for a single game."""
+    return run_parser(
+        parse_pbp_game, fetch_html(url), home_team=home_team, game_date=game_date
+    )
+
+
 @check_feature_flag_decorator(flag_name="pbp")
 @record_function_time_decorator
-def get_pbp_data(df: pd.DataFrame) -> pd.DataFrame:
+def get_pbp_data(df: pd.DataFrame, max_workers: int = 3) -> pd.DataFrame:
     """Web Scrape function w/ pandas read_html
 
-    Uses aliases via boxscores function to scrape the pbp data iteratively for each game
-    played the previous day. It assumes there is a location column in the df being
-    passed in.
+    Uses aliases via boxscores function to scrape the pbp data for each game
+    in the boxscores df, which can cover any number of dates (ex. a backfill).
+    It assumes there is a location column in the df being passed in.
+
+    Game pages are fetched + parsed concurrently, and a game that fails is
+    logged and left out rather than failing the whole batch. The games that
+    made it are then transformed together in 1 pass.
 
     Args:
         df (DataFrame): The Boxscores DataFrame
 
+        max_workers (int): Maximum number of games to fetch at once. Defaults to 3
+            to stay friendly w/ basketball-reference's rate limits.
+
     Returns:
         All PBP Data for the games in the input df
 
     """
-    if len(df) > 0:
-        game_date = df["date"][0]
-    else:
-        df = pd.DataFrame()
+    if len(df) == 0:
         logging.info(
             "PBP Transformation Function Skipped, "
-            f"no data available for {datetime.now().date()}"
+            f"no data available for {get_run_datetime().date()}"
         )
-        return df
+        return pd.DataFrame()
     try:
-        if len(df) > 0:
-            yesterday_hometeams = (
-                df.query('location == "H"')[["team"]].drop_duplicates().dropna()
-            )
-            yesterday_hometeams["team"] = yesterday_hometeams["team"].str.replace(
-                "PHX", "PHO"
-            )
-            yesterday_hometeams["team"] = yesterday_hometeams["team"].str.replace(
-                "CHA", "CHO"
-            )
-            yesterday_hometeams["team"] = yesterday_hometeams["team"].str.replace(
-                "BKN", "BRK"
-            )
+        df = df.assign(date=pd.to_datetime(df["date"]))
+        first_date, last_date = df["date"].min().date(), df["date"].max().date()
+        date_range = (
+            f"{first_date}"
+            if first_date == last_date
+            else f"{first_date} to {last_date}"
+        )
+
+        # 1 (date, home team) row per game, w/ the home team's bbref alias
+        home_games = (
+            df.query('location == "H"')[["date", "team"]].drop_duplicates().dropna()
+        )
+        home_games["team"] = home_games["team"].replace(
+            {"PHX": "PHO", "CHA": "CHO", "BKN": "BRK"}
+        )
 
-            away_teams = (
-                df.query('location == "A"')[["team", "opponent"]]
-                .drop_duplicates()
-                .dropna()
+        away_teams = (
+            df.query('location == "A"')[["team", "opponent", "date"]]
+            .drop_duplicates()
+            .dropna()
+            .rename(
+                columns={"team": "AwayTeam", "opponent": "HomeTeam", "date": "Date"}
             )
-            away_teams = away_teams.rename(
-                columns={
-                    away_teams.columns[0]: "AwayTeam",
-                    away_teams.columns[1]: "HomeTeam",
-                }
+        )
+
+        if len(home_games) == 0:
+            logging.info(
+                "PBP Transformation Function Skipped, "
+                f"no data available for {date_range}"
             )
-        else:
-            yesterday_hometeams = pd.DataFrame(columns=pd.Index(["team"]))
+            return pd.DataFrame()
+
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="pbp"
+        ) as executor:
+            futures = {
+                executor.submit(
+                    _get_pbp_game,
+                    url=f"https://www.basketball-reference.com/boxscores/pbp/{game_date:%Y%m%d}0{team}.html",
+                    home_team=team,
+                    game_date=game_date,
+                ): (team, game_date)
+                for game_date, team in home_games.itertuples(index=False)
+            }
 
-        if len(yesterday_hometeams) > 0:
+        games = []
+        for future, (team, game_date) in futures.items():
             try:
-                newdate = str(
-                    df["date"].drop_duplicates()[0].date()
-                )  # this assumes all games in the boxscores df are 1 date
-                newdate = pd.to_datetime(newdate).strftime(
-                    "%Y%m%d"
-                )  # formatting into url format.
-                pbp_list = pd.DataFrame()
-                for i in yesterday_hometeams["team"]:
-                    url = f"https://www.basketball-reference.com/boxscores/pbp/{newdate}0{i}.html"
-                    df = pd.read_html(url)[0]
-                    df.columns = df.columns.map("".join)
-                    df = df.rename(
-                        columns={
-                            df.columns[0]: "Time",
-                            df.columns[1]: "descriptionPlayVisitor",
-                            df.columns[2]: "AwayScore",
-                            df.columns[3]: "Score",
-                            df.columns[4]: "HomeScore",
-                            df.columns[5]: "descriptionPlayHome",
-                        }
-                    )
-                    conditions = [
-                        (
-                            df["HomeScore"].str.contains("Jump ball:", na=False)
-                            & df["Time"].str.contains("12:00.0")
-                        ),
-                        (
-                            df["HomeScore"].str.contains(
-                                "Start of 2nd quarter", na=False
-                            )
-                        ),
-                        (
-                            df["HomeScore"].str.contains(
-                                "Start of 3rd quarter", na=False
-                            )
-                        ),
-                        (
-                            df["HomeScore"].str.contains(
-                                "Start of 4th quarter", na=False
-                            )
-                        ),
-                        (
-                            df["HomeScore"].str.contains(
-                                "Start of 1st overtime", na=False
-                            )
-                        ),
-                        (
-                            df["HomeScore"].str.contains(
-                                "Start of 2nd overtime", na=False
-                            )
-                        ),
-                        (
-                            df["HomeScore"].str.contains(
-                                "Start of 3rd overtime", na=False
-                            )
-                        ),
-                        (
-                            df["HomeScore"].str.contains(
-                                "Start of 4th overtime", na=False
-                            )
-                        ),  # if more than 4 ots then rip
-                    ]
-                    values = [
-                        "1st Quarter",
-                        "2nd Quarter",
-                        "3rd Quarter",
-                        "4th Quarter",
-                        "1st OT",
-                        "2nd OT",
-                        "3rd OT",
-                        "4th OT",
-                    ]
-                    df["Quarter"] = np.select(conditions, values, default=None)  # ty: ignore[no-matching-overload]
-                    df["Quarter"] = df["Quarter"].ffill()
-                    df = df.query(
-                        'Time != "Time" & '
-                        'Time != "2nd Q" & '
-                        'Time != "3rd Q" & '
-                        'Time != "4th Q" & '
-                        'Time != "1st OT" & '
-                        'Time != "2nd OT" & '
-                        'Time != "3rd OT" & '
-                        'Time != "4th OT"'
-                    ).copy()
-                    # use COPY to get rid of the fucking goddamn warning
-                    df["HomeTeam"] = i
-                    df["HomeTeam"] = df["HomeTeam"].str.replace("PHO", "PHX")
-                    df["HomeTeam"] = df["HomeTeam"].str.replace("CHO", "CHA")
-                    df["HomeTeam"] = df["HomeTeam"].str.replace("BRK", "BKN")
-                    df = df.merge(away_teams)
-                    df[["scoreAway", "scoreHome"]] = df["Score"].str.split(
-                        "-", expand=True, n=1
-                    )
-                    df["scoreAway"] = pd.to_numeric(df["scoreAway"], errors="coerce")
-                    df["scoreAway"] = df["scoreAway"].ffill()
-                    df["scoreAway"] = df["scoreAway"].fillna(0)
-                    df["scoreHome"] = pd.to_numeric(df["scoreHome"], errors="coerce")
-                    df["scoreHome"] = df["scoreHome"].ffill()
-
-                    df["scoreHome"] = df["scoreHome"].fillna(0)
-                    df["marginScore"] = df["scoreHome"] - df["scoreAway"]
-                    df["Date"] = game_date
-                    df["scrape_date"] = datetime.now().date()
-                    df = df.rename(
-                        columns={
-                            df.columns[0]: "timeQuarter",
-                            df.columns[6]: "numberPeriod",
-                        }
-                    )
-                    pbp_list = pd.concat([df, pbp_list])
-                    df = pd.DataFrame()
-                pbp_list.columns = pbp_list.columns.str.lower()
-                pbp_list = pbp_list.query(
-                    "(awayscore.notnull()) | (homescore.notnull())", engine="python"
-                )
-                logging.info(
-                    "PBP Data Transformation Function Successful, "
-                    f"retrieving {len(pbp_list)} rows for {game_date}"
-                )
-                # filtering only scoring plays here, keep other all other rows in future
-                # for lineups stuff etc.
-                return pbp_list
+                games.append(future.result())
             except Exception as error:
-                logging.error(f"PBP Transformation Function Logic Failed, {error}")
-                return pd.DataFrame()
-        else:
-            df = pd.DataFrame()
-            logging.info(
-                "PBP Transformation Function Skipped, "
-                f"no data available for {game_date}"
+                logging.error(
+                    f"PBP Game Failed for {team} on {game_date.date()}, {error}"
+                )
+
+        if not games:
+            logging.error(
+                f"PBP Transformation Function Failed, 0 games for {date_range}"
             )
-            return df
+            return pd.DataFrame()
+
+        # transform every game at once instead of once per game
+        pbp_list = _transform_pbp_data(
+            games=games, away_teams=away_teams, scraped_at=get_run_datetime()
+        )
+        logging.info(
+            "PBP Data Transformation Function Successful, "
+            f"retrieving {len(pbp_list)} rows from {len(games)} of {len(futures)} "
+            f"games for {date_range}"
+        )
+        return pbp_list
     except Exception as error:
         logging.error(f"PBP Data Transformation Function Failed, {error}")
         return pd.DataFrame()
 
 
+def parse_schedule_month(html: str | bytes) -> pd.DataFrame:
+    """Parse the games out of 1 month of the league schedule
+
+    Args:
+        html (str | bytes): The `NBA_{SEASON_YEAR}_games-{month}.html` page
+
+    Returns:
+        DataFrame w/ the date, start time, away team + home team of each game
+
+    Raises:
+        IndexError: If the schedule table is empty
+
+        ValueError: If the page has no tables
+    """
+    tables = pd.read_html(StringIO(decode_page(html)))
+
+    if not tables or len(tables) == 0:
+        raise IndexError
+
+    month_df = tables[0]
+
+    if month_df.empty:
+        raise IndexError
+
+    # Select and rename columns
+    return month_df[["Date", "Start (ET)", "Visitor/Neutral", "Home/Neutral"]].rename(
+        columns={
+            "Date": "date",
+            "Start (ET)": "start_time",
+            "Visitor/Neutral": "away_team",
+            "Home/Neutral": "home_team",
+        }
+    )
+
+
 @check_feature_flag_decorator(flag_name="schedule")
 @record_function_time_decorator
 def get_schedule_data(
@@ -1079,7 +1339,7 @@ def get_schedule_data(
             "april",
         ]
 
-    current_date = datetime.now().date()
+    current_date = get_run_datetime().date()
     schedule_df = pd.DataFrame()
     completed_months = []
 
@@ -1087,29 +1347,7 @@ def get_schedule_data(
         try:
             url = f"https://www.basketball-reference.com/leagues/NBA_{SEASON_YEAR}_games-{month}.html"
 
-            # Use pd.read_html to get the table
-            tables = pd.read_html(url)
-
-            if not tables or len(tables) == 0:
-                raise IndexError
-
-            month_df = tables[0]
-
-            if month_df.empty:
-                raise IndexError
-
-            # Select and rename columns
-            month_df = month_df[
-                ["Date", "Start (ET)", "Visitor/Neutral", "Home/Neutral"]
-            ].rename(
-                columns={
-                    "Date": "date",
-                    "Start (ET)": "start_time",
-                    "Visitor/Neutral": "away_team",
-                    "Home/Neutral": "home_team",
-                }
-            )
-
+            month_df = run_parser(parse_schedule_month, fetch_html(url))
             schedule_df = pd.concat([schedule_df, month_df], ignore_index=True)
             completed_months.append(month)
 
@@ -1117,8 +1355,8 @@ def get_schedule_data(
                 f"Schedule scrape completed for {month}, {len(month_df)} rows retrieved"
             )
 
-        except HTTPError as error:
-            if error.code == 404:
+        except requests.HTTPError as error:
+            if error.response is not None and error.response.status_code == 404:
                 logging.info(f"{month} schedule page not found, skipping.")
                 continue
             raise
@@ -1140,8 +1378,43 @@ def get_schedule_data(
     return schedule_df
 
 
+def parse_player_contracts(html: str | bytes) -> pd.DataFrame:
+    """Parse current season salaries out of the player contracts page
+
+    Args:
+        html (str | bytes): The `contracts/players.html` page
+
+    Returns:
+        Pandas DataFrame of player contract salaries for the current season only.
+
+    Raises:
+        ValueError: If the page has no column for the current season
+    """
+    df = read_table(decode_page(html), table_id="player-contracts")
+    df.columns = [col[1] if col[0] == "Salary" else col[1] for col in df.columns]
+    df = df.query('Player != "Player" and Rk != "Rk"').copy()
+
+    current_season = f"{SEASON_YEAR - 1}-{str(SEASON_YEAR)[-2:]}"
+    if current_season not in df.columns:
+        raise ValueError(
+            f"Current season column {current_season} not found on contracts page"
+        )
+
+    df = df[["Player", current_season]].dropna(subset=[current_season])
+    df = df[df[current_season].str.startswith("$", na=False)]
+    df = df.rename(columns={"Player": "player", current_season: "season_salary"})
+    df["season_salary"] = (
+        df["season_salary"].str.replace(r"[\$,]", "", regex=True).astype("int64")
+    )
+    df["season"] = current_season
+    df["player"] = normalize_player_names(df["player"])
+    df = df.drop_duplicates(subset=["player"])
+    return df[["player", "season", "season_salary"]]
+
+
 @check_feature_flag_decorator(flag_name="player_contracts")
 @record_function_time_decorator
+@skip_parse_if_unchanged(url=lambda: PLAYER_CONTRACTS_URL)
 def get_player_contracts_data() -> pd.DataFrame:
     """Web Scrape function w/ pandas read_html that grabs player contract salaries.
 
@@ -1149,33 +1422,7 @@ def get_player_contracts_data() -> pd.DataFrame:
         Pandas DataFrame of player contract salaries for the current season only.
     """
     try:
-        url = "https://www.basketball-reference.com/contracts/players.html"
-        df = pd.read_html(url)[0]
-        df.columns = [col[1] if col[0] == "Salary" else col[1] for col in df.columns]
-        df = df.query('Player != "Player" and Rk != "Rk"').copy()
-
-        current_season = f"{SEASON_YEAR - 1}-{str(SEASON_YEAR)[-2:]}"
-        if current_season not in df.columns:
-            raise ValueError(
-                f"Current season column {current_season} not found on contracts page"
-            )
-
-        df = df[["Player", current_season]].dropna(subset=[current_season])
-        df = df[df[current_season].str.startswith("$", na=False)]
-        df = df.rename(columns={"Player": "player", current_season: "season_salary"})
-        df["season_salary"] = (
-            df["season_salary"].str.replace(r"[\$,]", "", regex=True).astype("int64")
-        )
-        df["season"] = current_season
-        df["player"] = (
-            df["player"]
-            .str.normalize("NFKD")
-            .str.encode("ascii", errors="ignore")
-            .str.decode("utf-8")
-        )
-        df["player"] = df["player"].apply(clean_player_names)
-        df = df.drop_duplicates(subset=["player"])
-        df = df[["player", "season", "season_salary"]]
+        df = run_parser(parse_player_contracts, fetch_html(PLAYER_CONTRACTS_URL))
         logging.info(f"Player Contracts Function Successful, retrieving {len(df)} rows")
         return df
     except Exception as error:
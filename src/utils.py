@@ -1,19 +1,40 @@
+from __future__ import annotations
+
+import hashlib
 import json
 import logging
 import os
 import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date, datetime
-from typing import Literal
+from functools import cache
+from typing import TYPE_CHECKING, Literal
 
 import numpy as np
 import pandas as pd
-import requests
 from nltk.sentiment import SentimentIntensityAnalyzer
 
+from src.circuit_breaker import CIRCUIT_OPEN_MESSAGE
+from src.http_client import get_http_client
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
 # TODO: replace w/ env var at some point. requires adding it to the ECS task in
 # terraform
 SEASON_YEAR = 2026
 
+# bounds the memory used by the sentiment score memo table, ~1 day of comments
+SENTIMENT_CACHE_SIZE = 50_000
+
+# below this many new texts, starting worker processes costs more than it saves
+SENTIMENT_PROCESS_POOL_MIN_ROWS = 5_000
+
+# columns that change every run w/o the underlying data changing
+ROW_HASH_EXCLUDED_COLUMNS = ("scrape_date", "scrape_ts", "scrape_time")
+
 
 def filter_spread(value: str) -> str:
     """Helper Function for filtering Odds Spread
@@ -80,12 +101,87 @@ def check_schedule(game_date: date | str) -> bool:
     schedule_endpoint = (
         f"https://api.jyablonski.dev/v1/league/schedule?date={game_date}"
     )
-    schedule_data = requests.get(schedule_endpoint).json()
+    schedule_data = get_http_client().get(schedule_endpoint).json()
 
     return len(schedule_data) > 0
 
 
-def add_sentiment_analysis(df: pd.DataFrame, sentiment_col: str) -> pd.DataFrame:
+@cache
+def _get_sentiment_analyzer() -> SentimentIntensityAnalyzer:
+    """Build the Vader analyzer once per process, loading the lexicon is slow."""
+    return SentimentIntensityAnalyzer()
+
+
+def _score_sentiment(text: str) -> tuple[float, float, float, float]:
+    """Score a single text, returning (compound, neg, neu, pos)."""
+    scores = _get_sentiment_analyzer().polarity_scores(text)
+    return scores["compound"], scores["neg"], scores["neu"], scores["pos"]
+
+
+# text -> its `_score_sentiment` scores, least recently used first
+_sentiment_memo: OrderedDict[str, tuple[float, float, float, float]] = OrderedDict()
+_sentiment_memo_lock = threading.Lock()
+
+
+def _clear_sentiment_memo() -> None:
+    """Forget every memoized sentiment score."""
+    with _sentiment_memo_lock:
+        _sentiment_memo.clear()
+
+
+def score_sentiment_batch(
+    texts: Sequence[str],
+    n_jobs: int = 1,
+) -> list[tuple[float, float, float, float]]:
+    """Score a batch of texts w/ nltk Vader, scoring each distinct text once.
+
+    Repeated texts (within the batch or across calls) are served from a memo
+    bounded to `SENTIMENT_CACHE_SIZE` texts. If `n_jobs` is more than 1 and
+    at least `SENTIMENT_PROCESS_POOL_MIN_ROWS` texts aren't memoized yet, they
+    are scored in a process pool instead, + the workers' scores are added to
+    the memo the same way.
+
+    Args:
+        texts (Sequence[str]): The texts to score
+
+        n_jobs (int): Number of worker processes to use for large batches.
+            Defaults to 1, which scores everything in this process.
+
+    Returns:
+        List of (compound, neg, neu, pos) tuples in the same order as `texts`
+    """
+    lookup = {}
+    with _sentiment_memo_lock:
+        for text in dict.fromkeys(texts):
+            if text in _sentiment_memo:
+                _sentiment_memo.move_to_end(text)
+                lookup[text] = _sentiment_memo[text]
+    new_texts = [text for text in dict.fromkeys(texts) if text not in lookup]
+
+    if n_jobs > 1 and len(new_texts) >= SENTIMENT_PROCESS_POOL_MIN_ROWS:
+        chunksize = max(len(new_texts) // (n_jobs * 4), 1)
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            scores = list(
+                executor.map(_score_sentiment, new_texts, chunksize=chunksize)
+            )
+    else:
+        scores = [_score_sentiment(text) for text in new_texts]
+
+    new_scores = dict(zip(new_texts, scores, strict=True))
+    with _sentiment_memo_lock:
+        _sentiment_memo.update(new_scores)
+        while len(_sentiment_memo) > SENTIMENT_CACHE_SIZE:
+            _sentiment_memo.popitem(last=False)
+
+    lookup.update(new_scores)
+    return [lookup[text] for text in texts]
+
+
+def add_sentiment_analysis(
+    df: pd.DataFrame,
+    sentiment_col: str,
+    n_jobs: int = 1,
+) -> pd.DataFrame:
     """Function to add Sentiment Analysis columns to a DataFrame via nltk Vader Lexicon.
 
     Args:
@@ -94,17 +190,21 @@ def add_sentiment_analysis(df: pd.DataFrame, sentiment_col: str) -> pd.DataFrame
         sentiment_col (str): The Column in the DataFrame to run Sentiment Analysis on
             (comments / tweets etc).
 
+        n_jobs (int): Number of worker processes to score large frames with.
+            Defaults to 1. See `score_sentiment_batch`.
+
     Returns:
         The same DataFrame but with the Sentiment Analysis columns attached.
     """
     try:
-        analyzer = SentimentIntensityAnalyzer()
-        df["compound"] = [
-            analyzer.polarity_scores(x)["compound"] for x in df[sentiment_col]
-        ]
-        df["neg"] = [analyzer.polarity_scores(x)["neg"] for x in df[sentiment_col]]
-        df["neu"] = [analyzer.polarity_scores(x)["neu"] for x in df[sentiment_col]]
-        df["pos"] = [analyzer.polarity_scores(x)["pos"] for x in df[sentiment_col]]
+        scores = np.array(
+            score_sentiment_batch(df[sentiment_col].tolist(), n_jobs=n_jobs),
+            dtype=float,
+        ).reshape(-1, 4)
+        df["compound"] = scores[:, 0]
+        df["neg"] = scores[:, 1]
+        df["neu"] = scores[:, 2]
+        df["pos"] = scores[:, 3]
         df["sentiment"] = np.where(df["compound"] > 0, 1, 0)
         return df
     except Exception as e:
@@ -149,6 +249,77 @@ def clean_player_names(name: str) -> str:
         raise
 
 
+def build_md5_key(df: pd.DataFrame, columns: Sequence[str]) -> pd.Series:
+    """Build an md5 primary key column from the concatenation of `columns`.
+
+    Lines up w/ `md5(col1 || col2 || ...)` in postgres so upserts match on it.
+    Values are stringified the same way `str()` does, so existing keys don't
+    change. The columns are concatenated in one vectorized pass and then hashed
+    in a single loop, rather than building a Series per row w/ `df.apply`.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to build keys for
+
+        columns (Sequence[str]): The columns to concatenate, in order
+
+    Returns:
+        Series of md5 hex digests aligned to `df.index`
+    """
+    if not columns:
+        raise ValueError("build_md5_key requires at least 1 column")
+
+    concatenated = df[columns[0]].astype(str)
+    for column in columns[1:]:
+        concatenated = concatenated + df[column].astype(str)
+
+    md5 = hashlib.md5
+    return pd.Series(
+        [md5(value.encode("utf8")).hexdigest() for value in concatenated.tolist()],
+        index=df.index,
+        dtype=object,
+    )
+
+
+def add_row_hash(
+    df: pd.DataFrame,
+    primary_keys: Sequence[str],
+    hash_column: str = "row_hash",
+    exclude_columns: Sequence[str] = ROW_HASH_EXCLUDED_COLUMNS,
+) -> pd.DataFrame:
+    """Add a content hash of each row's non-key columns.
+
+    The hash is computed vectorized w/ `pd.util.hash_pandas_object` and stored
+    as a signed 64 bit int so it fits in a postgres `bigint`. Scrape timestamps
+    are left out by default, so a row only gets a new hash when its data
+    actually changes.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to hash
+
+        primary_keys (Sequence[str]): Key columns, left out of the hash
+
+        hash_column (str): Name of the column to add. Defaults to `row_hash`.
+
+        exclude_columns (Sequence[str]): Other columns to leave out of the hash.
+            Defaults to the scrape date / timestamp columns.
+
+    Returns:
+        A copy of the DataFrame w/ the hash column attached
+    """
+    skipped = {*primary_keys, *exclude_columns, hash_column}
+    value_columns = [col for col in df.columns if col not in skipped]
+    if not value_columns:
+        raise ValueError("add_row_hash requires at least 1 non key column to hash")
+
+    df = df.copy()
+    df[hash_column] = (
+        pd.util.hash_pandas_object(df[value_columns], index=False)
+        .to_numpy()
+        .view("int64")
+    )
+    return df
+
+
 def write_to_sql(
     con,
     table_name: str,
@@ -197,13 +368,20 @@ def query_logs(log_file: str | os.PathLike[str] = "logs/example.log") -> list[st
     Args:
         log_file (str): Optional String of the Log File Name
 
+    Scrapers that failed bc a host's circuit breaker was open are left out,
+    the circuit breaker logs its own "Failed" line w/ the root cause once.
+
     Returns:
         list of Error Messages to be passed into Slack Function
     """
     logs = pd.read_csv(str(log_file), sep=r"\\t", engine="python", header=None)
     logs = logs.rename(columns={0: "errors"})
     logs = logs.query("errors.str.contains('Failed')", engine="python")
-    logs = logs["errors"].to_list()
+
+    skipped = logs["errors"].str.contains(CIRCUIT_OPEN_MESSAGE, regex=False)
+    if skipped.any():
+        logging.info(f"Dropping {skipped.sum()} Failed Logs caused by open circuits")
+    logs = logs.loc[~skipped, "errors"].to_list()
 
     logging.info(f"Returning {len(logs)} Failed Logs")
     return logs
@@ -238,7 +416,7 @@ def write_to_slack(
             str_dump = "\n".join(errors)
 
         if num_errors > 0:
-            response = requests.post(
+            response = get_http_client().post(
                 webhook_url,
                 data=json.dumps(
                     {
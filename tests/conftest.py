@@ -18,6 +18,7 @@ from testcontainers.postgres import PostgresContainer
 
 from src.feature_flags import FeatureFlagManager
 from src.scrapers import (
+    SHOOTING_STATS_COLUMNS,
     add_sentiment_analysis,
     get_boxscores_data,
     get_injuries_data,
@@ -132,11 +133,9 @@ def player_stats_data(mocker: MockerFixture) -> pd.DataFrame:
     with fname.open("rb") as fp:
         mock_content = fp.read()
 
-    mock_response = mocker.MagicMock()
-    # The context manager returns itself, and read() is called on that
-    mock_response.__enter__.return_value.read.return_value = mock_content
-
-    mocker.patch("src.scrapers.urllib.request.urlopen", return_value=mock_response)
+    mocker.patch(
+        "src.http_client.HttpClient.get_text", return_value=mock_content.decode()
+    )
     return get_player_stats_data()
 
 
@@ -147,12 +146,9 @@ def boxscores_data(mocker: MockerFixture) -> pd.DataFrame:
     with fname.open("rb") as fp:
         mock_content = fp.read()
 
-    mock_response = mocker.MagicMock()
-    mock_response.__enter__.return_value.read.return_value = mock_content
-
-    # old requests mock
-    # mocker.patch("src.scrapers.requests.get").return_value.content = mock_content
-    mocker.patch("src.scrapers.urllib.request.urlopen", return_value=mock_response)
+    mocker.patch(
+        "src.http_client.HttpClient.get_text", return_value=mock_content.decode()
+    )
     return get_boxscores_data()
 
 
@@ -163,6 +159,10 @@ def player_contracts_data(mocker: MockerFixture) -> pd.DataFrame:
     with fname.open("rb") as fp:
         df = pickle.load(fp)
 
+    mocker.patch(
+        "src.http_client.HttpClient.get_text",
+        return_value='<html><table id="player-contracts"></table></html>',
+    )
     mocker.patch("src.scrapers.pd.read_html").return_value = [df]
     return get_player_contracts_data()
 
@@ -174,6 +174,10 @@ def player_adv_stats_data(mocker: MockerFixture) -> pd.DataFrame:
     with fname.open("rb") as fp:
         df = pickle.load(fp)
 
+    mocker.patch(
+        "src.http_client.HttpClient.get_text",
+        return_value="<html><table></table></html>",
+    )
     mocker.patch("src.scrapers.pd.read_html").return_value = df
     return get_player_adv_stats_data()
 
@@ -185,7 +189,11 @@ def opp_stats_data(mocker: MockerFixture) -> pd.DataFrame:
     with fname.open("rb") as fp:
         df = pickle.load(fp)
 
-    mocker.patch("src.scrapers.pd.read_html").return_value = df
+    mocker.patch(
+        "src.http_client.HttpClient.get_text",
+        return_value='<html><table id="per_game-opponent"></table></html>',
+    )
+    mocker.patch("src.scrapers.pd.read_html").return_value = [df[5]]
     return get_opp_stats_data()
 
 
@@ -196,6 +204,7 @@ def injuries_data(mocker: MockerFixture) -> pd.DataFrame:
     with fname.open("rb") as fp:
         df = pickle.load(fp)
 
+    mocker.patch("src.http_client.HttpClient.get_text", return_value="<html></html>")
     mocker.patch("src.scrapers.pd.read_html").return_value = df
     return get_injuries_data()
 
@@ -207,13 +216,7 @@ def transactions_data(mocker: MockerFixture) -> pd.DataFrame:
     with fname.open("rb") as fp:
         mock_html = fp.read()
 
-    # Mock urllib.request.urlopen
-    mock_response = mocker.MagicMock()
-    mock_response.read.return_value = mock_html
-    mock_response.__enter__.return_value = mock_response
-    mock_response.__exit__.return_value = None
-
-    mocker.patch("urllib.request.urlopen", return_value=mock_response)
+    mocker.patch("src.http_client.HttpClient.get_text", return_value=mock_html.decode())
 
     return get_transactions_data()
 
@@ -225,7 +228,12 @@ def advanced_stats_data(mocker) -> pd.DataFrame:
     with fname.open("rb") as fp:
         df = pickle.load(fp)
 
-    mocker.patch("src.scrapers.pd.read_html").return_value = df
+    # bbref ships this table inside an html comment
+    mocker.patch(
+        "src.http_client.HttpClient.get_text",
+        return_value='<div><!-- <table id="advanced-team"></table> --></div>',
+    )
+    mocker.patch("src.scrapers.pd.read_html").return_value = [df[10]]
     return get_team_adv_stats_data()
 
 
@@ -236,7 +244,13 @@ def shooting_stats_data(mocker) -> pd.DataFrame:
     with fname.open("rb") as fp:
         df = pickle.load(fp)
 
-    mocker.patch("src.scrapers.pd.read_html").return_value = df
+    # the scraper only asks pandas for the columns it keeps
+    columns = list(SHOOTING_STATS_COLUMNS)
+    mocker.patch(
+        "src.http_client.HttpClient.get_text",
+        return_value="<html><table></table></html>",
+    )
+    mocker.patch("src.scrapers.pd.read_html").return_value = [df[0].iloc[:, columns]]
     return get_shooting_stats_data()
 
 
@@ -251,11 +265,7 @@ def odds_data(mocker: MockerFixture) -> pd.DataFrame:
     if not isinstance(df_list, list):
         df_list = [df_list]
 
-    mock_response = mocker.MagicMock()
-    mock_response.read.return_value = b"<html></html>"
-    mock_response.__enter__ = lambda self: self
-    mock_response.__exit__ = lambda self, *args: None
-    mocker.patch("src.scrapers.urllib.request.urlopen", return_value=mock_response)
+    mocker.patch("src.http_client.HttpClient.get_text", return_value="<html></html>")
     mocker.patch("src.scrapers._find_covers_sportsbook_column_index", return_value=2)
     mocker.patch("src.scrapers.pd.read_html", return_value=df_list)
     return get_odds_data()
@@ -272,6 +282,7 @@ def pbp_transformed_data(mocker) -> pd.DataFrame:
     with pbp_fname.open("rb") as fp:
         df = pickle.load(fp)
 
+    mocker.patch("src.http_client.HttpClient.get_text", return_value="<html></html>")
     mocker.patch("src.scrapers.pd.read_html").return_value = df
     return get_pbp_data(df=boxscores_df)
 
@@ -294,6 +305,7 @@ def schedule_data(mocker: MockerFixture) -> pd.DataFrame:
 
     # fixture was built w/ data from 2022
     mocker.patch("src.scrapers.SEASON_YEAR", 2022)
+    mocker.patch("src.http_client.HttpClient.get_text", return_value="<html></html>")
     mocker.patch("pandas.read_html").return_value = [mock_df]
 
     schedule = get_schedule_data(month_list=["february", "march"])
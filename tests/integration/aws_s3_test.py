@@ -1,10 +1,14 @@
-from datetime import datetime
+from datetime import date, datetime
+from io import BytesIO
 
 import boto3
+import numpy as np
 import pandas as pd
+import pyarrow.parquet as pq
 from moto import mock_aws
 
-from src.aws import write_to_s3
+from src.aws import write_many_to_s3, write_to_s3
+from src.html_archive import configure_html_archive
 from src.utils import get_leading_zeroes
 
 
@@ -46,3 +50,104 @@ def test_write_to_s3_empty(caplog):
     bucket = conn.Bucket(bucket_name)
     contents = [obj.key for obj in bucket.objects.all()]
     assert len(contents) == 0
+
+
+@mock_aws
+def test_write_many_to_s3(player_stats_data):
+    conn = boto3.resource("s3", region_name="us-east-1")
+    conn.create_bucket(Bucket="moto_test_bucket")
+    today = datetime.now().date()
+    month_prefix = get_leading_zeroes(today.month)
+
+    results = write_many_to_s3(
+        datasets={"stats": player_stats_data, "odds": pd.DataFrame()},
+        bucket="moto_test_bucket",
+        max_workers=2,
+    )
+
+    bucket = conn.Bucket("moto_test_bucket")
+    contents = [obj.key for obj in bucket.objects.all()]
+    assert contents == [
+        f"stats/validated/year={today.year}/month={month_prefix}/stats-{today}.parquet"
+    ]
+    assert results["stats"].rows == len(player_stats_data)
+    assert results["stats"].bytes == bucket.Object(contents[0]).content_length
+    assert results["stats"].error is None
+    assert results["odds"].skipped
+
+
+@mock_aws
+def test_write_many_to_s3_counts_multipart_upload_bytes():
+    conn = boto3.resource("s3", region_name="us-east-1")
+    conn.create_bucket(Bucket="moto_test_bucket")
+    # random floats barely compress, so the file is written in several parts
+    df = pd.DataFrame({"pts": np.random.default_rng(0).random(1_000_000)})
+
+    results = write_many_to_s3(
+        datasets={"stats": df}, date=date(2026, 1, 5), bucket="moto_test_bucket"
+    )
+
+    key = "stats/validated/year=2026/month=01/stats-2026-01-05.parquet"
+    assert results["stats"].bytes > 5 * 1024 * 1024
+    assert results["stats"].bytes == conn.Object("moto_test_bucket", key).content_length
+
+
+@mock_aws
+def test_write_many_to_s3_matches_write_to_s3_output(player_stats_data):
+    conn = boto3.resource("s3", region_name="us-east-1")
+    conn.create_bucket(Bucket="serial_bucket")
+    conn.create_bucket(Bucket="parallel_bucket")
+    df = player_stats_data.set_index(pd.RangeIndex(100, 100 + len(player_stats_data)))
+
+    write_to_s3("stats", df, bucket="serial_bucket")
+    write_many_to_s3(datasets={"stats": df}, bucket="parallel_bucket")
+
+    serial, parallel = (
+        pq.read_table(BytesIO(obj.get()["Body"].read()))
+        for name in ["serial_bucket", "parallel_bucket"]
+        for obj in conn.Bucket(name).objects.all()
+    )
+    assert parallel.schema.equals(serial.schema, check_metadata=True)
+    assert parallel.equals(serial)
+
+
+@mock_aws
+def test_html_archive_round_trips_pages_through_s3():
+    conn = boto3.resource("s3", region_name="us-east-1")
+    conn.create_bucket(Bucket="moto_test_bucket")
+    url = "https://www.covers.com/sport/basketball/nba/odds"
+
+    archive = configure_html_archive("s3://moto_test_bucket/html")
+    assert archive is not None
+    page = archive.save(url, "<table>odds</table>", fetched_at=datetime(2026, 1, 5))
+    archive.save(url, "<table>later odds</table>", fetched_at=datetime(2026, 1, 6))
+    replay = configure_html_archive(
+        "s3://moto_test_bucket/html", replay=True, as_of=date(2026, 1, 5)
+    )
+    assert replay is not None
+
+    try:
+        assert replay.load(url) == "<table>odds</table>"
+        assert page.path == (
+            "s3://moto_test_bucket/html/source=www.covers.com/date=2026-01-05/"
+            f"{page.sha256}.html.gz"
+        )
+    finally:
+        configure_html_archive(None)
+
+
+@mock_aws
+def test_write_many_to_s3_uses_the_replayed_date(tmp_path, player_stats_data):
+    conn = boto3.resource("s3", region_name="us-east-1")
+    conn.create_bucket(Bucket="moto_test_bucket")
+    configure_html_archive(tmp_path, replay=True, as_of=date(2025, 1, 15))
+
+    try:
+        write_many_to_s3(
+            datasets={"stats": player_stats_data}, bucket="moto_test_bucket"
+        )
+    finally:
+        configure_html_archive(None)
+
+    contents = [obj.key for obj in conn.Bucket("moto_test_bucket").objects.all()]
+    assert contents == ["stats/validated/year=2025/month=01/stats-2025-01-15.parquet"]
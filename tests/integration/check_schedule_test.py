@@ -43,7 +43,7 @@ if TYPE_CHECKING:
     ],
 )
 def test_check_schedule(mocker: MockerFixture, date, mock_input, expected):
-    mock_get = mocker.patch("src.utils.requests.get")
+    mock_get = mocker.patch("src.http_client.HttpClient.get")
     mock_get.return_value.json.return_value = mock_input
     is_games_played = check_schedule(game_date=date)
     mock_get.assert_called_once_with(
@@ -0,0 +1,167 @@
+from typing import Any
+
+import pandas as pd
+import pytest
+
+from src.database import write_to_sql_upsert_copy
+from tests.utils.db_assertions import assert_db_row_count_change
+
+PBP_PRIMARY_KEYS = [
+    "hometeam",
+    "awayteam",
+    "date",
+    "timequarter",
+    "numberperiod",
+    "descriptionplayvisitor",
+    "descriptionplayhome",
+]
+
+
+def test_pbp_copy_upsert(postgres_conn, pbp_transformed_data):
+    # run inside a savepoint so the other pbp tests still see the seed data
+    savepoint = postgres_conn.begin_nested()
+    try:
+        assert_db_row_count_change(
+            conn=postgres_conn,
+            table="bbref_player_pbp",
+            schema="bronze",
+            expected_before=1,
+            expected_after=100,
+            writer=write_to_sql_upsert_copy,
+            writer_kwargs={
+                "conn": postgres_conn,
+                "table": "bbref_player_pbp",
+                "schema": "bronze",
+                "df": pbp_transformed_data,
+                "primary_keys": PBP_PRIMARY_KEYS,
+                "update_timestamp_field": "modified_at",
+            },
+        )
+    finally:
+        savepoint.rollback()
+
+
+def test_copy_upsert_updates_existing_rows_and_dedupes(postgres_conn):
+    savepoint = postgres_conn.begin_nested()
+    try:
+        df = pd.DataFrame(
+            {
+                "team": ["Miami Heat*", "Miami Heat*", "Boston Celtics"],
+                "fg_percent_opp": [0.5, 0.5, 0.45],
+                "threep_percent_opp": [0.35, 0.35, None],
+                "threep_made_opp": [12.0, 12.0, 11.5],
+                "ppg_opp": [110.1, 110.1, 108.0],
+            }
+        )
+
+        write_to_sql_upsert_copy(
+            conn=postgres_conn,
+            table="bbref_team_opponent_shooting_stats",
+            schema="bronze",
+            df=df,
+            primary_keys=["team"],
+            update_timestamp_field="modified_at",
+        )
+
+        result = pd.read_sql_query(
+            sql="SELECT team, fg_percent_opp, threep_percent_opp "
+            "FROM bronze.bbref_team_opponent_shooting_stats ORDER BY team",
+            con=postgres_conn,
+        )
+        assert result["team"].tolist() == ["Boston Celtics", "Miami Heat*"]
+        assert result["fg_percent_opp"].tolist() == [0.45, 0.5]
+        assert pd.isna(result["threep_percent_opp"][0])
+    finally:
+        savepoint.rollback()
+
+
+def test_copy_upsert_skips_empty_dataframe(mocker):
+    conn = mocker.MagicMock()
+
+    write_to_sql_upsert_copy(
+        conn=conn,
+        table="bbref_player_pbp",
+        schema="bronze",
+        df=pd.DataFrame(),
+        primary_keys=PBP_PRIMARY_KEYS,
+    )
+
+    conn.connection.cursor.assert_not_called()
+
+
+def test_copy_upsert_keeps_last_duplicate_and_sets_update_timestamp(postgres_conn):
+    savepoint = postgres_conn.begin_nested()
+    try:
+        df = pd.DataFrame(
+            {
+                "team": ["Miami Heat*", "Miami Heat*"],
+                "fg_percent_opp": [0.5, 0.55],
+                "threep_percent_opp": [0.35, 0.36],
+                "threep_made_opp": [12.0, 12.5],
+                "ppg_opp": [110.1, 111.0],
+                "modified_at": pd.to_datetime(["2020-01-01", "2020-01-01"]),
+            }
+        )
+        kwargs: dict[str, Any] = {
+            "conn": postgres_conn,
+            "table": "bbref_team_opponent_shooting_stats",
+            "schema": "bronze",
+            "primary_keys": ["team"],
+            "update_timestamp_field": "modified_at",
+        }
+
+        write_to_sql_upsert_copy(df=df, **kwargs)
+        write_to_sql_upsert_copy(df=df, **kwargs)
+
+        result = pd.read_sql_query(
+            sql="SELECT fg_percent_opp, modified_at "
+            "FROM bronze.bbref_team_opponent_shooting_stats "
+            "WHERE team = 'Miami Heat*'",
+            con=postgres_conn,
+        )
+        assert result["fg_percent_opp"].tolist() == [0.55]
+        assert result["modified_at"][0] > pd.Timestamp("2020-01-01")
+    finally:
+        savepoint.rollback()
+
+
+def test_copy_upsert_creates_missing_table_and_constraint(postgres_conn):
+    savepoint = postgres_conn.begin_nested()
+    try:
+        kwargs: dict[str, Any] = {
+            "conn": postgres_conn,
+            "table": "copy_upsert_new_table",
+            "schema": "bronze",
+            "primary_keys": ["id"],
+        }
+
+        write_to_sql_upsert_copy(
+            df=pd.DataFrame({"id": [1, 2], "x": ["a", "b"]}), **kwargs
+        )
+        write_to_sql_upsert_copy(
+            df=pd.DataFrame({"id": [2, 3], "x": ["c", "d"]}), **kwargs
+        )
+
+        result = pd.read_sql_query(
+            sql="SELECT id, x FROM bronze.copy_upsert_new_table ORDER BY id",
+            con=postgres_conn,
+        )
+        assert result["id"].tolist() == [1, 2, 3]
+        assert result["x"].tolist() == ["a", "c", "d"]
+    finally:
+        savepoint.rollback()
+
+
+def test_copy_upsert_rejects_missing_primary_keys(mocker):
+    conn = mocker.MagicMock()
+
+    with pytest.raises(ValueError, match="Primary Key"):
+        write_to_sql_upsert_copy(
+            conn=conn,
+            table="bbref_player_pbp",
+            schema="bronze",
+            df=pd.DataFrame({"hometeam": ["BOS"]}),
+            primary_keys=PBP_PRIMARY_KEYS,
+        )
+
+    conn.connection.cursor.assert_not_called()
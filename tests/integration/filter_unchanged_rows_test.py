@@ -0,0 +1,145 @@
+from datetime import datetime
+from typing import Any
+
+import pandas as pd
+from sqlalchemy import inspect
+
+from src.database import (
+    filter_unchanged_rows,
+    filter_unchanged_rows_by_hash,
+    write_to_sql_upsert_copy,
+)
+
+
+def test_filter_unchanged_rows_returns_only_new_or_changed_rows(postgres_conn):
+    # run inside a savepoint so the contracts tests still see the seed data
+    savepoint = postgres_conn.begin_nested()
+    try:
+        postgres_conn.exec_driver_sql(
+            "INSERT INTO bronze.bbref_player_contracts "
+            "(player, season, season_salary) VALUES "
+            "('Stephen Curry', '2025-26', 59606817), "
+            "('Joel Embiid', '2025-26', 55224526)"
+        )
+        df = pd.DataFrame(
+            {
+                "player": ["Stephen Curry", "Joel Embiid", "Kevin Durant"],
+                "season": ["2025-26", "2025-26", "2025-26"],
+                "season_salary": [60000000, 55224526, 54708609],
+            },
+            index=pd.Index([5, 6, 7]),
+        )
+
+        result = filter_unchanged_rows(
+            conn=postgres_conn,
+            schema="bronze",
+            table="bbref_player_contracts",
+            df=df,
+            primary_keys=["player", "season"],
+            compare_columns=["season_salary"],
+        )
+
+        assert result["player"].tolist() == ["Stephen Curry", "Kevin Durant"]
+        assert result.index.tolist() == [0, 1]
+    finally:
+        savepoint.rollback()
+
+
+def test_filter_unchanged_rows_treats_nulls_as_unchanged(postgres_conn):
+    savepoint = postgres_conn.begin_nested()
+    try:
+        postgres_conn.exec_driver_sql(
+            "INSERT INTO bronze.bbref_player_contracts "
+            "(player, season, season_salary) VALUES ('Two Way Guy', '2025-26', NULL)"
+        )
+        df = pd.DataFrame(
+            {
+                "player": ["Two Way Guy"],
+                "season": ["2025-26"],
+                "season_salary": [None],
+            }
+        )
+
+        result = filter_unchanged_rows(
+            conn=postgres_conn,
+            schema="bronze",
+            table="bbref_player_contracts",
+            df=df,
+            primary_keys=["player", "season"],
+            compare_columns=["season_salary"],
+        )
+
+        assert result.empty
+    finally:
+        savepoint.rollback()
+
+
+def test_filter_unchanged_rows_by_hash_skips_rows_already_stored(postgres_conn):
+    savepoint = postgres_conn.begin_nested()
+    try:
+        df = pd.DataFrame(
+            {
+                "team": ["Boston Celtics", "Miami Heat"],
+                "fg_percent_opp": [0.45, 0.447],
+                "threep_percent_opp": [0.35, 0.339],
+                "threep_made_opp": [12.0, 13.0],
+                "ppg_opp": [108.0, 105.6],
+                "scrape_date": [datetime.now().date()] * 2,
+            }
+        )
+        kwargs: dict[str, Any] = {
+            "conn": postgres_conn,
+            "schema": "bronze",
+            "table": "bbref_team_opponent_shooting_stats",
+            "primary_keys": ["team"],
+        }
+
+        first_run = filter_unchanged_rows_by_hash(df=df, **kwargs)
+        write_to_sql_upsert_copy(
+            df=first_run, update_timestamp_field="modified_at", **kwargs
+        )
+
+        df.loc[1, "ppg_opp"] = 106.2
+        second_run = filter_unchanged_rows_by_hash(df=df, **kwargs)
+
+        assert len(first_run) == 2
+        assert second_run["team"].tolist() == ["Miami Heat"]
+    finally:
+        savepoint.rollback()
+
+
+def test_filter_unchanged_rows_by_hash_adds_a_missing_hash_column(postgres_conn):
+    savepoint = postgres_conn.begin_nested()
+    try:
+        # tables created before row hashing don't have the column yet
+        postgres_conn.exec_driver_sql(
+            "ALTER TABLE bronze.bbref_player_injuries DROP COLUMN row_hash"
+        )
+        df = pd.DataFrame(
+            {
+                "player": ["Jayson Tatum"],
+                "team": ["Boston Celtics"],
+                "date": ["Mon, Jan 5, 2026"],
+                "description": ["Out (Achilles) - Tatum is out for the season."],
+                "scrape_date": [datetime.now().date()],
+            }
+        )
+
+        result = filter_unchanged_rows_by_hash(
+            conn=postgres_conn,
+            schema="bronze",
+            table="bbref_player_injuries",
+            df=df,
+            primary_keys=["player", "team", "description"],
+        )
+
+        columns = {
+            column["name"]
+            for column in inspect(postgres_conn).get_columns(
+                "bbref_player_injuries", "bronze"
+            )
+        }
+        assert "row_hash" in columns
+        assert result["player"].tolist() == ["Jayson Tatum"]
+    finally:
+        savepoint.rollback()
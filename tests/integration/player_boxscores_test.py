@@ -13,14 +13,13 @@ def test_get_boxscores_data_no_games_played(mocker, caplog):
     with fname.open("rb") as fp:
         mock_content = fp.read()
 
-    mock_response = mocker.MagicMock()
-    mock_response.__enter__.return_value.read.return_value = mock_content
-
-    mocker.patch("src.scrapers.urllib.request.urlopen", return_value=mock_response)
+    mocker.patch(
+        "src.http_client.HttpClient.get_text", return_value=mock_content.decode()
+    )
 
     mock_json = mocker.MagicMock()
     mock_json.return_value = []
-    mocker.patch("src.utils.requests.get").return_value.json = mock_json
+    mocker.patch("src.http_client.HttpClient.get").return_value.json = mock_json
 
     # Clear existing logs and enable log capturing
     caplog.clear()
@@ -40,14 +39,13 @@ def test_get_boxscores_data_no_data_available(mocker, schedule_mock_data, caplog
     with fname.open("rb") as fp:
         mock_content = fp.read()
 
-    mock_response = mocker.MagicMock()
-    mock_response.__enter__.return_value.read.return_value = mock_content
-
-    mocker.patch("src.scrapers.urllib.request.urlopen", return_value=mock_response)
+    mocker.patch(
+        "src.http_client.HttpClient.get_text", return_value=mock_content.decode()
+    )
 
     mock_json = mocker.MagicMock()
     mock_json.return_value = schedule_mock_data
-    mocker.patch("src.utils.requests.get").return_value.json = mock_json
+    mocker.patch("src.http_client.HttpClient.get").return_value.json = mock_json
 
     # Clear existing logs and enable log capturing
     caplog.clear()
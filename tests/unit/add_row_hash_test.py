@@ -0,0 +1,40 @@
+from datetime import date, datetime
+
+import pandas as pd
+import pytest
+
+from src.utils import add_row_hash
+
+
+def test_add_row_hash_ignores_keys_and_scrape_columns():
+    df = pd.DataFrame(
+        {
+            "team": ["Boston Celtics", "Miami Heat"],
+            "ppg_opp": [105.6, 105.6],
+            "scrape_date": [date(2026, 1, 1), date(2026, 1, 2)],
+            "scrape_ts": [datetime(2026, 1, 1, 5), datetime(2026, 1, 2, 5)],
+        }
+    )
+
+    hashed = add_row_hash(df, primary_keys=["team"])
+
+    assert "row_hash" not in df.columns
+    assert hashed["row_hash"].dtype == "int64"
+    assert hashed["row_hash"][0] == hashed["row_hash"][1]
+
+
+def test_add_row_hash_changes_when_values_change():
+    df = pd.DataFrame({"team": ["Boston Celtics"], "ppg_opp": [105.6]})
+    changed = pd.DataFrame({"team": ["Boston Celtics"], "ppg_opp": [105.7]})
+
+    first = add_row_hash(df, primary_keys=["team"])["row_hash"][0]
+    rerun = add_row_hash(df, primary_keys=["team"])["row_hash"][0]
+    second = add_row_hash(changed, primary_keys=["team"])["row_hash"][0]
+
+    assert first == rerun
+    assert first != second
+
+
+def test_add_row_hash_raises_without_value_columns():
+    with pytest.raises(ValueError, match="at least 1 non key column"):
+        add_row_hash(pd.DataFrame({"team": ["Boston Celtics"]}), primary_keys=["team"])
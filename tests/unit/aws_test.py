@@ -1,6 +1,8 @@
+from datetime import date
+
 import pandas as pd
 
-from src.aws import write_to_s3
+from src.aws import write_many_to_s3, write_to_s3
 
 
 def test_write_to_s3_handles_error(mocker):
@@ -10,3 +12,24 @@ def test_write_to_s3_handles_error(mocker):
     )
 
     write_to_s3("player_contracts", pd.DataFrame({"player": ["Stephen Curry"]}))
+
+
+def test_write_many_to_s3_records_errors_and_skips(mocker):
+    mocker.patch("src.aws.wr.s3.to_parquet", side_effect=Exception("s3 upload failed"))
+
+    results = write_many_to_s3(
+        datasets={
+            "player_contracts": pd.DataFrame({"player": ["Stephen Curry"]}),
+            "odds": pd.DataFrame(),
+        },
+        date=date(2026, 1, 5),
+        bucket="test_bucket",
+    )
+
+    assert list(results) == ["player_contracts", "odds"]
+    assert results["player_contracts"].error == "s3 upload failed"
+    assert results["player_contracts"].bytes == 0
+    assert results["odds"].skipped
+    assert results["odds"].path == (
+        "s3://test_bucket/odds/validated/year=2026/month=01/odds-2026-01-05.parquet"
+    )
@@ -0,0 +1,63 @@
+import json
+
+import click
+import pytest
+
+from scripts.benchmark_parsers import (
+    BASELINE_PATH,
+    build_cases,
+    compare_to_baseline,
+    run_cases,
+)
+
+
+def test_benchmark_cases_parse_every_fixture_offline():
+    cases = build_cases()
+    baseline = json.loads(BASELINE_PATH.read_text())
+
+    assert set(cases) == set(baseline["cases"])
+    for name, run in cases.items():
+        assert len(run()) == baseline["cases"][name]["rows"], name
+
+
+def test_run_cases_rejects_unknown_case():
+    with pytest.raises(click.BadParameter, match="Unknown benchmark cases"):
+        run_cases(repeat=1, only=["not_a_scraper"])
+
+
+def test_compare_to_baseline_flags_only_large_regressions():
+    baseline = {
+        "cases": {
+            "boxscores": {"wall_ms": 40.0, "cpu_ms": 40.0, "peak_kib": 2000.0},
+            "injuries": {"wall_ms": 2.0, "cpu_ms": 2.0, "peak_kib": 40.0},
+        }
+    }
+    results = {
+        "cases": {
+            "boxscores": {"wall_ms": 90.0, "cpu_ms": 50.0, "peak_kib": 3000.0},
+            # 3x slower, but still under the minimum ms that counts as a regression
+            "injuries": {"wall_ms": 6.0, "cpu_ms": 6.0, "peak_kib": 40.0},
+            "odds": {"wall_ms": 10.0, "cpu_ms": 10.0, "peak_kib": 100.0},
+        }
+    }
+
+    regressions = compare_to_baseline(
+        results, baseline, threshold=0.5, memory_threshold=0.2
+    )
+
+    assert len(regressions) == 2
+    assert regressions[0].startswith("boxscores wall_ms regressed from 40.0 to 90.0")
+    assert regressions[1].startswith("boxscores peak_kib regressed")
+
+
+def test_compare_to_baseline_refuses_another_python_version():
+    case = {"wall_ms": 1.0, "cpu_ms": 1.0, "peak_kib": 1.0}
+    baseline = {"python": "3.14.0", "cases": {"odds": case}}
+    results = {"python": "3.13.5", "cases": {"odds": case}}
+
+    regressions = compare_to_baseline(
+        results, baseline, threshold=0.5, memory_threshold=0.2
+    )
+
+    assert len(regressions) == 1
+    assert "recorded on Python 3.14.0" in regressions[0]
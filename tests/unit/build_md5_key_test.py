@@ -0,0 +1,50 @@
+import hashlib
+
+import pandas as pd
+import pytest
+
+from src.utils import build_md5_key
+
+
+def test_build_md5_key_matches_postgres_md5():
+    # row + md5_pk taken from the reddit_comments seed data in postgres_bootstrap.sql
+    df = pd.DataFrame(
+        {
+            "author": ["cosmicdave86"],
+            "comment": ["Hah. No way."],
+            "url": [
+                "https://www.reddit.com/r/nba/comments/ubkeiw/james_alexander_i_think_this_whole_nets/"
+            ],
+        }
+    )
+
+    keys = build_md5_key(df, ["author", "comment", "url"])
+
+    assert keys.tolist() == ["41b96f29ea2e52b6f371f96c66cb44dd"]
+
+
+def test_build_md5_key_matches_row_wise_hash():
+    df = pd.DataFrame(
+        {
+            "author": ["a", "Jokić", None],
+            "comment": ["x", "triple double 🃏", "deleted"],
+            "score": [1, 2, 3],
+        },
+        index=pd.Index([10, 20, 30]),
+    )
+
+    expected = df.apply(
+        lambda x: hashlib.md5(
+            (str(x["author"]) + str(x["comment"]) + str(x["score"])).encode("utf8")
+        ).hexdigest(),
+        axis=1,
+    )
+
+    pd.testing.assert_series_equal(
+        build_md5_key(df, ["author", "comment", "score"]), expected
+    )
+
+
+def test_build_md5_key_raises_without_columns():
+    with pytest.raises(ValueError, match="at least 1 column"):
+        build_md5_key(pd.DataFrame({"a": [1]}), [])
@@ -0,0 +1,95 @@
+import pytest
+
+from src.circuit_breaker import CircuitBreaker, CircuitOpenError
+from src.http_client import HttpClient
+
+HOST = "www.basketball-reference.com"
+URL = f"https://{HOST}/leagues/NBA_2026_advanced.html"
+
+
+def test_circuit_breaker_opens_after_threshold_and_logs_root_cause_once(
+    mock_logging,
+):
+    now = [0.0]
+    breaker = CircuitBreaker(
+        host=HOST, failure_threshold=3, cooldown_seconds=60, clock=lambda: now[0]
+    )
+
+    for _ in range(4):
+        breaker.record_failure("status code 429")
+
+    assert breaker.is_open
+    with pytest.raises(CircuitOpenError, match="circuit is open"):
+        breaker.before_request(URL)
+    assert mock_logging.text.count(f"Requests to {HOST} Failed") == 1
+
+    now[0] = 61
+    breaker.before_request(URL)
+    breaker.record_success()
+
+    assert not breaker.is_open
+    assert breaker.skipped_requests == 1
+
+
+def test_circuit_breaker_reopens_when_trial_request_fails():
+    now = [0.0]
+    breaker = CircuitBreaker(
+        host=HOST, failure_threshold=2, cooldown_seconds=60, clock=lambda: now[0]
+    )
+    breaker.record_failure("status code 403")
+    breaker.record_failure("status code 403")
+
+    now[0] = 61
+    breaker.before_request(URL)
+    breaker.record_failure("status code 403")
+
+    assert breaker.is_open
+
+
+def test_http_client_fast_fails_once_the_circuit_opens(mocker):
+    client = HttpClient(max_retries=0, host_rate_limits={}, failure_threshold=2)
+    response = mocker.MagicMock(status_code=403, headers={})
+    mock_request = mocker.patch.object(client.session, "request", return_value=response)
+
+    client.get(URL)
+    client.get(URL)
+    with pytest.raises(CircuitOpenError):
+        client.get_text(URL)
+
+    assert mock_request.call_count == 2
+
+
+def test_circuit_breaker_lets_exactly_one_trial_request_through():
+    now = [0.0]
+    breaker = CircuitBreaker(
+        host=HOST, failure_threshold=1, cooldown_seconds=60, clock=lambda: now[0]
+    )
+    breaker.record_failure("status code 429")
+
+    now[0] = 61
+    assert breaker.before_request(URL) is True
+    for _ in range(3):
+        with pytest.raises(CircuitOpenError, match="waiting on the trial request"):
+            breaker.before_request(URL)
+
+    breaker.record_success()
+
+    assert breaker.before_request(URL) is False
+    assert breaker.skipped_requests == 3
+
+
+def test_circuit_breaker_gives_up_on_a_trial_that_never_reports_back():
+    now = [0.0]
+    breaker = CircuitBreaker(
+        host=HOST, failure_threshold=1, cooldown_seconds=60, clock=lambda: now[0]
+    )
+    breaker.record_failure("status code 429")
+
+    now[0] = 61
+    assert breaker.before_request(URL) is True
+    now[0] = 120
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request(URL)
+
+    now[0] = 121
+    assert breaker.before_request(URL) is True
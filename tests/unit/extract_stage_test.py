@@ -0,0 +1,108 @@
+import threading
+
+import pandas as pd
+import pytest
+
+from src.decorators import check_feature_flag_decorator
+from src.extract import ExtractTask, run_extract_stage
+
+
+def test_run_extract_stage_passes_upstream_results_to_children():
+    def parent():
+        return pd.DataFrame({"url": ["a", "b"]})
+
+    def child(urls):
+        return pd.DataFrame({"url": list(urls), "seen": True})
+
+    results = run_extract_stage(
+        tasks=[
+            ExtractTask(
+                name="child",
+                func=child,
+                depends_on=("parent",),
+                upstream_kwargs=lambda results: {"urls": results["parent"]["url"]},
+            ),
+            ExtractTask(name="parent", func=parent),
+        ]
+    )
+
+    assert list(results) == ["child", "parent"]
+    assert results["child"]["url"].tolist() == ["a", "b"]
+
+
+def test_run_extract_stage_runs_independent_tasks_concurrently():
+    barrier = threading.Barrier(2, timeout=5)
+
+    def scraper():
+        # deadlocks (and raises BrokenBarrierError) if run one after another
+        barrier.wait()
+        return pd.DataFrame({"foo": [1]})
+
+    results = run_extract_stage(
+        tasks=[
+            ExtractTask(name="first", func=scraper),
+            ExtractTask(name="second", func=scraper),
+        ],
+        max_workers=2,
+    )
+
+    assert not results["first"].empty
+    assert not results["second"].empty
+
+
+def test_run_extract_stage_prunes_children_of_disabled_parent(mocker):
+    mocker.patch("src.extract.FeatureFlagManager.get", return_value=0)
+    child = mocker.MagicMock(return_value=pd.DataFrame({"foo": [1]}))
+
+    @check_feature_flag_decorator(flag_name="reddit_posts")
+    def parent():
+        return pd.DataFrame({"url": ["a"]})
+
+    results = run_extract_stage(
+        tasks=[
+            ExtractTask(name="parent", func=parent),
+            ExtractTask(name="child", func=child, depends_on=("parent",)),
+        ]
+    )
+
+    assert results["parent"].empty
+    assert results["child"].empty
+    child.assert_not_called()
+
+
+def test_run_extract_stage_returns_empty_dataframe_on_failure(mock_logging):
+    def broken():
+        raise Exception("scrape failed")
+
+    results = run_extract_stage(tasks=[ExtractTask(name="broken", func=broken)])
+
+    assert results["broken"].empty
+    assert "Extract Task broken Failed, scrape failed" in mock_logging.text
+
+
+@pytest.mark.parametrize(
+    "tasks,match",
+    [
+        (
+            [
+                ExtractTask(name="a", func=pd.DataFrame, depends_on=("b",)),
+                ExtractTask(name="b", func=pd.DataFrame, depends_on=("a",)),
+            ],
+            "dependency cycle",
+        ),
+        (
+            [ExtractTask(name="a", func=pd.DataFrame, depends_on=("missing",))],
+            "unknown tasks",
+        ),
+        (
+            [
+                ExtractTask(name="a", func=pd.DataFrame),
+                ExtractTask(name="a", func=pd.DataFrame),
+            ],
+            "Duplicate extract task names",
+        ),
+    ],
+)
+def test_run_extract_stage_validates_tasks(tasks, match):
+    with pytest.raises(ValueError, match=match):
+        run_extract_stage(tasks=tasks)
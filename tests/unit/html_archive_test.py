@@ -0,0 +1,97 @@
+import gzip
+from datetime import date, datetime
+
+import pytest
+
+from src.html_archive import (
+    HtmlArchive,
+    PageNotArchivedError,
+    configure_html_archive,
+    get_html_archive,
+    get_run_datetime,
+)
+from src.page_cache import fetch_html
+
+URL = "https://www.basketball-reference.com/friv/dailyleaders.fcgi?month=06&day=22"
+
+
+@pytest.fixture
+def archive_dir(tmp_path):
+    yield tmp_path / "archive"
+    configure_html_archive(None)
+
+
+def test_save_stores_compressed_content_addressed_pages(archive_dir):
+    archive = HtmlArchive(archive_dir)
+    fetched_at = datetime(2025, 6, 23, 8)
+
+    first = archive.save(URL, "<table>Jayson Tatum</table>", fetched_at=fetched_at)
+    second = archive.save(URL, "<table>Jayson Tatum</table>", fetched_at=fetched_at)
+
+    partition = archive_dir / "source=www.basketball-reference.com" / "date=2025-06-23"
+    pages = list(partition.glob("*.html.gz"))
+    assert first.sha256 == second.sha256
+    assert pages == [partition / f"{first.sha256}.html.gz"]
+    assert gzip.decompress(pages[0].read_bytes()) == b"<table>Jayson Tatum</table>"
+    assert first.compressed_bytes > 0
+
+
+def test_load_returns_the_latest_capture(archive_dir):
+    archive = HtmlArchive(archive_dir)
+    archive.save(URL, "<p>old</p>", fetched_at=datetime(2025, 6, 23))
+    archive.save(URL, "<p>new</p>", fetched_at=datetime(2025, 6, 24))
+
+    replay = HtmlArchive(archive_dir, replay=True)
+
+    assert replay.load(URL) == "<p>new</p>"
+    with pytest.raises(PageNotArchivedError):
+        replay.load("https://www.basketball-reference.com/friv/injuries.fcgi")
+
+
+def test_fetch_html_archives_downloads_and_replays_without_network(mocker, archive_dir):
+    get_text = mocker.patch(
+        "src.http_client.HttpClient.get_text", return_value="<p>live</p>"
+    )
+    configure_html_archive(archive_dir)
+
+    assert fetch_html(URL) == "<p>live</p>"
+    assert get_text.call_count == 1
+
+    configure_html_archive(archive_dir, replay=True)
+
+    assert fetch_html(URL) == "<p>live</p>"
+    assert get_text.call_count == 1
+    archive = get_html_archive()
+    assert archive is not None
+    assert archive.replay
+
+
+def test_load_as_of_picks_the_latest_capture_on_or_before_that_date(archive_dir):
+    archive = HtmlArchive(archive_dir)
+    archive.save(URL, "<p>23rd</p>", fetched_at=datetime(2025, 6, 23))
+    archive.save(URL, "<p>25th</p>", fetched_at=datetime(2025, 6, 25))
+
+    def replay_as_of(day: int) -> HtmlArchive:
+        return HtmlArchive(archive_dir, replay=True, as_of=date(2025, 6, day))
+
+    assert replay_as_of(23).load(URL) == "<p>23rd</p>"
+    assert replay_as_of(24).load(URL) == "<p>23rd</p>"
+    assert replay_as_of(25).load(URL) == "<p>25th</p>"
+    # no falling back to a capture from after the as of date
+    with pytest.raises(PageNotArchivedError, match="on or before 2025-06-22"):
+        replay_as_of(22).load(URL)
+
+
+def test_get_run_datetime_uses_the_replayed_date(archive_dir):
+    assert get_run_datetime().date() == datetime.now().date()
+
+    configure_html_archive(archive_dir, replay=True, as_of=date(2025, 6, 23))
+
+    assert get_run_datetime().date() == date(2025, 6, 23)
+
+
+def test_replay_requires_an_archive():
+    with pytest.raises(ValueError, match="needs an html archive"):
+        configure_html_archive(None, replay=True)
+    with pytest.raises(ValueError, match="only applies in replay mode"):
+        configure_html_archive("archive", as_of=date(2025, 6, 23))
@@ -0,0 +1,123 @@
+from io import StringIO
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from bs4 import BeautifulSoup
+
+from src.html_tables import (
+    extract_table,
+    find_table_html,
+    project_table_columns,
+    slice_table_html,
+)
+
+FIXTURES_DIR = Path(__file__).parent.parent / "fixtures"
+
+
+@pytest.mark.parametrize("fixture", ["stats_html.html", "boxscores_html.html"])
+def test_extract_table_matches_beautifulsoup_layout(fixture):
+    html = (FIXTURES_DIR / fixture).read_text(encoding="utf-8")
+    soup = BeautifulSoup(html, "html.parser")
+    headers = [th.get_text() for th in soup.find_all("tr", limit=2)[0].find_all("th")]
+    rows = [[td.get_text() for td in row.find_all("td")] for row in soup("tr")[1:]]
+    expected = pd.DataFrame(rows, columns=pd.Index(headers[1:]))
+
+    result = extract_table(html).to_frame()
+
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_extract_table_pads_short_rows_and_allows_renamed_headers():
+    html = """
+    <table>
+        <tr><th>Rk</th><th>Player</th><th></th><th>PTS</th></tr>
+        <tr><th>1</th><td><a>Jayson Tatum</a></td><td>@</td><td>30</td></tr>
+        <tr class="thead"></tr>
+    </table>
+    """
+
+    table = extract_table(html)
+    df = table.to_frame(["Player", "Location", "PTS"])
+
+    assert table.headers == ["Player", "", "PTS"]
+    assert len(table) == 2
+    assert df.iloc[0].tolist() == ["Jayson Tatum", "@", "30"]
+    assert df.iloc[1].isna().all()
+
+
+def test_extract_table_raises_index_error_without_rows():
+    html = (FIXTURES_DIR / "boxscores_no_data.html").read_text(encoding="utf-8")
+
+    with pytest.raises(IndexError):
+        extract_table(html)
+
+
+def test_find_table_html_selects_by_id_including_commented_tables():
+    html = """
+    <div><table id="per_game-team"><tr><td>team</td></tr></table></div>
+    <div><table id="per_game-opponent"><tr><td>opponent</td></tr></table></div>
+    <div class="placeholder"><!--
+        <table id="advanced-team"><tr><td>advanced</td></tr></table>
+    --></div>
+    """
+
+    opponent = pd.read_html(StringIO(find_table_html(html, "per_game-opponent")))[0]
+    advanced = pd.read_html(StringIO(find_table_html(html, "advanced-team")))[0]
+
+    assert opponent.iloc[0, 0] == "opponent"
+    assert advanced.iloc[0, 0] == "advanced"
+    with pytest.raises(ValueError, match="Table shooting-team not found"):
+        find_table_html(html, "shooting-team")
+
+
+def test_slice_table_html_handles_nested_and_commented_tables():
+    html = """
+    <div><!-- <table id="commented"><tr><td>hidden</td></tr></table> --></div>
+    <table data-id="stats"><tr><td>decoy</td></tr></table>
+    <table class="sortable" id="stats">
+        <tr><td><table><tr><td>nested</td></tr></table></td></tr>
+    </table>
+    <p>footer</p>
+    """
+
+    sliced = slice_table_html(html, "stats")
+    first = slice_table_html(html)
+    commented = slice_table_html(html, "commented")
+
+    assert sliced is not None
+    assert sliced.startswith('<table class="sortable" id="stats">')
+    assert sliced.endswith("</td></tr></table></td></tr>\n    </table>")
+    assert first is not None
+    assert "decoy" in first
+    assert commented is not None
+    assert "hidden" in commented
+    assert slice_table_html(html, "missing") is None
+
+
+def test_project_table_columns_keeps_selected_cells_and_flattens_header():
+    html = """
+    <table>
+        <thead>
+            <tr><th colspan="2"></th><th colspan="2">FG% by Distance</th></tr>
+            <tr><th>Rk</th><th>Player</th><th>0-3</th><th>3-10</th></tr>
+        </thead>
+        <tbody>
+            <tr><th>1</th><td>Jayson Tatum</td><td>.650</td><td>.410</td></tr>
+        </tbody>
+    </table>
+    """
+
+    df = pd.read_html(StringIO(project_table_columns(html, [1, 3])))[0]
+
+    assert df.columns.tolist() == ["Player", "3-10"]
+    assert df.iloc[0].tolist() == ["Jayson Tatum", 0.41]
+
+
+def test_find_table_html_slice_matches_full_page():
+    html = (FIXTURES_DIR / "player_contracts.html").read_text(encoding="utf-8")
+
+    expected = pd.read_html(StringIO(html))[0]
+    result = pd.read_html(StringIO(find_table_html(html, "player-contracts")))[0]
+
+    pd.testing.assert_frame_equal(result, expected)
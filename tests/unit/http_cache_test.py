@@ -0,0 +1,107 @@
+import pandas as pd
+import pytest
+
+from src.http_cache import (
+    ValidatorCache,
+    configure_validator_cache,
+    is_unchanged,
+    skip_parse_if_unchanged,
+)
+
+URL = "https://www.basketball-reference.com/leagues/NBA_2026_advanced.html"
+
+
+def _mock_response(mocker, status_code: int, body: bytes = b"", headers=None):
+    response = mocker.MagicMock()
+    response.status_code = status_code
+    response.ok = status_code < 400
+    response.url = URL
+    response.iter_content.return_value = [body]
+    response.raw.tell.return_value = len(body)
+    response.headers = headers or {}
+    return response
+
+
+@pytest.fixture
+def validator_cache(tmp_path):
+    yield configure_validator_cache(tmp_path)
+    configure_validator_cache(None)
+
+
+def test_validator_cache_sends_stored_validators_and_reads_body_on_304(
+    mocker, tmp_path
+):
+    mock_get = mocker.patch(
+        "src.http_client.HttpClient.get",
+        return_value=_mock_response(
+            mocker,
+            200,
+            b"<table></table>",
+            {"ETag": '"abc"', "Last-Modified": "Sat, 17 Oct 2026 05:00:00 GMT"},
+        ),
+    )
+    first_cache = ValidatorCache(tmp_path)
+    first = first_cache.fetch(URL)
+    first_cache.commit()
+
+    mock_get.return_value = _mock_response(mocker, 304)
+    second = ValidatorCache(tmp_path).fetch(URL)
+
+    assert not first.not_modified
+    assert second.not_modified
+    assert second.html == "<table></table>"
+    assert mock_get.call_args.kwargs["headers"] == {
+        "If-None-Match": '"abc"',
+        "If-Modified-Since": "Sat, 17 Oct 2026 05:00:00 GMT",
+    }
+
+
+def test_skip_parse_if_unchanged_reuses_previous_frame_on_304(mocker, validator_cache):
+    mock_get = mocker.patch(
+        "src.http_client.HttpClient.get",
+        return_value=_mock_response(mocker, 200, b"<table></table>", {"ETag": '"a"'}),
+    )
+    scraper = mocker.MagicMock(return_value=pd.DataFrame({"player": ["Jayson Tatum"]}))
+    scraper.__name__ = "scraper"
+    wrapped = skip_parse_if_unchanged(url=lambda: URL)(scraper)
+
+    first = wrapped()
+    validator_cache.commit()
+    validator_cache.clear()
+    mock_get.return_value = _mock_response(mocker, 304)
+    second = wrapped()
+
+    assert scraper.call_count == 1
+    assert not is_unchanged(first)
+    assert is_unchanged(second)
+    assert second["player"].tolist() == ["Jayson Tatum"]
+
+
+def test_skip_parse_if_unchanged_is_a_passthrough_without_a_cache(mocker):
+    mock_get = mocker.patch("src.http_client.HttpClient.get")
+    scraper = mocker.MagicMock(return_value=pd.DataFrame({"player": ["Jayson Tatum"]}))
+    scraper.__name__ = "scraper"
+
+    result = skip_parse_if_unchanged(url=lambda: URL)(scraper)()
+
+    assert not is_unchanged(result)
+    mock_get.assert_not_called()
+
+
+def test_validator_cache_only_persists_after_commit(mocker, validator_cache):
+    mock_get = mocker.patch(
+        "src.http_client.HttpClient.get",
+        return_value=_mock_response(mocker, 200, b"<table></table>", {"ETag": '"a"'}),
+    )
+    scraper = mocker.MagicMock(return_value=pd.DataFrame({"player": ["Jayson Tatum"]}))
+    scraper.__name__ = "scraper"
+    wrapped = skip_parse_if_unchanged(url=lambda: URL)(scraper)
+
+    # the run fails before its load, so nothing is committed
+    wrapped()
+    validator_cache.clear()
+    wrapped()
+
+    assert list(validator_cache.cache_dir.iterdir()) == []
+    assert "If-None-Match" not in mock_get.call_args.kwargs["headers"]
+    assert scraper.call_count == 2
@@ -0,0 +1,134 @@
+import gzip
+import io
+
+import brotli
+import pytest
+import requests
+from urllib3.response import HTTPResponse
+
+from src.http_client import DEFAULT_USER_AGENT, HttpClient
+
+URL = "https://www.basketball-reference.com/leagues/NBA_2026.html"
+
+
+def _mock_response(mocker, status_code: int, headers=None):
+    response = mocker.MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    return response
+
+
+def test_http_client_retries_transient_failures_on_get(mocker):
+    mock_sleep = mocker.patch("src.http_client.time.sleep")
+    client = HttpClient(max_retries=3, host_rate_limits={})
+    mock_request = mocker.patch.object(
+        client.session,
+        "request",
+        side_effect=[
+            requests.ConnectionError("connection reset"),
+            _mock_response(mocker, 503),
+            _mock_response(mocker, 200),
+        ],
+    )
+
+    response = client.get(URL)
+
+    assert response.status_code == 200
+    assert mock_request.call_count == 3
+    assert mock_sleep.call_count == 2
+    assert mock_request.call_args.kwargs["timeout"] == client.timeout
+
+
+def test_http_client_returns_last_response_once_retries_run_out(mocker):
+    mocker.patch("src.http_client.time.sleep")
+    client = HttpClient(max_retries=1, host_rate_limits={})
+    mocker.patch.object(
+        client.session, "request", return_value=_mock_response(mocker, 429)
+    )
+
+    assert client.get(URL).status_code == 429
+
+
+def test_http_client_does_not_retry_posts(mocker):
+    client = HttpClient(max_retries=3)
+    mock_request = mocker.patch.object(
+        client.session, "request", side_effect=requests.Timeout("timed out")
+    )
+
+    with pytest.raises(requests.Timeout):
+        client.post("https://hooks.slack.com/services/test", data="{}")
+
+    mock_request.assert_called_once()
+
+
+def test_http_client_pauses_the_host_bucket_on_retry_after(mocker):
+    mocker.patch("src.http_client.time.sleep")
+    client = HttpClient(max_retries=1)
+    rate_limiter = client.rate_limiters["www.basketball-reference.com"]
+    mock_acquire = mocker.patch.object(rate_limiter, "acquire", return_value=0.0)
+    mock_pause = mocker.patch.object(rate_limiter, "pause")
+    mocker.patch.object(
+        client.session,
+        "request",
+        side_effect=[
+            _mock_response(mocker, 429, {"Retry-After": "60"}),
+            _mock_response(mocker, 200),
+        ],
+    )
+
+    response = client.get(URL)
+
+    assert response.status_code == 200
+    assert mock_acquire.call_count == 2
+    mock_pause.assert_called_once_with(60.0)
+
+
+def test_http_client_sends_urllib_user_agent():
+    client = HttpClient()
+
+    assert client.session.headers["User-Agent"] == DEFAULT_USER_AGENT
+    assert DEFAULT_USER_AGENT.startswith("Python-urllib/")
+
+
+@pytest.mark.parametrize(
+    ("content_encoding", "compress"),
+    [("gzip", gzip.compress), ("br", brotli.compress)],
+)
+def test_http_client_decodes_compressed_bodies_and_records_byte_counts(
+    content_encoding, compress
+):
+    html = b"<table>" + b"<tr><td>Jayson Tatum</td></tr>" * 1_000 + b"</table>"
+    compressed = compress(html)
+    response = requests.Response()
+    response.status_code = 200
+    response.url = URL
+    response.headers["Content-Encoding"] = content_encoding
+    response.raw = HTTPResponse(
+        body=io.BytesIO(compressed),
+        headers={"Content-Encoding": content_encoding},
+        status=200,
+        preload_content=False,
+        decode_content=True,
+    )
+    client = HttpClient()
+
+    body = client.read_body(response)
+
+    assert body == html
+    assert client.transfers[-1].content_encoding == content_encoding
+    assert client.transfers[-1].wire_bytes == len(compressed)
+    assert client.transfers[-1].decoded_bytes == len(html)
+    assert client.transfer_summary()["www.basketball-reference.com"] == {
+        "requests": 1,
+        "wire_bytes": len(compressed),
+        "decoded_bytes": len(html),
+    }
+
+
+def test_http_client_asks_for_compressed_responses():
+    client = HttpClient()
+
+    accept_encoding = client.session.headers["Accept-Encoding"]
+
+    assert "gzip" in accept_encoding
+    assert "br" in accept_encoding
@@ -0,0 +1,75 @@
+import threading
+
+import pytest
+
+from src.page_cache import PageCache, fetch_html, page_cache
+
+
+def test_page_cache_loads_every_time_outside_run_scope(mocker):
+    cache = PageCache()
+    loader = mocker.MagicMock(return_value="html")
+
+    cache.get_or_load("url", loader)
+    cache.get_or_load("url", loader)
+
+    assert loader.call_count == 2
+
+
+def test_page_cache_collapses_concurrent_requests_into_one_load():
+    cache = PageCache()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def loader():
+        calls.append(1)
+        started.set()
+        release.wait(timeout=5)
+        return "html"
+
+    results = []
+    with cache.run_scope():
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(cache.get_or_load("url", loader))
+            )
+            for _ in range(5)
+        ]
+        threads[0].start()
+        started.wait(timeout=5)
+        for thread in threads[1:]:
+            thread.start()
+        release.set()
+        for thread in threads:
+            thread.join(timeout=5)
+
+    assert len(calls) == 1
+    assert results == ["html"] * 5
+
+
+def test_page_cache_does_not_cache_failures(mocker):
+    cache = PageCache()
+    loader = mocker.MagicMock(side_effect=[Exception("blocked"), "html"])
+
+    with cache.run_scope():
+        with pytest.raises(Exception, match="blocked"):
+            cache.get_or_load("url", loader)
+        assert cache.get_or_load("url", loader) == "html"
+        assert cache.get_or_load("url", loader) == "html"
+
+    assert loader.call_count == 2
+
+
+def test_fetch_html_downloads_a_page_once_per_run_scope(mocker):
+    get_text = mocker.patch(
+        "src.http_client.HttpClient.get_text", return_value="<html></html>"
+    )
+    url = "https://www.basketball-reference.com/leagues/NBA_2026.html"
+
+    with page_cache.run_scope():
+        first = fetch_html(url)
+        second = fetch_html(url)
+
+    get_text.assert_called_once()
+    assert first == second == "<html></html>"
+    assert not page_cache.enabled
@@ -0,0 +1,67 @@
+from datetime import date
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from src.parse_pool import (
+    _frame_from_arrow,
+    _frame_to_arrow,
+    _parse_in_worker,
+    configure_parse_pool,
+    run_parser,
+)
+from src.scrapers import parse_boxscores
+
+FIXTURES_DIR = Path(__file__).parent.parent / "fixtures"
+
+
+@pytest.fixture
+def parse_pool():
+    pool = configure_parse_pool(1)
+    yield pool
+    configure_parse_pool(None)
+
+
+def test_arrow_round_trip_keeps_values_and_dtypes():
+    df = pd.DataFrame(
+        {
+            "player": ["Jayson Tatum", None],
+            "pts": [30, 25],
+            "fg_pct": [0.5, float("nan")],
+            "date": pd.to_datetime(["2025-06-22", "2025-06-22"]),
+            "scrape_date": [date(2025, 6, 23), date(2025, 6, 23)],
+        }
+    )
+
+    result = _frame_from_arrow(_frame_to_arrow(df))
+
+    pd.testing.assert_frame_equal(result, df)
+
+
+def test_parse_in_worker_falls_back_to_the_frame_for_duplicate_columns():
+    def parser(page):
+        return pd.DataFrame([[page, page]], columns=pd.Index(["a", "a"]))
+
+    result = _parse_in_worker(parser, "x", {})
+
+    assert isinstance(result, pd.DataFrame)
+
+
+def test_run_parser_without_a_pool_parses_inline(mocker):
+    parser = mocker.Mock(return_value=pd.DataFrame({"a": [1]}))
+
+    result = run_parser(parser, "<html></html>", game_date="2025-06-22")
+
+    parser.assert_called_once_with("<html></html>", game_date="2025-06-22")
+    assert result["a"].tolist() == [1]
+
+
+def test_run_parser_in_pool_matches_inline_parse(parse_pool):
+    html = (FIXTURES_DIR / "boxscores_html.html").read_bytes()
+    expected = parse_boxscores(html, game_date="2025-06-22")
+
+    result = run_parser(parse_boxscores, html, game_date="2025-06-22")
+
+    pd.testing.assert_frame_equal(result, expected)
+    assert parse_pool.start() is parse_pool.start()
@@ -0,0 +1,81 @@
+import pandas as pd
+import pytest
+
+from src.player_names import (
+    PlayerNameCache,
+    configure_player_name_cache,
+    normalize_player_names,
+)
+from src.utils import clean_player_names
+
+NAMES = pd.Series(
+    [
+        "Nikola Jokić",
+        "Robert Williams III",
+        "Kelly Oubre Jr.",
+        None,
+        "Gary Payton II",
+        "Nikola Jokić",
+        "Luka Dončić",
+    ],
+    index=[10, 11, 12, 13, 14, 15, 16],
+)
+
+
+@pytest.fixture
+def player_name_cache():
+    cache = configure_player_name_cache(None)
+    yield cache
+    configure_player_name_cache(None)
+
+
+def test_normalize_player_names_matches_the_old_string_chain(player_name_cache):
+    ascii_names = (
+        NAMES.str.normalize("NFKD")
+        .str.encode("ascii", errors="ignore")
+        .str.decode("utf-8")
+    )
+    expected = ascii_names.map(clean_player_names, na_action="ignore")
+
+    result = normalize_player_names(NAMES)
+
+    pd.testing.assert_series_equal(result, expected)
+    pd.testing.assert_series_equal(
+        normalize_player_names(NAMES, strip_suffixes=False), ascii_names
+    )
+
+
+def test_normalize_player_names_only_normalizes_new_names(mocker, player_name_cache):
+    to_ascii = mocker.spy(pd.Series.str, "normalize")
+
+    normalize_player_names(NAMES)
+    normalize_player_names(NAMES.iloc[:3])
+    normalize_player_names(pd.Series(["Nikola Jokić", "Alperen Şengün"]))
+
+    assert to_ascii.call_count == 2
+    # 5 distinct names from NAMES + Alperen Sengun
+    assert len(player_name_cache) == 6
+
+
+def test_player_name_cache_persists_between_runs(tmp_path):
+    path = tmp_path / "player_names.json"
+    cache = PlayerNameCache(path)
+    cache.normalize(NAMES)
+    cache.save()
+
+    reloaded = PlayerNameCache(path)
+
+    assert len(reloaded) == len(cache) == 5
+    assert reloaded.normalize(pd.Series(["Luka Dončić"])).tolist() == ["Luka Doncic"]
+    assert reloaded.normalize(NAMES, strip_suffixes=False).iloc[1] == (
+        "Robert Williams III"
+    )
+
+
+def test_player_name_cache_ignores_an_unreadable_file(tmp_path):
+    path = tmp_path / "player_names.json"
+    path.write_text("not json")
+
+    cache = PlayerNameCache(path)
+
+    assert len(cache) == 0
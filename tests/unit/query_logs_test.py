@@ -10,3 +10,21 @@ def test_query_logs():
     assert "Reddit Comment Extraction Failed" in logs[0]
     assert "S3 Storage Function Failed" in logs[2]
     assert len(logs) == 3
+
+
+def test_query_logs_drops_failures_caused_by_an_open_circuit(tmp_path):
+    log_file = tmp_path / "example.log"
+    log_file.write_text(
+        "[ERROR] Requests to www.basketball-reference.com Failed 3 times in a "
+        "row, skipping the host for 300 seconds, status code 429\n"
+        "[ERROR] Player Advanced Stats Function Failed, https://www.basketball-"
+        "reference.com/leagues/NBA_2026_advanced.html skipped bc the circuit is "
+        "open for www.basketball-reference.com, retrying the host in 299 seconds\n"
+        "[ERROR] Reddit Comment Extraction Failed for url abc, 500\n"
+    )
+
+    logs = query_logs(log_file=log_file)
+
+    assert len(logs) == 2
+    assert "Requests to www.basketball-reference.com Failed" in logs[0]
+    assert "Reddit Comment Extraction Failed" in logs[1]
@@ -0,0 +1,86 @@
+import threading
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+
+import pytest
+
+from src.rate_limit import HostRateLimit, TokenBucket, parse_retry_after
+
+
+class FakeClock:
+    """Monotonic clock that only moves when something sleeps on it."""
+
+    def __init__(self):
+        """Start the clock at 0."""
+        self.now = 0.0
+        self.lock = threading.Lock()
+
+    def __call__(self):
+        """Return the current fake time."""
+        return self.now
+
+    def sleep(self, seconds):
+        """Move the clock forward instead of sleeping."""
+        with self.lock:
+            self.now += seconds
+
+
+def test_token_bucket_allows_burst_then_spaces_requests_at_the_rate():
+    clock = FakeClock()
+    bucket = TokenBucket(
+        HostRateLimit(requests_per_minute=30, burst=2),
+        clock=clock,
+        sleep=lambda _: None,
+    )
+
+    waits = [bucket.acquire() for _ in range(4)]
+
+    # reservations queue up, so the 3rd + 4th caller wait 1 + 2 token intervals
+    assert waits == pytest.approx([0, 0, 2, 4])
+
+
+def test_token_bucket_never_exceeds_rate_plus_burst_in_a_minute():
+    clock = FakeClock()
+    bucket = TokenBucket(
+        HostRateLimit(requests_per_minute=18, burst=2), clock=clock, sleep=clock.sleep
+    )
+
+    request_times = []
+    while clock.now < 300:
+        bucket.acquire()
+        request_times.append(clock.now)
+
+    for start in request_times:
+        in_window = [t for t in request_times if start <= t < start + 60]
+        assert len(in_window) <= 20
+
+
+def test_token_bucket_pause_holds_callers_until_retry_after_passes():
+    clock = FakeClock()
+    bucket = TokenBucket(
+        HostRateLimit(requests_per_minute=60, burst=5), clock=clock, sleep=clock.sleep
+    )
+
+    bucket.pause(30)
+
+    assert bucket.acquire() == pytest.approx(30)
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        (None, None),
+        ("120", 120.0),
+        ("not a date", None),
+    ],
+)
+def test_parse_retry_after(value, expected):
+    assert parse_retry_after(value) == expected
+
+
+def test_parse_retry_after_http_date():
+    retry_at = datetime.now(UTC) + timedelta(seconds=90)
+
+    seconds = parse_retry_after(format_datetime(retry_at, usegmt=True))
+
+    assert seconds == pytest.approx(90, abs=2)
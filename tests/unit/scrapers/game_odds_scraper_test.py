@@ -1,5 +1,35 @@
+import pickle
+from datetime import date, datetime
+from pathlib import Path
+
+from src.html_archive import HtmlArchive, configure_html_archive
+from src.scrapers import ODDS_URL, get_odds_data
+
+FIXTURES_DIR = Path(__file__).parent.parent.parent / "fixtures"
+
+
 def test_game_odds_data(odds_data):
     expected_columns = ["team", "spread", "total", "moneyline", "date", "datetime1"]
 
     assert list(odds_data.columns) == expected_columns
     assert len(odds_data) == 4
+
+
+def test_game_odds_data_replayed_as_of_a_past_date(mocker, tmp_path):
+    with (FIXTURES_DIR / "odds_data.pkl").open("rb") as fp:
+        odds_tables = pickle.load(fp)
+    archive = HtmlArchive(tmp_path)
+    archive.save(ODDS_URL, "<html></html>", fetched_at=datetime(2025, 1, 15, 9))
+    configure_html_archive(tmp_path, replay=True, as_of=date(2025, 1, 15))
+    get_text = mocker.patch("src.http_client.HttpClient.get_text")
+    mocker.patch("src.scrapers._find_covers_sportsbook_column_index", return_value=2)
+    mocker.patch("src.scrapers.pd.read_html", return_value=odds_tables)
+
+    try:
+        odds = get_odds_data()
+    finally:
+        configure_html_archive(None)
+
+    get_text.assert_not_called()
+    assert odds["date"].unique().tolist() == [date(2025, 1, 15)]
+    assert (odds["datetime1"].dt.date == date(2025, 1, 15)).all()
@@ -1,7 +1,5 @@
-from email.message import Message
-from urllib.error import HTTPError
-
 import pandas as pd
+import requests
 
 from src.scrapers import get_schedule_data
 
@@ -28,13 +26,10 @@ def test_league_schedule_skips_missing_month_page(mocker):
             "Home/Neutral": ["New York Knicks"],
         }
     )
-    missing_month = HTTPError(
-        url="https://www.basketball-reference.com/leagues/NBA_2026_games-june.html",
-        code=404,
-        msg="Not Found",
-        hdrs=Message(),
-        fp=None,
-    )
+    missing_response = requests.Response()
+    missing_response.status_code = 404
+    missing_month = requests.HTTPError("404 Not Found", response=missing_response)
+    mocker.patch("src.http_client.HttpClient.get_text", return_value="<html></html>")
     mocker.patch(
         "src.scrapers.pd.read_html",
         side_effect=[[schedule_month], missing_month],
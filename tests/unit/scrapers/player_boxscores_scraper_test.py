@@ -1,3 +1,13 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from src.scrapers import parse_boxscores
+
+FIXTURES_DIR = Path(__file__).parent.parent.parent / "fixtures"
+
+
 def test_boxscores_data(boxscores_data):
     expected_columns = [
         "player",
@@ -31,3 +41,19 @@ def test_boxscores_data(boxscores_data):
     ]
     assert list(boxscores_data.columns) == expected_columns
     assert len(boxscores_data) == 145
+
+
+def test_parse_boxscores_reads_page_bytes_without_network():
+    html = (FIXTURES_DIR / "boxscores_html.html").read_bytes()
+
+    df = parse_boxscores(html, game_date="2025-06-22")
+
+    assert len(df) == 145
+    assert (df["date"] == pd.Timestamp("2025-06-22")).all()
+
+
+def test_parse_boxscores_raises_index_error_when_no_games():
+    html = (FIXTURES_DIR / "boxscores_no_data.html").read_bytes()
+
+    with pytest.raises(IndexError):
+        parse_boxscores(html, game_date="2025-06-22")
@@ -1,3 +1,10 @@
+from pathlib import Path
+
+from src.scrapers import parse_player_contracts
+
+FIXTURES_DIR = Path(__file__).parent.parent.parent / "fixtures"
+
+
 def test_player_contracts_data(player_contracts_data):
     expected_columns = ["player", "season", "season_salary"]
 
@@ -20,3 +27,13 @@ def test_player_contracts_data_failure(mocker):
     result = get_player_contracts_data()
 
     assert result.empty
+
+
+def test_parse_player_contracts_reads_page_bytes_without_network():
+    html = (FIXTURES_DIR / "player_contracts.html").read_bytes()
+
+    df = parse_player_contracts(html)
+
+    assert list(df.columns) == ["player", "season", "season_salary"]
+    assert df["season_salary"].dtype.name == "int64"
+    assert not df["player"].duplicated().any()
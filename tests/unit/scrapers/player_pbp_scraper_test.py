@@ -1,3 +1,11 @@
+import pickle
+from pathlib import Path
+
+import pandas as pd
+
+from src.scrapers import get_pbp_data
+
+
 def test_player_pbp_data(pbp_transformed_data):
     expected_columns = [
         "timequarter",
@@ -18,3 +26,119 @@ def test_player_pbp_data(pbp_transformed_data):
 
     assert list(pbp_transformed_data.columns) == expected_columns
     assert len(pbp_transformed_data) == 100
+
+
+def test_player_pbp_data_keeps_other_games_when_one_fails(mocker, mock_logging):
+    boxscores_df = pd.DataFrame(
+        {
+            "team": ["GSW", "BOS", "NYK", "MIA"],
+            "location": ["A", "H", "A", "H"],
+            "opponent": ["BOS", "GSW", "MIA", "NYK"],
+            "date": pd.to_datetime(["2022-06-16"] * 4),
+        }
+    )
+    fname = Path(__file__).parent / "../../fixtures/pbp_data.pickle"
+    with fname.open("rb") as fp:
+        pbp_tables = pickle.load(fp)
+
+    def get_text(self, url, **kwargs):
+        if "BOS" in url:
+            raise Exception("HTTP Error 429: Too Many Requests")
+        return "<html></html>"
+
+    mocker.patch("src.http_client.HttpClient.get_text", get_text)
+    mocker.patch(
+        "src.scrapers.pd.read_html",
+        side_effect=lambda html: [table.copy() for table in pbp_tables],
+    )
+
+    pbp_data = get_pbp_data(df=boxscores_df, max_workers=2)
+
+    assert len(pbp_data) == 100
+    assert set(pbp_data["hometeam"]) == {"MIA"}
+    assert "PBP Game Failed for BOS" in mock_logging.text
+
+
+def test_player_pbp_data_labels_every_overtime(mocker):
+    boxscores_df = pd.DataFrame(
+        {
+            "team": ["GSW", "BOS"],
+            "location": ["A", "H"],
+            "opponent": ["BOS", "GSW"],
+            "date": pd.to_datetime(["2022-06-16"] * 2),
+        }
+    )
+    fname = Path(__file__).parent / "../../fixtures/pbp_data.pickle"
+    with fname.open("rb") as fp:
+        pbp_table = pickle.load(fp)[0]
+
+    overtimes = []
+    for ordinal in ["1st", "2nd", "3rd", "4th", "5th"]:
+        overtimes += [
+            [f"{ordinal} OT"] * 6,
+            ["5:00.0"] + [f"Start of {ordinal} overtime"] * 5,
+            ["4:10.0", "Make", "+2", f"{100 + len(overtimes)}-99", None, None],
+        ]
+    pbp_table = pd.concat(
+        [pbp_table, pd.DataFrame(overtimes, columns=pbp_table.columns)],
+        ignore_index=True,
+    )
+
+    mocker.patch("src.http_client.HttpClient.get_text", return_value="<html></html>")
+    mocker.patch("src.scrapers.pd.read_html", return_value=[pbp_table])
+
+    pbp_data = get_pbp_data(df=boxscores_df)
+
+    overtime_plays = pbp_data.tail(10)
+    assert overtime_plays["numberperiod"].drop_duplicates().tolist() == [
+        "1st OT",
+        "2nd OT",
+        "3rd OT",
+        "4th OT",
+        "5th OT",
+    ]
+    assert not overtime_plays["timequarter"].str.endswith("OT").any()
+    assert pbp_data["scoreaway"].iloc[-1] == 112
+    assert pbp_data["marginscore"].iloc[-1] == -13
+    assert pbp_data.groupby("numberperiod").size()["1st Quarter"] > 0
+
+
+def test_player_pbp_data_fetches_every_date_in_one_batch(mocker):
+    boxscores_df = pd.DataFrame(
+        {
+            "team": ["GSW", "BOS", "BOS", "PHX"],
+            "location": ["A", "H", "A", "H"],
+            "opponent": ["BOS", "GSW", "PHX", "BOS"],
+            "date": pd.to_datetime(["2022-06-16"] * 2 + ["2022-06-18"] * 2),
+        }
+    )
+    fname = Path(__file__).parent / "../../fixtures/pbp_data.pickle"
+    with fname.open("rb") as fp:
+        pbp_tables = pickle.load(fp)
+
+    urls = []
+
+    def get_text(self, url, **kwargs):
+        urls.append(url)
+        return "<html></html>"
+
+    mocker.patch("src.http_client.HttpClient.get_text", get_text)
+    mocker.patch(
+        "src.scrapers.pd.read_html",
+        side_effect=lambda html: [table.copy() for table in pbp_tables],
+    )
+
+    pbp_data = get_pbp_data(df=boxscores_df)
+    games = pbp_data.groupby(["date", "hometeam", "awayteam"]).size()
+
+    assert sorted(urls) == [
+        "https://www.basketball-reference.com/boxscores/pbp/202206160BOS.html",
+        "https://www.basketball-reference.com/boxscores/pbp/202206180PHO.html",
+    ]
+    assert games.to_dict() == {
+        (pd.Timestamp("2022-06-16"), "BOS", "GSW"): 100,
+        (pd.Timestamp("2022-06-18"), "PHX", "BOS"): 100,
+    }
+    # each game's score starts from 0 instead of the previous game's final score
+    first_plays = pbp_data.groupby("date").head(1)
+    assert first_plays["scoreaway"].tolist() == [0, 0]
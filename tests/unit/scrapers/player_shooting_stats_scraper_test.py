@@ -1,28 +1,63 @@
+from io import StringIO
+from pathlib import Path
+
+import pandas as pd
+
+from src.player_names import normalize_player_names
+from src.scrapers import SHOOTING_STATS_COLUMNS, parse_shooting_stats
+
+FIXTURES_DIR = Path(__file__).parent.parent.parent / "fixtures"
+
+EXPECTED_COLUMNS = [
+    "player",
+    "avg_shot_distance",
+    "pct_fga_2p",
+    "pct_fga_0_3",
+    "pct_fga_3_10",
+    "pct_fga_10_16",
+    "pct_fga_16_3p",
+    "pct_fga_3p",
+    "fg_pct_0_3",
+    "fg_pct_3_10",
+    "fg_pct_10_16",
+    "fg_pct_16_3p",
+    "pct_2pfg_ast",
+    "pct_3pfg_ast",
+    "dunk_pct_tot_fg",
+    "dunks",
+    "corner_3_ast_pct",
+    "corner_3pm_pct",
+    "heaves_att",
+    "heaves_makes",
+    "scrape_date",
+    "scrape_ts",
+]
+
+
 def test_player_shooting_stats_data(shooting_stats_data):
-    expected_columns = [
-        "player",
-        "avg_shot_distance",
-        "pct_fga_2p",
-        "pct_fga_0_3",
-        "pct_fga_3_10",
-        "pct_fga_10_16",
-        "pct_fga_16_3p",
-        "pct_fga_3p",
-        "fg_pct_0_3",
-        "fg_pct_3_10",
-        "fg_pct_10_16",
-        "fg_pct_16_3p",
-        "pct_2pfg_ast",
-        "pct_3pfg_ast",
-        "dunk_pct_tot_fg",
-        "dunks",
-        "corner_3_ast_pct",
-        "corner_3pm_pct",
-        "heaves_att",
-        "heaves_makes",
-        "scrape_date",
-        "scrape_ts",
-    ]
-
-    assert list(shooting_stats_data.columns) == expected_columns
+    assert list(shooting_stats_data.columns) == EXPECTED_COLUMNS
     assert len(shooting_stats_data) == 474
+
+
+def test_parse_shooting_stats_on_saved_page():
+    html = (FIXTURES_DIR / "shooting_stats.html").read_bytes()
+    # the whole table w/ its 2 row header, the way the scraper used to read it
+    full = pd.read_html(StringIO(html.decode("utf-8")))[0]
+    expected = full.iloc[:, list(SHOOTING_STATS_COLUMNS)].copy()
+    expected.columns = list(SHOOTING_STATS_COLUMNS.values())
+    expected["player"] = normalize_player_names(expected["player"])
+
+    df = parse_shooting_stats(html)
+
+    assert list(df.columns) == EXPECTED_COLUMNS
+    assert len(df) == 20
+    edwards = df.set_index("player").loc["Anthony Edwards"]
+    assert edwards["pct_fga_2p"] == 0.463
+    assert edwards["fg_pct_0_3"] == 0.66
+    assert edwards["dunks"] == 8
+    assert edwards["heaves_att"] == 2
+    assert "Luka Doncic" in df["player"].tolist()
+    pd.testing.assert_frame_equal(
+        df.drop(columns=["scrape_date", "scrape_ts"]),
+        expected.sort_values("player").drop(columns="mp").reset_index(drop=True),
+    )
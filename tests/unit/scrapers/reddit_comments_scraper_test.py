@@ -1,3 +1,8 @@
+from types import SimpleNamespace
+
+from src.scrapers import _wait_for_reddit_rate_limit, get_reddit_comments
+
+
 def test_reddit_comments_data(reddit_comments_data):
     expected_columns = [
         "author",
@@ -19,3 +24,48 @@ def test_reddit_comments_data(reddit_comments_data):
 
     assert list(reddit_comments_data.columns) == expected_columns
     assert len(reddit_comments_data) == 998
+
+
+def test_reddit_comments_keeps_other_urls_when_one_fails(mocker, mock_logging):
+    def submission(url):
+        if url == "broken":
+            raise Exception("503 Server Error")
+
+        comment = SimpleNamespace(
+            author="jyablonski",
+            body=f"great game in {url}",
+            score=5,
+            author_flair_css_class="Celtics1",
+            author_flair_text="Celtics",
+            edited=False,
+        )
+        return mocker.MagicMock(**{"comments.list.return_value": [comment, comment]})
+
+    reddit = mocker.patch("src.scrapers.praw.Reddit").return_value
+    reddit.submission.side_effect = submission
+
+    df = get_reddit_comments(urls=["post1", "broken", "post2"], max_workers=2)
+
+    assert sorted(df["url"]) == ["post1", "post2"]
+    assert "Reddit Comment Extraction Failed for url broken" in mock_logging.text
+
+
+def test_wait_for_reddit_rate_limit_sleeps_until_reset(mocker):
+    mocker.patch("src.scrapers.time.time", return_value=100.0)
+    sleep = mocker.patch("src.scrapers.time.sleep")
+    reddit = mocker.MagicMock()
+    reddit.auth.limits = {"remaining": 2.0, "reset_timestamp": 130.0, "used": 598}
+
+    _wait_for_reddit_rate_limit(reddit)
+
+    sleep.assert_called_once_with(30.0)
+
+
+def test_wait_for_reddit_rate_limit_skips_when_under_limit(mocker):
+    sleep = mocker.patch("src.scrapers.time.sleep")
+    reddit = mocker.MagicMock()
+    reddit.auth.limits = {"remaining": 500.0, "reset_timestamp": 130.0, "used": 100}
+
+    _wait_for_reddit_rate_limit(reddit)
+
+    sleep.assert_not_called()
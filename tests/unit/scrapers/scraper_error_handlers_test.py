@@ -17,8 +17,8 @@ from src.scrapers import (
 @pytest.mark.parametrize(
     "scraper,patch_target",
     [
-        (get_player_stats_data, "src.scrapers.urllib.request.urlopen"),
-        (get_boxscores_data, "src.scrapers.urllib.request.urlopen"),
+        (get_player_stats_data, "src.http_client.HttpClient.get_text"),
+        (get_boxscores_data, "src.http_client.HttpClient.get_text"),
         (get_opp_stats_data, "src.scrapers.pd.read_html"),
         (get_injuries_data, "src.scrapers.pd.read_html"),
         (get_player_adv_stats_data, "src.scrapers.pd.read_html"),
@@ -28,6 +28,7 @@ from src.scrapers import (
     ],
 )
 def test_scraper_returns_empty_dataframe_on_failure(mocker, scraper, patch_target):
+    mocker.patch("src.http_client.HttpClient.get_text", return_value="<html></html>")
     mocker.patch(patch_target, side_effect=Exception("scrape failed"))
 
     result = scraper()
@@ -37,11 +38,10 @@ def test_scraper_returns_empty_dataframe_on_failure(mocker, scraper, patch_targe
 
 
 def test_transactions_returns_empty_when_page_index_missing(mocker):
-    mock_response = mocker.MagicMock()
-    mock_response.read.return_value = b"<html><body></body></html>"
-    mock_response.__enter__.return_value = mock_response
-    mock_response.__exit__.return_value = None
-    mocker.patch("urllib.request.urlopen", return_value=mock_response)
+    mocker.patch(
+        "src.http_client.HttpClient.get_text",
+        return_value="<html><body></body></html>",
+    )
 
     result = get_transactions_data()
 
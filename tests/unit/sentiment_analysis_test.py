@@ -1,7 +1,14 @@
+from concurrent.futures import ProcessPoolExecutor
+
 import pandas as pd
 import pytest
 
-from src.utils import add_sentiment_analysis
+from src.utils import (
+    _clear_sentiment_memo,
+    _sentiment_memo,
+    add_sentiment_analysis,
+    score_sentiment_batch,
+)
 
 
 def test_add_sentiment_analysis(add_sentiment_analysis_df):
@@ -16,3 +23,50 @@ def test_add_sentiment_analysis(add_sentiment_analysis_df):
 def test_add_sentiment_analysis_raises_on_invalid_column():
     with pytest.raises(Exception):
         add_sentiment_analysis(pd.DataFrame({"comment": [1, 2, 3]}), "comment")
+
+
+def test_score_sentiment_batch_scores_each_distinct_text_once(mocker):
+    _clear_sentiment_memo()
+    analyzer = mocker.patch("src.utils._get_sentiment_analyzer").return_value
+    analyzer.polarity_scores.return_value = {
+        "compound": 0.5,
+        "neg": 0.0,
+        "neu": 0.5,
+        "pos": 0.5,
+    }
+
+    scores = score_sentiment_batch(["nice", "nice", "bad", "nice"])
+    score_sentiment_batch(["bad"])
+
+    assert scores == [(0.5, 0.0, 0.5, 0.5)] * 4
+    assert analyzer.polarity_scores.call_count == 2
+    _clear_sentiment_memo()
+
+
+def test_score_sentiment_batch_process_pool_matches_inline(mocker):
+    mocker.patch("src.utils.SENTIMENT_PROCESS_POOL_MIN_ROWS", 2)
+    pool = mocker.patch("src.utils.ProcessPoolExecutor", wraps=ProcessPoolExecutor)
+    texts = ["what a game", "terrible refs", "what a game", "ok", "refs were fine"]
+
+    _clear_sentiment_memo()
+    pooled = score_sentiment_batch(texts, n_jobs=2)
+    # the workers' scores land in the memo, so this batch doesn't start a pool
+    assert score_sentiment_batch(texts, n_jobs=2) == pooled
+    assert set(_sentiment_memo) == set(texts)
+
+    _clear_sentiment_memo()
+    inline = score_sentiment_batch(texts)
+
+    assert pool.call_count == 1
+    assert pooled == inline
+    _clear_sentiment_memo()
+
+
+def test_score_sentiment_batch_bounds_the_memo(mocker):
+    mocker.patch("src.utils.SENTIMENT_CACHE_SIZE", 2)
+    _clear_sentiment_memo()
+
+    score_sentiment_batch(["a", "b", "c"])
+
+    assert list(_sentiment_memo) == ["b", "c"]
+    _clear_sentiment_memo()
@@ -6,7 +6,7 @@ from src.utils import write_to_slack
 def test_write_to_slack_errors(mocker):
     errors = {"odds": "IndexError", "boxscores": "NoGameDateError"}
 
-    mocker.patch("src.utils.requests.post").return_value.status_code = 200
+    mocker.patch("src.http_client.HttpClient.post").return_value.status_code = 200
     response = write_to_slack(errors)
 
     assert response == 200
@@ -21,7 +21,9 @@ def test_write_to_slack_no_errors():
 
 
 def test_write_to_slack_handles_request_error(mocker):
-    mocker.patch("src.utils.requests.post", side_effect=Exception("slack unavailable"))
+    mocker.patch(
+        "src.http_client.HttpClient.post", side_effect=Exception("slack unavailable")
+    )
 
     with pytest.raises(Exception, match="slack unavailable"):
         write_to_slack(["boxscores failed"])